@@ -1,7 +1,10 @@
-from typing import Annotated
+import asyncio
+from functools import lru_cache
+from typing import Annotated, Optional
 
 from app.core.schemas.user_schemas import UserOutputSchema
 from app.core.services.agent_service import AgentService
+from app.core.services.archive_service import ArchiveService
 from app.core.services.auth_service import AuthService
 from app.core.services.committed_price_service import CommittedPricesService
 from app.core.services.distribution_config_service import DistributionConfigsService
@@ -14,23 +17,39 @@ from app.core.services.real_estate_object_service import RealEstateObjectService
 from app.core.services.sales_service import SalesService
 from app.core.services.scoring_calculation_service import ScoringCalculationService
 from app.core.services.status_mapping_service import StatusMappingService
+from app.core.services.upload_job_service import UploadJobService
 from app.core.services.user_service import UserService
+from app.core.utils.agent_limiter import AgentConcurrencyLimiter
+from app.core.utils.file_executor import FileProcessingExecutor
 from app.infrastructure.agents.agent_manager import AgentManager
+from app.infrastructure.agents.image_preprocessor import PillowImagePreprocessor
 from app.infrastructure.excel.excel_processor import ExcelProcessor
+from app.infrastructure.file_processing.csv_processor import CsvProcessor
+from app.infrastructure.file_processing.parquet_processor import ParquetProcessor
+from app.infrastructure.file_processing.registry import FileProcessorRegistry
 from app.infrastructure.repositories.api_key_repository import ApiKeyRepository
+from app.infrastructure.repositories.archive_repository import ArchiveRepository
 from app.infrastructure.repositories.committed_prices_repository import CommittedPricesRepository
+from app.infrastructure.repositories.committed_snapshot_repository import CommittedSnapshotRepository
 from app.infrastructure.repositories.distribution_configs_repository import DistributionConfigsRepository
 from app.infrastructure.repositories.income_plans_repository import IncomePlanRepository
 from app.infrastructure.repositories.layout_type_attachment_repository import PremisesAttachmentRepository
 from app.infrastructure.repositories.premises_repository import PremisesRepository
 from app.infrastructure.repositories.pricing_config_repository import PricingConfigRepository
 from app.infrastructure.repositories.real_estate_object_repository import RealEstateObjectRepository
+from app.infrastructure.repositories.reo_summary_repository import ReoSummaryRepository
 from app.infrastructure.repositories.sales_repository import SalesRepository
 from app.infrastructure.repositories.status_mapping_repository import StatusMappingRepository
+from app.infrastructure.repositories.upload_job_repository import UploadJobRepository
 from app.infrastructure.repositories.user_repository import UserRepository
-from app.settings import AgentConfig, settings
+from app.infrastructure.storage.disk_agent_response_cache import DiskAgentResponseCache
+from app.infrastructure.storage.local_attachment_storage import LocalAttachmentStorage
+from app.infrastructure.storage.local_export_cache import LocalExportCache
+from app.infrastructure.storage.local_upload_staging import LocalUploadStaging
+from app.settings import AgentConfig, ArchiveSettings, FileProcessingSettings, UploadJobSettings, settings
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from loguru import logger
 
 http_bearer = HTTPBearer()
 
@@ -70,10 +89,22 @@ def get_commited_repository() -> CommittedPricesRepository:
     return CommittedPricesRepository()
 
 
+def get_committed_snapshot_repository() -> CommittedSnapshotRepository:
+    return CommittedSnapshotRepository()
+
+
+def get_export_cache() -> LocalExportCache:
+    return LocalExportCache(root_dir=settings.storage.EXPORT_CACHE_DIR)
+
+
 def get_commited_service(
     repository: CommittedPricesRepository = Depends(get_commited_repository),
+    snapshot_repository: CommittedSnapshotRepository = Depends(get_committed_snapshot_repository),
+    export_cache: LocalExportCache = Depends(get_export_cache),
 ) -> CommittedPricesService:
-    return CommittedPricesService(repository=repository)
+    return CommittedPricesService(
+        repository=repository, snapshot_repository=snapshot_repository, export_cache=export_cache
+    )
 
 
 def get_distribution_config_repository() -> DistributionConfigsRepository:
@@ -90,10 +121,15 @@ def get_real_estate_object_repository() -> RealEstateObjectRepository:
     return RealEstateObjectRepository()
 
 
+def get_reo_summary_repository() -> ReoSummaryRepository:
+    return ReoSummaryRepository()
+
+
 def get_real_estate_object_service(
     repository: RealEstateObjectRepository = Depends(get_real_estate_object_repository),
+    summary_repository: ReoSummaryRepository = Depends(get_reo_summary_repository),
 ) -> RealEstateObjectService:
-    return RealEstateObjectService(repository=repository)
+    return RealEstateObjectService(repository=repository, summary_repository=summary_repository)
 
 
 def get_income_plan_repository() -> IncomePlanRepository:
@@ -144,20 +180,45 @@ def get_pricing_config_repository() -> PricingConfigRepository:
 
 def get_pricing_config_service(
     repository: PricingConfigRepository = Depends(get_pricing_config_repository),
+    summary_repository: ReoSummaryRepository = Depends(get_reo_summary_repository),
 ) -> PricingConfigService:
-    return PricingConfigService(repository=repository)
+    return PricingConfigService(repository=repository, summary_repository=summary_repository)
 
 
-def get_excel_processor() -> ExcelProcessor:
-    return ExcelProcessor()
+def get_file_processor() -> FileProcessorRegistry:
+    # Uploads are read in any supported format, exports are always Excel
+    return FileProcessorRegistry(
+        processors=[ExcelProcessor(), CsvProcessor(), ParquetProcessor()], writer=ExcelProcessor()
+    )
+
+
+def get_attachment_storage() -> LocalAttachmentStorage:
+    return LocalAttachmentStorage(root_dir=settings.storage.ATTACHMENTS_DIR)
+
+
+def get_file_processing_config() -> FileProcessingSettings:
+    return settings.file_processing
+
+
+@lru_cache
+def get_file_processing_executor() -> FileProcessingExecutor:
+    # One pool per process, shared by all requests
+    config = settings.file_processing
+    return FileProcessingExecutor(
+        max_workers=config.WORKERS, max_pending=config.MAX_PENDING, queue_timeout=config.QUEUE_TIMEOUT_SECONDS
+    )
 
 
 def get_file_processing_service(
-    file_processor: ExcelProcessor = Depends(get_excel_processor),
+    file_processor: FileProcessorRegistry = Depends(get_file_processor),
     distribution_repository: DistributionConfigsRepository = Depends(get_distribution_config_repository),
     reo_repository: RealEstateObjectRepository = Depends(get_real_estate_object_repository),
     premises_repository: PremisesRepository = Depends(get_premises_repository),
     committed_prices_repository: CommittedPricesRepository = Depends(get_commited_repository),
+    committed_snapshot_repository: CommittedSnapshotRepository = Depends(get_committed_snapshot_repository),
+    config: FileProcessingSettings = Depends(get_file_processing_config),
+    executor: FileProcessingExecutor = Depends(get_file_processing_executor),
+    export_cache: LocalExportCache = Depends(get_export_cache),
 ) -> FileProcessingService:
     return FileProcessingService(
         file_processor=file_processor,
@@ -165,6 +226,10 @@ def get_file_processing_service(
         reo_repository=reo_repository,
         premises_repository=premises_repository,
         committed_prices_repository=committed_prices_repository,
+        committed_snapshot_repository=committed_snapshot_repository,
+        config=config,
+        executor=executor,
+        export_cache=export_cache,
     )
 
 
@@ -181,28 +246,93 @@ def get_agent_config() -> AgentConfig:
     return settings.agent
 
 
-def get_agent_manager(config: AgentConfig = Depends(get_agent_config)) -> AgentManager:
-    return AgentManager(config=config)
+@lru_cache
+def get_agent_manager() -> AgentManager:
+    # One manager per process: its agents share one LLM client and its HTTP connection pool
+    # Provider file ids of uploaded PDFs are kept in the agent response cache when it is enabled
+    return AgentManager(config=get_agent_config(), file_cache=get_agent_response_cache())
+
+
+@lru_cache
+def get_agent_limiter() -> AgentConcurrencyLimiter:
+    # Limits are per process, shared by all requests and background tasks
+    config = settings.agent
+    return AgentConcurrencyLimiter(
+        max_concurrency=config.MAX_CONCURRENCY,
+        max_per_key=config.MAX_CONCURRENCY_PER_USER,
+        queue_timeout=config.QUEUE_TIMEOUT_SECONDS,
+    )
+
+
+@lru_cache
+def get_agent_response_cache() -> Optional[DiskAgentResponseCache]:
+    # One cache handle per process; None when GPT_CACHE_ENABLED is off
+    config = settings.agent
+    if not config.CACHE_ENABLED:
+        return None
+    return DiskAgentResponseCache(
+        directory=settings.storage.AGENT_CACHE_DIR,
+        ttl_seconds=config.CACHE_TTL_SECONDS,
+        size_limit=config.CACHE_SIZE_LIMIT,
+    )
 
 
 agent_manager_deps = Annotated[AgentManager, Depends(get_agent_manager)]
 
 
+@lru_cache
+def get_image_preprocessor() -> Optional[PillowImagePreprocessor]:
+    # None when GPT_IMAGE_PREPROCESSING_ENABLED is off or Pillow is missing from the environment: images are sent as stored
+    config = settings.agent
+    if not config.IMAGE_PREPROCESSING_ENABLED:
+        return None
+    if not PillowImagePreprocessor.available():
+        logger.warning("Pillow is not installed, images are sent to agents without preprocessing")
+        return None
+    return PillowImagePreprocessor(max_edge=config.IMAGE_MAX_EDGE, quality=config.IMAGE_QUALITY)
+
+
 def get_agent_service(
     agent_manager: AgentManager = Depends(get_agent_manager),
     real_estate_object_service: RealEstateObjectService = Depends(get_real_estate_object_service),
     pricing_config_service: PricingConfigService = Depends(get_pricing_config_service),
+    attachment_storage: LocalAttachmentStorage = Depends(get_attachment_storage),
+    limiter: AgentConcurrencyLimiter = Depends(get_agent_limiter),
+    response_cache: Optional[DiskAgentResponseCache] = Depends(get_agent_response_cache),
+    image_preprocessor: Optional[PillowImagePreprocessor] = Depends(get_image_preprocessor),
 ) -> AgentService:
     return AgentService(
         agent_manager=agent_manager,
         real_estate_object_service=real_estate_object_service,
         pricing_config_service=pricing_config_service,
+        attachment_storage=attachment_storage,
+        limiter=limiter,
+        response_cache=response_cache,
+        image_preprocessor=image_preprocessor,
     )
 
 
 agent_service_deps = Annotated[AgentService, Depends(get_agent_service)]
 
 
+def get_archive_repository() -> ArchiveRepository:
+    return ArchiveRepository()
+
+
+def get_archive_config() -> ArchiveSettings:
+    return settings.archive
+
+
+def get_archive_service(
+    repository: ArchiveRepository = Depends(get_archive_repository),
+    config: ArchiveSettings = Depends(get_archive_config),
+) -> ArchiveService:
+    return ArchiveService(repository=repository, config=config)
+
+
+archive_service_deps = Annotated[ArchiveService, Depends(get_archive_service)]
+
+
 committed_service_deps = Annotated[CommittedPricesService, Depends(get_commited_service)]
 distribution_config_service_deps = Annotated[DistributionConfigsService, Depends(get_distribution_config_service)]
 file_processing_service_deps = Annotated[FileProcessingService, Depends(get_file_processing_service)]
@@ -217,11 +347,88 @@ def get_layout_type_attachment_repository() -> PremisesAttachmentRepository:
 
 def get_layout_type_attachment_service(
     repository: PremisesAttachmentRepository = Depends(get_layout_type_attachment_repository),
+    storage: LocalAttachmentStorage = Depends(get_attachment_storage),
 ) -> PremisesAttachmentService:
-    return PremisesAttachmentService(repository=repository)
+    return PremisesAttachmentService(repository=repository, storage=storage)
 
 
 layout_type_attachment_service_deps = Annotated[PremisesAttachmentService, Depends(get_layout_type_attachment_service)]
+
+
+def get_upload_job_repository() -> UploadJobRepository:
+    return UploadJobRepository()
+
+
+def get_upload_staging() -> LocalUploadStaging:
+    return LocalUploadStaging(root_dir=settings.storage.UPLOAD_STAGING_DIR)
+
+
+def get_upload_job_config() -> UploadJobSettings:
+    return settings.upload_jobs
+
+
+@lru_cache
+def get_upload_job_wakeup() -> asyncio.Event:
+    # Shared by the request handlers that queue jobs and the background worker of this process
+    return asyncio.Event()
+
+
+def get_upload_job_service(
+    repository: UploadJobRepository = Depends(get_upload_job_repository),
+    reo_repository: RealEstateObjectRepository = Depends(get_real_estate_object_repository),
+    staging: LocalUploadStaging = Depends(get_upload_staging),
+    file_processing_service: FileProcessingService = Depends(get_file_processing_service),
+    income_plan_service: IncomePlanService = Depends(get_income_plan_service),
+    distribution_config_service: DistributionConfigsService = Depends(get_distribution_config_service),
+    pricing_config_service: PricingConfigService = Depends(get_pricing_config_service),
+    config: UploadJobSettings = Depends(get_upload_job_config),
+    wakeup: asyncio.Event = Depends(get_upload_job_wakeup),
+) -> UploadJobService:
+    return UploadJobService(
+        repository=repository,
+        reo_repository=reo_repository,
+        staging=staging,
+        file_processing_service=file_processing_service,
+        income_plan_service=income_plan_service,
+        distribution_config_service=distribution_config_service,
+        pricing_config_service=pricing_config_service,
+        config=config,
+        wakeup=wakeup,
+    )
+
+
+def build_upload_job_worker() -> UploadJobService:
+    """Upload job service for the background worker, wired outside of a request."""
+    reo_repository = get_real_estate_object_repository()
+    file_processing_service = get_file_processing_service(
+        file_processor=get_file_processor(),
+        distribution_repository=get_distribution_config_repository(),
+        reo_repository=reo_repository,
+        premises_repository=get_premises_repository(),
+        committed_prices_repository=get_commited_repository(),
+        committed_snapshot_repository=get_committed_snapshot_repository(),
+        config=get_file_processing_config(),
+        executor=get_file_processing_executor(),
+        export_cache=get_export_cache(),
+    )
+    return get_upload_job_service(
+        repository=get_upload_job_repository(),
+        reo_repository=reo_repository,
+        staging=get_upload_staging(),
+        file_processing_service=file_processing_service,
+        income_plan_service=get_income_plan_service(
+            repository=get_income_plan_repository(), reo_repository=reo_repository
+        ),
+        distribution_config_service=get_distribution_config_service(repository=get_distribution_config_repository()),
+        pricing_config_service=get_pricing_config_service(
+            repository=get_pricing_config_repository(), summary_repository=get_reo_summary_repository()
+        ),
+        config=get_upload_job_config(),
+        wakeup=get_upload_job_wakeup(),
+    )
+
+
+upload_job_service_deps = Annotated[UploadJobService, Depends(get_upload_job_service)]
 status_mapping_service_deps = Annotated[StatusMappingService, Depends(get_status_mapping_service)]
 sales_service_deps = Annotated[SalesService, Depends(get_sales_service)]
 pricing_config_service_deps = Annotated[PricingConfigService, Depends(get_pricing_config_service)]
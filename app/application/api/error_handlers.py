@@ -1,3 +1,5 @@
+import math
+
 from app.core import exceptions
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
@@ -27,6 +29,10 @@ def handle_missing_required_columns(_: Request, e: exceptions.MissingRequiredCol
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+def handle_validation_exception(_: Request, e: exceptions.ValidationException) -> JSONResponse:
+    return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
 def handle_data_validation_exception(_: Request, e: exceptions.DataValidationException) -> JSONResponse:
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
@@ -35,12 +41,38 @@ def handle_duplicate_premises_exception(_: Request, e: exceptions.DuplicatePremi
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_409_CONFLICT)
 
 
+def handle_file_processing_busy(_: Request, e: exceptions.FileProcessingBusyException) -> JSONResponse:
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(math.ceil(e.retry_after))},
+    )
+
+
 def handle_file_processing_exception(_: Request, e: exceptions.FileProcessingException) -> JSONResponse:
     return JSONResponse(
         content={"message": f"File processing error: {str(e)}"}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
 
 
+def handle_invalid_cursor(_: Request, e: exceptions.InvalidCursorException) -> JSONResponse:
+    return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
+
+
+def handle_upload_job_conflict(_: Request, e: exceptions.UploadJobConflictException) -> JSONResponse:
+    return JSONResponse(
+        content={"message": str(e), "received_size": e.received_size}, status_code=status.HTTP_409_CONFLICT
+    )
+
+
+def handle_pricing_config_conflict(_: Request, e: exceptions.PricingConfigConflictException) -> JSONResponse:
+    return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_409_CONFLICT)
+
+
+def handle_committed_snapshot_integrity(_: Request, e: exceptions.CommittedSnapshotIntegrityException) -> JSONResponse:
+    return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 def handle_invalid_credentials(_: Request, e: exceptions.InvalidCredentials) -> JSONResponse:
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_401_UNAUTHORIZED)
 
@@ -51,3 +83,11 @@ def handle_agent_not_found(_: Request, e: exceptions.AgentNotFound) -> JSONRespo
 
 def handle_agent_execution_error(_: Request, e: exceptions.AgentExecutionError) -> JSONResponse:
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def handle_agent_busy(_: Request, e: exceptions.AgentBusyException) -> JSONResponse:
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(math.ceil(e.retry_after))},
+    )
@@ -1,9 +1,11 @@
 from app.application.api.v1.agents import router as agents_router
 from app.application.api.v1.api_key import router as api_router
+from app.application.api.v1.archive import router as archive_router
 from app.application.api.v1.auth import router as auth_router
 from app.application.api.v1.calculations import router as calculations_router
 from app.application.api.v1.committed_prices import router as committed_prices_router
 from app.application.api.v1.distribution_configs import router as distribution_configs_router
+from app.application.api.v1.file_processing import router as file_processing_router
 from app.application.api.v1.income_plans import router as income_plans_router
 from app.application.api.v1.premises import router as premises_router
 from app.application.api.v1.pricing_configs import router as pricing_configs_router
@@ -28,3 +30,5 @@ routers.include_router(committed_prices_router, prefix="/committed-prices", tags
 routers.include_router(income_plans_router, prefix="/income-plans", tags=["Income Plans"])
 routers.include_router(status_mappings_router, prefix="/status-mappings", tags=["Status Mappings"])
 routers.include_router(agents_router, prefix="/agents", tags=["Agents"])
+routers.include_router(archive_router, prefix="/archive", tags=["Archive"])
+routers.include_router(file_processing_router, prefix="/file-processing", tags=["File Processing"])
@@ -1,9 +1,15 @@
+from typing import Annotated
+
 from app.application.api.depends import agent_service_deps, current_user_deps
-from fastapi import APIRouter, BackgroundTasks
+from app.core.schemas.agents_schemas import EvaluatorsRunRequest, EvaluatorsRunResponse
+from fastapi import APIRouter, BackgroundTasks, Query
 from starlette import status
 
 router = APIRouter()
 
+# false - вызвать LLM заново, даже если ответ на те же входные данные уже сохранен, и обновить сохраненный ответ
+UseCacheQuery = Annotated[bool, Query(description="Вернуть сохраненный ответ агента при тех же входных данных")]
+
 
 @router.post("/best-flat-label/{reo_id}", status_code=status.HTTP_200_OK)
 async def best_flat_label(
@@ -11,12 +17,15 @@ async def best_flat_label(
     background_tasks: BackgroundTasks,
     agent_service: agent_service_deps,
     current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для определения лучшего номера квартиры и сохраняет результат в PricingConfig
 
     """
-    background_tasks.add_task(agent_service.run_best_flat_label_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_best_flat_label_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
@@ -26,12 +35,15 @@ async def best_floor(
     background_tasks: BackgroundTasks,
     agent_service: agent_service_deps,
     current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для определения лучшего этажа и сохраняет результат в PricingConfig
 
     """
-    background_tasks.add_task(agent_service.run_best_floor_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_best_floor_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
@@ -41,63 +53,112 @@ async def translate_images(
     background_tasks: BackgroundTasks,
     agent_service: agent_service_deps,
     current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для перевода текста на изображениях
     """
-    background_tasks.add_task(agent_service.run_layout_evaluator_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_layout_evaluator_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
 @router.post("/window-view-evaluator/{reo_id}", status_code=status.HTTP_200_OK)
 async def window_view_evaluator(
-    reo_id: int, background_tasks: BackgroundTasks, agent_service: agent_service_deps, current_user: current_user_deps
+    reo_id: int,
+    background_tasks: BackgroundTasks,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для оценки вида из окна
     """
-    background_tasks.add_task(agent_service.run_window_view_evaluator_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_window_view_evaluator_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
 @router.post("/total_area-evaluator/{reo_id}", status_code=status.HTTP_200_OK)
 async def total_area_evaluator(
-    reo_id: int, background_tasks: BackgroundTasks, agent_service: agent_service_deps, current_user: current_user_deps
+    reo_id: int,
+    background_tasks: BackgroundTasks,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для оценки общей площади
     """
-    background_tasks.add_task(agent_service.run_total_area_evaluator_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_total_area_evaluator_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
 @router.post("/best-entrance/{reo_id}", status_code=status.HTTP_200_OK)
 async def best_entrance_evaluator(
-    reo_id: int, background_tasks: BackgroundTasks, agent_service: agent_service_deps, current_user: current_user_deps
+    reo_id: int,
+    background_tasks: BackgroundTasks,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для определения лучшего подъезда и сохраняет результат в PricingConfig
 
     """
-    background_tasks.add_task(agent_service.run_best_entrance_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_best_entrance_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
 @router.post("/room-quantity-evaluator/{reo_id}", status_code=status.HTTP_200_OK)
 async def room_quantity_evaluator(
-    reo_id: int, background_tasks: BackgroundTasks, agent_service: agent_service_deps, current_user: current_user_deps
+    reo_id: int,
+    background_tasks: BackgroundTasks,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
-    background_tasks.add_task(agent_service.run_room_quantity_evaluator_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_room_quantity_evaluator_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
 
 
 @router.post("/weighted-factors/{reo_id}", status_code=status.HTTP_200_OK)
 async def weighted_factors(
-    reo_id: int, background_tasks: BackgroundTasks, agent_service: agent_service_deps, current_user: current_user_deps
+    reo_id: int,
+    background_tasks: BackgroundTasks,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+    use_cache: UseCacheQuery = True,
 ) -> dict:
     """
     Запускает агента для определения взвешенных факторов и сохраняет результат в PricingConfig
 
     """
-    background_tasks.add_task(agent_service.run_weighted_factors_agent, reo_id=reo_id, user=current_user)
+    background_tasks.add_task(
+        agent_service.run_weighted_factors_agent, reo_id=reo_id, user=current_user, use_cache=use_cache
+    )
     return {"status": "processing"}
+
+
+@router.post("/run-all/{reo_id}", status_code=status.HTTP_200_OK)
+async def run_all_evaluators(
+    reo_id: int,
+    data: EvaluatorsRunRequest,
+    agent_service: agent_service_deps,
+    current_user: current_user_deps,
+) -> EvaluatorsRunResponse:
+    """
+    Запускает выбранных агентов-оценщиков (по умолчанию всех) одновременно, сохраняет их результаты
+    в PricingConfig одной записью и возвращает статус и время выполнения каждого агента
+    """
+    return await agent_service.run_evaluators(
+        reo_id=reo_id, user=current_user, agents=data.agents, use_cache=data.use_cache
+    )
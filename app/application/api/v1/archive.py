@@ -0,0 +1,35 @@
+from typing import Annotated, Optional
+
+from app.application.api.depends import archive_service_deps, current_user_deps
+from app.core.schemas.archive_schemas import (
+    ArchivedRecordFilter,
+    ArchivedRecordResponse,
+    ArchiveRestoreRequest,
+    ArchiveRestoreResponse,
+)
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
+from fastapi import APIRouter, Depends, Query
+
+router = APIRouter()
+
+
+@router.get("/", response_model=CursorPage[ArchivedRecordResponse])
+async def get_archived_records(
+    filters: Annotated[ArchivedRecordFilter, Depends()],
+    archive_service: archive_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[ArchivedRecordResponse]:
+    records = await archive_service.get_all_archived_records(
+        user=current_user, filters=filters, cursor=cursor, limit=limit
+    )
+    return records
+
+
+@router.post("/restore", response_model=ArchiveRestoreResponse)
+async def restore_archived_records(
+    request: ArchiveRestoreRequest, archive_service: archive_service_deps, current_user: current_user_deps
+) -> ArchiveRestoreResponse:
+    restored = await archive_service.restore(user=current_user, data=request)
+    return restored
@@ -1,8 +1,16 @@
-from typing import List
+from typing import Annotated, Optional
 
 from app.application.api.depends import committed_service_deps, current_user_deps
-from app.core.schemas.committed_price_schemas import BulkCommittedPricesCreate, CommittedPricesResponse
-from fastapi import APIRouter
+from app.core.schemas.calculation_schemas import CommittedPremiseWithCalculation
+from app.core.schemas.committed_price_schemas import (
+    BulkCommittedPricesCreate,
+    CommittedPremisePriceResponse,
+    CommittedPricesFilter,
+    CommittedPricesResponse,
+    CommittedSnapshotResponse,
+)
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
+from fastapi import APIRouter, Depends, Query
 
 router = APIRouter()
 
@@ -15,6 +23,30 @@ async def create_committed_price(
     return price
 
 
+@router.post("/snapshots", response_model=CommittedSnapshotResponse)
+async def create_committed_snapshot(
+    request: BulkCommittedPricesCreate, committed_service: committed_service_deps, _: current_user_deps
+) -> CommittedSnapshotResponse:
+    snapshot = await committed_service.create_committed_snapshot(data=request)
+    return snapshot
+
+
+@router.get("/snapshots/{id}", response_model=CommittedSnapshotResponse)
+async def get_committed_snapshot(
+    id: int, committed_service: committed_service_deps, _: current_user_deps
+) -> CommittedSnapshotResponse:
+    snapshot = await committed_service.get_committed_snapshot(id=id)
+    return snapshot
+
+
+@router.get("/snapshots/{id}/premises", response_model=list[CommittedPremiseWithCalculation])
+async def get_committed_snapshot_premises(
+    id: int, committed_service: committed_service_deps, _: current_user_deps
+) -> list[CommittedPremiseWithCalculation]:
+    premises = await committed_service.get_committed_snapshot_premises(id=id)
+    return premises
+
+
 @router.get("/{id}", response_model=CommittedPricesResponse)
 async def get_committed_price(
     id: int, committed_service: committed_service_deps, _: current_user_deps
@@ -23,9 +55,31 @@ async def get_committed_price(
     return price
 
 
-@router.get("/", response_model=List[CommittedPricesResponse])
+@router.get(
+    "/{reo_id}/{distribution_config_id}/actual-prices-per-sqm", response_model=list[CommittedPremisePriceResponse]
+)
+async def get_actual_prices_per_sqm(
+    reo_id: int,
+    distribution_config_id: int,
+    committed_service: committed_service_deps,
+    _: current_user_deps,
+    premise_ids: Annotated[Optional[list[int]], Query()] = None,
+) -> list[CommittedPremisePriceResponse]:
+    prices = await committed_service.get_actual_prices_per_sqm(
+        reo_id=reo_id, distribution_config_id=distribution_config_id, premise_ids=premise_ids
+    )
+    return prices
+
+
+@router.get("/", response_model=CursorPage[CommittedPricesResponse])
 async def get_all_committed_prices(
-    committed_service: committed_service_deps, _: current_user_deps
-) -> List[CommittedPricesResponse]:
-    prices = await committed_service.get_all_committed_prices()
+    filters: Annotated[CommittedPricesFilter, Depends()],
+    committed_service: committed_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[CommittedPricesResponse]:
+    prices = await committed_service.get_all_committed_prices(
+        user=current_user, filters=filters, cursor=cursor, limit=limit
+    )
     return prices
@@ -0,0 +1,12 @@
+from app.application.api.depends import current_user_deps, file_processing_service_deps
+from app.core.schemas.file_processing_schemas import FileProcessingMetricsResponse
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_model=FileProcessingMetricsResponse)
+async def get_file_processing_metrics(
+    file_processing_service: file_processing_service_deps, _: current_user_deps
+) -> FileProcessingMetricsResponse:
+    return file_processing_service.get_metrics()
@@ -1,11 +1,15 @@
+from typing import Annotated, Optional
+
 from app.application.api.depends import current_user_deps, file_processing_service_deps, income_plan_service_deps
 from app.core.schemas.income_plan_schemas import (
     BulkIncomePlanCreate,
     IncomePlanCreate,
+    IncomePlanFilter,
     IncomePlanResponse,
     IncomePlanUpdate,
 )
-from fastapi import APIRouter, UploadFile
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
+from fastapi import APIRouter, Depends, Query, UploadFile
 from starlette import status
 
 router = APIRouter()
@@ -23,18 +27,12 @@ async def upload_income_plan_specification(
     file_content = await file.read()
 
     # Process file using service layer
-    income_plan_data = await file_processing_service.process_income_plan(
-        file_content=file_content, filename=file.filename or "unknown"
+    rows = await file_processing_service.process_income_plan(
+        file_content=file_content, filename=file.filename or "unknown", reo_id=reo_id, content_type=file.content_type
     )
 
-    income_plan_create_list: list[IncomePlanCreate] = []
-    for income_plan in income_plan_data:
-        premise_dict = income_plan.model_dump()
-        premise_dict["reo_id"] = reo_id
-        income_plan_create_list.append(IncomePlanCreate(**premise_dict))
-
-    bulk_request = BulkIncomePlanCreate(plans=income_plan_create_list)
-    plans = await income_plan_service.create_bulk_income_plans(request=bulk_request, user=current_user)
+    # Replace the active plans with one bulk insert, no per-row models
+    plans = await income_plan_service.replace_active_plans(reo_id=reo_id, rows=rows, user=current_user)
     return plans
 
 
@@ -62,11 +60,15 @@ async def get_income_plan(
     return plan
 
 
-@router.get("/", response_model=list[IncomePlanResponse])
+@router.get("/", response_model=CursorPage[IncomePlanResponse])
 async def get_all_income_plans(
-    income_plan_service: income_plan_service_deps, _: current_user_deps
-) -> list[IncomePlanResponse]:
-    plans = await income_plan_service.get_all()
+    filters: Annotated[IncomePlanFilter, Depends()],
+    income_plan_service: income_plan_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[IncomePlanResponse]:
+    plans = await income_plan_service.get_all(user=current_user, filters=filters, cursor=cursor, limit=limit)
     return plans
 
 
@@ -1,4 +1,5 @@
-import base64
+from typing import Annotated, Optional
+from urllib.parse import quote
 
 from app.application.api.depends import (
     current_user_deps,
@@ -9,21 +10,28 @@ from app.application.api.depends import (
     premises_service_deps,
     pricing_config_service_deps,
     real_estate_object_service_deps,
+    upload_job_service_deps,
 )
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
 from app.core.schemas.premise_schemas import (
     BulkPremisesCreateRequest,
     LayoutTypeAttachmentCreate,
     LayoutTypeAttachmentResponse,
     PremisesCreate,
     PremisesFileSpecificationResponse,
+    PremisesFilter,
     PremisesResponse,
     PremisesUpdate,
+    SpecificationUploadResponse,
     WindowViewAttachmentCreate,
     WindowViewAttachmentResponse,
 )
-from fastapi import APIRouter, UploadFile
+from app.core.schemas.upload_job_schemas import UploadJobCreate, UploadJobResponse
+from app.core.utils.enums import ExportFormat
+from fastapi import APIRouter, Depends, Header, Query, Request, UploadFile
 from starlette import status
-from starlette.responses import Response
+from starlette.background import BackgroundTask
+from starlette.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 router = APIRouter()
 
@@ -38,7 +46,7 @@ async def upload_premises_specification(
     income_plan_service: income_plan_service_deps,
     distribution_config_service: distribution_config_service_deps,
     current_user: current_user_deps,
-) -> list[PremisesFileSpecificationResponse]:
+) -> JSONResponse:
     # Получаем active_plans, если они есть (если нет - используем пустой список)
     active_plans = await income_plan_service.get_active_plan_by_reo_id(reo_id=reo_id)
 
@@ -46,27 +54,12 @@ async def upload_premises_specification(
     file_content = await file.read()
 
     # Обрабатываем файл через сервисный слой
-    premises_data = await file_processing_service.process_specification(
-        file_content=file_content, filename=file.filename or "unknown"
+    specification = await file_processing_service.process_specification(
+        file_content=file_content, filename=file.filename or "unknown", reo_id=reo_id, content_type=file.content_type
     )
 
-    await premises_service.check_unique_premises_id(premises=premises_data)
-
-    # Преобразуем данные в PremisesCreate
-    premises_create_list = []
-    for spec in premises_data:
-        spec_dict = spec.model_dump(by_alias=False)
-        # Конвертируем entrance из int в str
-        if isinstance(spec_dict.get("entrance"), int):
-            spec_dict["entrance"] = str(spec_dict["entrance"])
-        # Добавляем reo_id из параметра endpoint
-        spec_dict["reo_id"] = reo_id
-
-        premises_create_list.append(PremisesCreate(**spec_dict))
-
-    # Создаем помещения
-    bulk_request = BulkPremisesCreateRequest(premises=premises_create_list)
-    await premises_service.create_bulk_premises(data=bulk_request, user=current_user)
+    # Заменяем активные помещения одним bulk insert без построчных моделей
+    await premises_service.replace_active_premises(reo_id=reo_id, rows=specification.premises_rows, user=current_user)
 
     # Получаем или создаем базовый distribution config
     distribution_config = await distribution_config_service.get_or_create_base_config()
@@ -74,12 +67,93 @@ async def upload_premises_specification(
     # Синхронизируем pricing config через сервис
     await pricing_config_service.sync_pricing_config_after_premises_upload(
         reo_id=reo_id,
-        premises=premises_create_list,
         active_plans=active_plans,
         distribution_config=distribution_config,
     )
 
-    return premises_data
+    return JSONResponse(content=specification.response_records)
+
+
+@router.post("/upload/specification/{reo_id}/stream", response_model=SpecificationUploadResponse)
+async def upload_premises_specification_stream(
+    reo_id: int,
+    file: UploadFile,
+    file_processing_service: file_processing_service_deps,
+    premises_service: premises_service_deps,
+    pricing_config_service: pricing_config_service_deps,
+    income_plan_service: income_plan_service_deps,
+    distribution_config_service: distribution_config_service_deps,
+    current_user: current_user_deps,
+) -> SpecificationUploadResponse:
+    """
+    Потоковая загрузка больших спецификаций: файл читается пакетами прямо из загруженного файла,
+    каждый пакет проверяется и вставляется сразу, поэтому память не растет с размером файла.
+    Ошибка в любом пакете откатывает всю загрузку. В ответе только количество помещений.
+    """
+    active_plans = await income_plan_service.get_active_plan_by_reo_id(reo_id=reo_id)
+
+    batches = file_processing_service.stream_specification(
+        file=file.file, filename=file.filename or "unknown", reo_id=reo_id, content_type=file.content_type
+    )
+    premises_count = await premises_service.replace_active_premises_in_batches(
+        reo_id=reo_id, batches=batches, user=current_user
+    )
+
+    distribution_config = await distribution_config_service.get_or_create_base_config()
+    await pricing_config_service.sync_pricing_config_after_premises_upload(
+        reo_id=reo_id,
+        active_plans=active_plans,
+        distribution_config=distribution_config,
+    )
+
+    return SpecificationUploadResponse(reo_id=reo_id, premises_count=premises_count)
+
+
+@router.post("/upload/specification/{reo_id}/jobs", response_model=UploadJobResponse)
+async def create_upload_job(
+    reo_id: int, request: UploadJobCreate, upload_job_service: upload_job_service_deps, current_user: current_user_deps
+) -> UploadJobResponse:
+    """
+    Фоновая загрузка спецификации. Файл передается частями через PUT /upload-jobs/{job_id}/chunks,
+    после POST /upload-jobs/{job_id}/complete он разбирается в фоне, а ход обработки и ошибки строк
+    доступны в GET /upload-jobs/{job_id}. Активные помещения заменяются, только если ошибок нет.
+    """
+    job = await upload_job_service.create_job(reo_id=reo_id, data=request, user=current_user)
+    return job
+
+
+@router.put("/upload-jobs/{job_id}/chunks", response_model=UploadJobResponse)
+async def upload_job_chunk(
+    job_id: int,
+    request: Request,
+    upload_job_service: upload_job_service_deps,
+    current_user: current_user_deps,
+    offset: Annotated[int, Query(ge=0)],
+) -> UploadJobResponse:
+    """
+    Тело запроса - очередная часть файла. offset должен равняться received_size задачи; при расхождении
+    ответ 409 содержит received_size, с которого нужно продолжить.
+    """
+    job = await upload_job_service.upload_chunk(
+        job_id=job_id, offset=offset, chunks=request.stream(), user=current_user
+    )
+    return job
+
+
+@router.post("/upload-jobs/{job_id}/complete", response_model=UploadJobResponse)
+async def complete_upload_job(
+    job_id: int, upload_job_service: upload_job_service_deps, current_user: current_user_deps
+) -> UploadJobResponse:
+    job = await upload_job_service.complete_upload(job_id=job_id, user=current_user)
+    return job
+
+
+@router.get("/upload-jobs/{job_id}", response_model=UploadJobResponse)
+async def get_upload_job(
+    job_id: int, upload_job_service: upload_job_service_deps, current_user: current_user_deps
+) -> UploadJobResponse:
+    job = await upload_job_service.get_job(job_id=job_id, user=current_user)
+    return job
 
 
 @router.post("/bulk", response_model=list[PremisesResponse])
@@ -104,9 +178,15 @@ async def get_premises(id: int, premises_service: premises_service_deps, _: curr
     return premises
 
 
-@router.get("/", response_model=list[PremisesResponse])
-async def get_all_premises(premises_service: premises_service_deps, _: current_user_deps) -> list[PremisesResponse]:
-    premises = await premises_service.get_all()
+@router.get("/", response_model=CursorPage[PremisesResponse])
+async def get_all_premises(
+    filters: Annotated[PremisesFilter, Depends()],
+    premises_service: premises_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[PremisesResponse]:
+    premises = await premises_service.get_all(user=current_user, filters=filters, cursor=cursor, limit=limit)
     return premises
 
 
@@ -129,30 +209,47 @@ async def download_premises_excel_with_actual_price(
     distribution_config_id: int,
     file_processing_service: file_processing_service_deps,
     # _: current_user_deps,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
+    if_none_match: Optional[str] = Header(None),
 ) -> Response:
     """
-    Download Excel file with premises data and actual_price_per_sqm from committed prices.
+    Download Excel (or CSV) file with premises data and actual_price_per_sqm from committed prices.
+
+    The file is generated once per commit and then served from the export cache.
+    The response carries an ETag of the exported data: a request with a matching If-None-Match gets 304,
+    and Range / If-Range requests get the requested part of the cached file.
 
     Args:
         reo_id: Real estate object ID
         distribution_config_id: Distribution config ID
+        export_format: File format, xlsx by default
 
     Returns:
         Excel file as downloadable response
     """
-    excel_bytes = await file_processing_service.generate_excel_with_actual_price(
-        reo_id=reo_id, distribution_config_id=distribution_config_id
+    key = await file_processing_service.get_export_key(
+        reo_id=reo_id, distribution_config_id=distribution_config_id, export_format=export_format
     )
-
-    return Response(
-        content=excel_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename=premises_with_actual_price_reo_{reo_id}_dist_{distribution_config_id}.xlsx"
-        },
+    headers = {"ETag": key.etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and _etag_matches(if_none_match, key.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    path = await file_processing_service.get_export_file(key)
+    return FileResponse(
+        path,
+        media_type=key.media_type,
+        filename=key.filename,
+        headers=headers,
+        background=BackgroundTask(file_processing_service.release_export_file, path),
     )
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.post("/layout-attachments/{reo_id}/{layout_type}", response_model=LayoutTypeAttachmentResponse)
 async def upload_layout_type_attachment(
     reo_id: int,
@@ -163,26 +260,46 @@ async def upload_layout_type_attachment(
     current_user: current_user_deps,
 ) -> LayoutTypeAttachmentResponse:
 
-    reo = await real_estate_object_service.get_full(id=reo_id, user=current_user)
+    reo = await real_estate_object_service.get(id=reo_id, user=current_user)
 
-    file_content = await file.read()
+    content_hash, file_size = await attachment_service.store_file(file.file)
 
     attachment_data = LayoutTypeAttachmentCreate(
         reo_id=reo.id,
         layout_type=layout_type,
-        base64_file=base64.b64encode(file_content).decode("utf-8"),
+        content_hash=content_hash,
         content_type=file.content_type or "image/jpeg",
         file_name=file.filename or "layout_image",
-        file_size=file.size,
+        file_size=file_size,
     )
 
     attachment = await attachment_service.update_or_create_layout_type(
-        reo_id=reo_id, layout_type=layout_type, data=attachment_data
+        reo_id=reo_id, layout_type=layout_type, data=attachment_data, source=file.file
     )
 
     return attachment
 
 
+@router.get("/layout-attachments/{reo_id}/{layout_type}/file")
+async def download_layout_attachment(
+    reo_id: int,
+    layout_type: str,
+    attachment_service: layout_type_attachment_service_deps,
+    _: current_user_deps,
+) -> StreamingResponse:
+    attachment = await attachment_service.get_layout_type(reo_id=reo_id, layout_type=layout_type)
+
+    return StreamingResponse(
+        attachment_service.iter_file(attachment.content_hash),
+        media_type=attachment.content_type,
+        headers={
+            "Content-Disposition": f"inline; filename*=UTF-8''{quote(attachment.file_name)}",
+            "Content-Length": str(attachment.file_size),
+            "ETag": f'"{attachment.content_hash}"',
+        },
+    )
+
+
 @router.delete("/layout-attachments/{reo_id}/{layout_type}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_layout_attachment(
     reo_id: int,
@@ -204,26 +321,46 @@ async def upload_window_view_attachment(
     current_user: current_user_deps,
 ) -> WindowViewAttachmentResponse:
 
-    reo = await real_estate_object_service.get_full(id=reo_id, user=current_user)
+    reo = await real_estate_object_service.get(id=reo_id, user=current_user)
 
-    file_content = await file.read()
+    content_hash, file_size = await attachment_service.store_file(file.file)
 
     attachment_data = WindowViewAttachmentCreate(
         reo_id=reo.id,
         view_from_window=view_from_window,
-        base64_file=base64.b64encode(file_content).decode("utf-8"),
+        content_hash=content_hash,
         content_type=file.content_type or "image/jpeg",
         file_name=file.filename or "window_view_image",
-        file_size=file.size,
+        file_size=file_size,
     )
 
     attachment = await attachment_service.update_or_create_window_view(
-        reo_id=reo_id, view_from_window=view_from_window, data=attachment_data
+        reo_id=reo_id, view_from_window=view_from_window, data=attachment_data, source=file.file
     )
 
     return attachment
 
 
+@router.get("/window-view-attachments/{reo_id}/{view_from_window}/file")
+async def download_window_view_attachment(
+    reo_id: int,
+    view_from_window: str,
+    attachment_service: layout_type_attachment_service_deps,
+    _: current_user_deps,
+) -> StreamingResponse:
+    attachment = await attachment_service.get_window_view(reo_id=reo_id, view_from_window=view_from_window)
+
+    return StreamingResponse(
+        attachment_service.iter_file(attachment.content_hash),
+        media_type=attachment.content_type,
+        headers={
+            "Content-Disposition": f"inline; filename*=UTF-8''{quote(attachment.file_name)}",
+            "Content-Length": str(attachment.file_size),
+            "ETag": f'"{attachment.content_hash}"',
+        },
+    )
+
+
 @router.delete("/window-view-attachments/{reo_id}/{view_from_window}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_window_view_attachment(
     reo_id: int,
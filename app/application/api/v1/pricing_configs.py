@@ -1,6 +1,14 @@
+from typing import Annotated, Optional
+
 from app.application.api.depends import current_user_deps, pricing_config_service_deps
-from app.core.schemas.pricing_config_schemas import PricingConfigCreate, PricingConfigResponse, PricingConfigUpdate
-from fastapi import APIRouter
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
+from app.core.schemas.pricing_config_schemas import (
+    PricingConfigCreate,
+    PricingConfigFilter,
+    PricingConfigResponse,
+    PricingConfigUpdate,
+)
+from fastapi import APIRouter, Depends, Query
 from starlette import status
 
 router = APIRouter()
@@ -22,11 +30,25 @@ async def get_pricing_config(
     return config
 
 
-@router.get("/", response_model=list[PricingConfigResponse])
+@router.get("/{reo_id}/ranging/{factor}", response_model=dict)
+async def get_pricing_config_ranging(
+    reo_id: int, factor: str, pricing_config_service: pricing_config_service_deps, _: current_user_deps
+) -> dict:
+    ranging = await pricing_config_service.get_ranging_for_factor(reo_id=reo_id, factor=factor)
+    return ranging
+
+
+@router.get("/", response_model=CursorPage[PricingConfigResponse])
 async def get_all_pricing_configs(
-    pricing_config_service: pricing_config_service_deps, _: current_user_deps
-) -> list[PricingConfigResponse]:
-    configs = await pricing_config_service.get_all_pricing_configs()
+    filters: Annotated[PricingConfigFilter, Depends()],
+    pricing_config_service: pricing_config_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[PricingConfigResponse]:
+    configs = await pricing_config_service.get_all_pricing_configs(
+        user=current_user, filters=filters, cursor=cursor, limit=limit
+    )
     return configs
 
 
@@ -1,10 +1,12 @@
 from app.application.api.depends import current_user_deps, real_estate_object_service_deps
 from app.core.schemas.real_estate_object_schemas import (
     RealEstateObjectCreate,
-    RealEstateObjectFullResponse,
+    RealEstateObjectProfileResponse,
     RealEstateObjectResponse,
     RealEstateObjectUpdate,
+    ReoPremisesSummaryResponse,
 )
+from app.core.utils.enums import ReoLoadProfile
 from fastapi import APIRouter
 from starlette import status
 
@@ -21,14 +23,27 @@ async def create_real_estate_object(
     return reo
 
 
-@router.get("/{id}", response_model=RealEstateObjectFullResponse)
+@router.get("/{id}", response_model=RealEstateObjectProfileResponse)
 async def get_real_estate_object(
-    id: int, real_estate_object_service: real_estate_object_service_deps, current_user: current_user_deps
-) -> RealEstateObjectFullResponse:
-    reo = await real_estate_object_service.get_full(id=id, user=current_user)
+    id: int,
+    real_estate_object_service: real_estate_object_service_deps,
+    current_user: current_user_deps,
+    profile: ReoLoadProfile = ReoLoadProfile.FULL,
+) -> RealEstateObjectProfileResponse:
+    reo = await real_estate_object_service.get_profile(id=id, user=current_user, profile=profile)
     return reo
 
 
+@router.get("/{id}/premises-summary", response_model=ReoPremisesSummaryResponse)
+async def get_real_estate_object_premises_summary(
+    id: int,
+    real_estate_object_service: real_estate_object_service_deps,
+    current_user: current_user_deps,
+) -> ReoPremisesSummaryResponse:
+    summary = await real_estate_object_service.get_premises_summary(id=id, user=current_user)
+    return summary
+
+
 @router.get("/", response_model=list[RealEstateObjectResponse])
 async def get_all_real_estate_objects(
     real_estate_object_service: real_estate_object_service_deps, current_user: current_user_deps
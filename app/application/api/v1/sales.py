@@ -1,6 +1,9 @@
+from typing import Annotated, Optional
+
 from app.application.api.depends import current_user_deps, sales_service_deps
-from app.core.schemas.sale_schemas import SalesCreate, SalesResponse, SalesUpdate
-from fastapi import APIRouter
+from app.core.schemas.pagination_schemas import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, CursorPage
+from app.core.schemas.sale_schemas import SalesCreate, SalesFilter, SalesResponse, SalesUpdate
+from fastapi import APIRouter, Depends, Query
 from starlette import status
 
 router = APIRouter()
@@ -18,9 +21,15 @@ async def get_sale(id: int, sales_service: sales_service_deps, _: current_user_d
     return sale
 
 
-@router.get("/", response_model=list[SalesResponse])
-async def get_all_sales(sales_service: sales_service_deps, _: current_user_deps) -> list[SalesResponse]:
-    sales = await sales_service.get_all()
+@router.get("/", response_model=CursorPage[SalesResponse])
+async def get_all_sales(
+    filters: Annotated[SalesFilter, Depends()],
+    sales_service: sales_service_deps,
+    current_user: current_user_deps,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+) -> CursorPage[SalesResponse]:
+    sales = await sales_service.get_all(user=current_user, filters=filters, cursor=cursor, limit=limit)
     return sales
 
 
@@ -1,17 +1,23 @@
 from app.core.exceptions.domain import (
+    AgentBusyException,
     AgentException,
     AgentExecutionError,
     AgentNotFound,
+    CommittedSnapshotIntegrityException,
     DataValidationException,
     DuplicatePremisesIdException,
+    FileProcessingBusyException,
     FileProcessingException,
     FileReadException,
     IncomePlanRequiredException,
     InvalidCredentials,
+    InvalidCursorException,
     InvalidFileFormatException,
     MissingRequiredColumnsException,
     ObjectAlreadyExists,
     ObjectNotFound,
+    PricingConfigConflictException,
+    UploadJobConflictException,
     ValidationException,
 )
 
@@ -28,6 +34,12 @@ __all__ = [
     "AgentException",
     "AgentExecutionError",
     "AgentNotFound",
+    "AgentBusyException",
     "IncomePlanRequiredException",
     "DuplicatePremisesIdException",
+    "InvalidCursorException",
+    "FileProcessingBusyException",
+    "UploadJobConflictException",
+    "PricingConfigConflictException",
+    "CommittedSnapshotIntegrityException",
 ]
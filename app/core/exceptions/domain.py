@@ -73,6 +73,14 @@ class DuplicatePremisesIdException(FileProcessingException):
         super().__init__(message=message)
 
 
+class FileProcessingBusyException(FileProcessingException):
+    """Raised when the file processing executor has no free slot in time"""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__("File processing is busy, please retry later")
+
+
 class AgentException(Exception):
     """Base exception for agent-related errors"""
 
@@ -88,6 +96,14 @@ class AgentNotFound(AgentException):
         super().__init__(message)
 
 
+class AgentBusyException(AgentException):
+    """Raised when an agent run gets no free concurrency slot in time"""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__("Too many agents are running, please retry later")
+
+
 class AgentExecutionError(AgentException):
     """Raised when agent execution fails"""
 
@@ -105,3 +121,38 @@ class ApiKeyAlreadyExists(ObjectAlreadyExists):
 class IncomePlanRequiredException(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class InvalidCursorException(ValidationException):
+    """Raised when pagination cursor cannot be decoded"""
+
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor}")
+
+
+class CommittedSnapshotIntegrityException(Exception):
+    """Raised when a committed snapshot references premises that are no longer stored"""
+
+    def __init__(self, snapshot_id: int, missing_premise_ids: list[int]) -> None:
+        self.snapshot_id = snapshot_id
+        self.missing_premise_ids = missing_premise_ids
+        shown = ", ".join(str(premise_id) for premise_id in missing_premise_ids[:10])
+        if len(missing_premise_ids) > 10:
+            shown += f" and {len(missing_premise_ids) - 10} more"
+        super().__init__(f"Committed snapshot {snapshot_id} references missing premises: {shown}")
+
+
+class PricingConfigConflictException(Exception):
+    """Raised when the active pricing config keeps changing between reading it and patching it"""
+
+    def __init__(self, reo_id: int) -> None:
+        super().__init__(f"Pricing config of real estate object {reo_id} was changed concurrently, retry the request")
+
+
+class UploadJobConflictException(Exception):
+    """Raised when a chunk or a state change does not match the current state of an upload job"""
+
+    def __init__(self, message: str, received_size: int) -> None:
+        self.received_size = received_size
+        super().__init__(message)
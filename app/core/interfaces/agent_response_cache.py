@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class AgentResponseCacheInterface(ABC):
+    """
+    Interface for the cache of structured agent responses.
+
+    A response is identified by a key derived from everything that determines the LLM call:
+    the agent, its prompts, model and temperature, and the content of the attached files.
+    Entries expire after a TTL and the oldest ones are evicted when the cache outgrows its size limit.
+    The same cache also keeps provider file ids of uploaded attachments under their own keys.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[dict]:
+        """Return the cached response, or None on a miss."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, response: dict) -> None:
+        """Store a response, replacing the previous one with the same key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources of the cache."""
+        raise NotImplementedError
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from app.core.schemas.archive_schemas import ArchivedRecordFilter
+from app.core.utils.enums import ArchiveTable
+
+
+class ArchiveRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def archive_inactive(self, table: ArchiveTable, older_than: datetime, limit: int, reo_id: int | None) -> int:
+        """Move up to `limit` inactive rows deactivated before `older_than` (of one REO if given) into the archive."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def restore(self, table: ArchiveTable, record_ids: list[int], user_id: int) -> list[int]:
+        """Move archived rows of the user's REOs back into their table, returning restored IDs."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge(self, older_than: datetime) -> int:
+        """Delete archived rows archived before `older_than`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(
+        self, user_id: int, filters: ArchivedRecordFilter, after_id: int | None, limit: int
+    ) -> list[Any]:
+        """Retrieve a page of the user's archived rows ordered by ID descending."""
+        raise NotImplementedError
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, BinaryIO, Optional
+
+
+class AttachmentStorageInterface(ABC):
+    """
+    Interface for content-addressed attachment storage.
+    Blobs are identified only by the hash of their content, so identical files are stored once.
+    """
+
+    @abstractmethod
+    async def save(self, source: BinaryIO) -> tuple[str, int]:
+        """
+        Stream file content into the storage.
+
+        Args:
+            source: Readable binary file object, read in chunks
+
+        Returns:
+            Tuple of content hash and size in bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read(self, content_hash: str) -> bytes:
+        """Read the whole blob by its content hash."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_chunks(self, content_hash: str) -> AsyncIterator[bytes]:
+        """Iterate over blob content in chunks, without loading it into memory."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def exists(self, content_hash: str) -> bool:
+        """Check whether a blob with the given content hash is stored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_variant(self, content_hash: str, variant: str) -> Optional[bytes]:
+        """Read a derived variant of the blob, e.g. a downsized image, or None if it is not stored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_variant(self, content_hash: str, variant: str, content: bytes) -> None:
+        """Store a derived variant next to the blob, replacing the previous one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, content_hash: str) -> None:
+        """Delete the blob with its derived variants. Missing blobs are ignored."""
+        raise NotImplementedError
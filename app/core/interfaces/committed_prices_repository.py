@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+from app.core.schemas.committed_price_schemas import CommittedPricesFilter
 
 
 class CommittedPricesRepositoryInterface(ABC):
@@ -26,8 +29,35 @@ class CommittedPricesRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all_committed_prices(self) -> list[dict]:
-        """Get all committed price records."""
+    async def get_actual_prices_per_sqm(
+        self, reo_id: int, distribution_config_id: int, premise_ids: list[int] | None
+    ) -> Sequence[Any]:
+        """Get (premise_id, actual_price_per_sqm) pairs of the active snapshot, extracted in the database."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_content_fields(
+        self, reo_id: int, distribution_config_id: int, fields: Sequence[str], after_id: int | None, limit: int
+    ) -> list[dict]:
+        """
+        Get a page of selected top-level content fields plus actual_price_per_sqm of the active rows,
+        ordered by record ID ascending; each row carries its committed_price_id for the next page.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_active_revision(self, reo_id: int, distribution_config_id: int) -> tuple[int, int | None]:
+        """
+        Get the number and the highest ID of the active records; committed rows are never edited,
+        so the pair changes whenever prices are committed or deactivated.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all_committed_prices(
+        self, user_id: int, filters: CommittedPricesFilter, after_id: int | None, limit: int
+    ) -> list[dict]:
+        """Get a page of the user's committed price records ordered by ID descending."""
         raise NotImplementedError
 
     @abstractmethod
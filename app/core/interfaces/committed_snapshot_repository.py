@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+
+class CommittedSnapshotRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def create(self, data: dict) -> Any:
+        """Create a committed snapshot header with its column arrays."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, id: int) -> Any:
+        """Get a committed snapshot by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_active(self, reo_id: int, distribution_config_id: int) -> Any:
+        """Get the active committed snapshot of a REO for a distribution configuration."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_premises(self, premise_ids: list[int]) -> Sequence[Any]:
+        """Get premises referenced by a snapshot."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def deactivate_active_snapshots(self, reo_id: int) -> None:
+        """Deactivate existing committed snapshots for a given REO ID."""
+        raise NotImplementedError
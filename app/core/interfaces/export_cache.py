@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+
+class ExportCacheInterface(ABC):
+    """
+    Interface for the cache of generated export files.
+
+    An artifact is identified by the REO, the distribution config, a key derived from the exported data
+    and the export options, and the file extension. Only the latest artifact per REO, distribution config
+    and extension is kept.
+
+    Readers get a lease on an artifact: a path that stays readable even if the artifact is replaced
+    or invalidated, until the reader releases it.
+    """
+
+    @abstractmethod
+    async def get(self, reo_id: int, distribution_config_id: int, key: str, extension: str) -> Optional[Path]:
+        """Return a lease on the cached artifact, or None on a miss."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def store(
+        self, reo_id: int, distribution_config_id: int, key: str, extension: str, source: BinaryIO
+    ) -> Path:
+        """
+        Store a generated file, replacing older artifacts of the same REO, distribution config and extension.
+
+        Args:
+            source: Readable binary file object, read in chunks from its current position
+
+        Returns:
+            Lease on the stored artifact
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, lease: Path) -> None:
+        """Release a lease returned by get or store once the file is no longer read."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, reo_id: int) -> None:
+        """Drop all artifacts of a REO. Missing artifacts are ignored."""
+        raise NotImplementedError
@@ -1,8 +1,41 @@
 from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Iterator, Optional, Sequence
 
 import pandas as pd
 
 
+class TabularFileWriterInterface(ABC):
+    """
+    Incremental writer of one generated file, so large exports never hold all rows in memory.
+    Blocking: call its methods off the event loop.
+    """
+
+    @abstractmethod
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Append rows to the file.
+
+        Args:
+            rows: Row values in the order of the columns the writer was opened with
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> BinaryIO:
+        """
+        Finish the file.
+
+        Returns:
+            Temporary file with the content, positioned at the start; it is removed when the caller closes it
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self) -> None:
+        """Drop the unfinished file and its temporary data."""
+        raise NotImplementedError
+
+
 class FileProcessingInterface(ABC):
     """
     Interface for file processing operations.
@@ -10,13 +43,14 @@ class FileProcessingInterface(ABC):
     """
 
     @abstractmethod
-    async def read_excel_file(self, file_content: bytes, filename: str) -> pd.DataFrame:
+    def read_file(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> pd.DataFrame:
         """
-        Read Excel file content and return pandas DataFrame.
+        Read file content and return pandas DataFrame. Blocking: run it off the event loop.
 
         Args:
             file_content: Raw file content as bytes
             filename: Name of the file for format validation
+            content_type: Content type of the upload, used when the extension is not conclusive
 
         Returns:
             pandas DataFrame with file content
@@ -27,12 +61,35 @@ class FileProcessingInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def validate_file_format(self, filename: str) -> None:
+    def iter_file_batches(
+        self, file: BinaryIO, filename: str, batch_size: int, content_type: Optional[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read file content as consecutive DataFrames of at most batch_size rows.
+        Blocking: iterate it off the event loop.
+
+        Args:
+            file: Seekable binary file
+            filename: Name of the file for error messages
+            batch_size: Maximum number of rows per batch
+            content_type: Content type of the upload, used when the extension is not conclusive
+
+        Returns:
+            Iterator over pandas DataFrames; a file without data rows yields one empty DataFrame
+
+        Raises:
+            Exception: If file cannot be read
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def validate_file_format(self, filename: str, content_type: Optional[str] = None) -> None:
         """
         Validate that the file is in correct format.
 
         Args:
             filename: Name of the file to validate
+            content_type: Content type of the upload, used when the extension is not conclusive
 
         Raises:
             Exception: If file format is invalid
@@ -40,14 +97,28 @@ class FileProcessingInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def write_excel_file(self, df: pd.DataFrame) -> bytes:
+    def write_file(self, df: pd.DataFrame) -> bytes:
         """
-        Write pandas DataFrame to Excel file and return as bytes.
+        Write pandas DataFrame to a file and return as bytes. Blocking: run it off the event loop.
 
         Args:
             df: DataFrame to write
 
         Returns:
-            Excel file content as bytes
+            File content as bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_writer(self, columns: list[str], filename: str) -> TabularFileWriterInterface:
+        """
+        Start a file that is written row batch by row batch. Blocking: run it off the event loop.
+
+        Args:
+            columns: Header of the file
+            filename: Name of the generated file, its extension picks the format
+
+        Returns:
+            Writer that accepts rows in the order of columns
         """
         raise NotImplementedError
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ImagePreprocessorInterface(ABC):
+    """
+    Interface for preparing attached images before they are sent to vision agents.
+
+    The output depends only on the input and the settings reflected in ``variant``, so the result
+    can be stored next to the original attachment and reused by later runs.
+    """
+
+    @property
+    @abstractmethod
+    def variant(self) -> str:
+        """Name of the derived variant; changes whenever settings that affect the output change."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def accepts(self, content_type: str) -> bool:
+        """Check whether images of this content type are processed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def output_content_type(self, content_type: str) -> str:
+        """Content type of the processed image for an input of the given content type."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def process(self, content: bytes, content_type: str) -> Optional[bytes]:
+        """Return the processed image, or None if the original should be sent as is."""
+        raise NotImplementedError
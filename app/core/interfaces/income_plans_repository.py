@@ -1,13 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from app.core.schemas.income_plan_schemas import BulkIncomePlanCreate, IncomePlanResponse, IncomePlanUpdate
+from app.core.schemas.income_plan_schemas import (
+    BulkIncomePlanCreate,
+    IncomePlanFilter,
+    IncomePlanResponse,
+    IncomePlanUpdate,
+)
 
 
 class IncomePlanRepositoryInterface(ABC):
 
     @abstractmethod
     async def get_active_plan_by_reo_id(self, reo_id: int) -> IncomePlanResponse:
+        """Retrieve the active income plans of a REO ordered by period_begin."""
         raise NotImplementedError
 
     @abstractmethod
@@ -21,8 +27,10 @@ class IncomePlanRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all(self) -> list[IncomePlanResponse]:
-        """Retrieve all income plans."""
+    async def get_all(
+        self, user_id: int, filters: IncomePlanFilter, after_id: int | None, limit: int
+    ) -> list[IncomePlanResponse]:
+        """Retrieve a page of the user's income plans ordered by ID descending."""
         raise NotImplementedError
 
     @abstractmethod
@@ -36,8 +44,8 @@ class IncomePlanRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def create_bulk_income_plans(self, data: list[dict], reo_id: int) -> Any:
-        """Create income plans in bulk associated with a specific REO."""
+    async def replace_active_plans(self, reo_id: int, data: list[dict]) -> Any:
+        """Deactivate the active income plans of a REO and insert new ones in one transaction, returning them."""
         raise NotImplementedError
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 
@@ -25,7 +26,7 @@ class PremisesAttachmentRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_reo_id_and_window_view(self, reo_id: int, view_from_window: str) -> list[Any]:
+    async def get_by_reo_id_and_window_view(self, reo_id: int, view_from_window: str) -> Any:
         """Retrieve a window view attachment record by reo_id and view_from_window."""
         raise NotImplementedError
 
@@ -48,3 +49,17 @@ class PremisesAttachmentRepositoryInterface(ABC):
     async def delete(self, attachment: Any) -> None:
         """Delete a layout type attachment record."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def is_content_hash_referenced(self, content_hash: str) -> bool:
+        """Check whether any layout type or window view attachment still points to the blob."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def content_hash_lock(self, content_hash: str) -> AbstractAsyncContextManager[None]:
+        """
+        Hold an exclusive lock on the content hash while the block runs.
+        Checking references before deleting a blob and attaching a blob to a record
+        must both run under it, otherwise a blob can be deleted under a fresh record.
+        """
+        raise NotImplementedError
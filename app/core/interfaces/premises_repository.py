@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
+
+from app.core.schemas.premise_schemas import PremisesFilter
 
 
 class PremisesRepositoryInterface(ABC):
@@ -20,8 +22,8 @@ class PremisesRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all(self) -> list[Any]:
-        """Retrieve all premises records."""
+    async def get_all(self, user_id: int, filters: PremisesFilter, after_id: int | None, limit: int) -> list[Any]:
+        """Retrieve a page of the user's premises records ordered by ID descending."""
         raise NotImplementedError
 
     @abstractmethod
@@ -44,6 +46,16 @@ class PremisesRepositoryInterface(ABC):
         """Create multiple premises records in bulk."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def replace_active_premises(self, reo_id: int, data: list[dict]) -> int:
+        """Deactivate the active premises of a REO and insert new ones in a single transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_active_premises_in_batches(self, reo_id: int, batches: AsyncIterator[list[dict]]) -> int:
+        """Deactivate the active premises of a REO and insert new ones batch by batch in a single transaction."""
+        raise NotImplementedError
+
     @abstractmethod
     async def fetch_recent_premises(self, reo_id: int, limit: int) -> list[Any]:
         """Deactivate all premises associated with a specific REO."""
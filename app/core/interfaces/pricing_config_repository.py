@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
-from app.core.schemas.pricing_config_schemas import PricingConfigCreate
+from app.core.schemas.pricing_config_schemas import PricingConfigCreate, PricingConfigFilter
 
 
 class PricingConfigRepositoryInterface(ABC):
@@ -22,8 +22,13 @@ class PricingConfigRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all(self) -> list[Any]:
-        """Retrieve all pricing config."""
+    async def get_ranging_for_factor(self, reo_id: int, factor: str) -> Any:
+        """Retrieve (id, ranging) of the active pricing config for one factor, extracted in the database."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self, user_id: int, filters: PricingConfigFilter, after_id: int | None, limit: int) -> list[Any]:
+        """Retrieve a page of the user's pricing configs ordered by ID descending."""
         raise NotImplementedError
 
     @abstractmethod
@@ -31,6 +36,24 @@ class PricingConfigRepositoryInterface(ABC):
         """Update an existing pricing config."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_active_dynamic_config(self, reo_id: int) -> Any:
+        """Retrieve (id, version, dynamic_config) of the active pricing config, extracted in the database."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def patch_active_content(
+        self, reo_id: int, sections: dict[str, dict], expected_version: Optional[int]
+    ) -> Any:
+        """
+        Merge keys into top-level sections of the active pricing config content in one UPDATE.
+
+        Each key of sections[name] replaces the same key of the content section, which is created if missing;
+        other keys and sections stay as stored. The version is increased. With expected_version the patch
+        applies only to that version. Returns the updated config, or None if nothing matched.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, pricing_config: Any) -> None:
         """Delete an pricing_config."""
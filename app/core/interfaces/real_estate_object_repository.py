@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from app.core.schemas.real_estate_object_schemas import RealEstateObjectResponse, RealEstateObjectUpdate
+from app.core.utils.enums import ReoLoadProfile
 
 
 class RealEstateObjectRepositoryInterface(ABC):
@@ -17,8 +18,8 @@ class RealEstateObjectRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_full(self, id: int, user_id: int) -> Any:
-        """Retrieve an income plan by its ID."""
+    async def get_full(self, id: int, user_id: int, profile: ReoLoadProfile = ReoLoadProfile.FULL) -> Any:
+        """Retrieve a real estate object with the relationships selected by the loading profile."""
         raise NotImplementedError
 
     @abstractmethod
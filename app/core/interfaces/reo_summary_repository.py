@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ReoSummaryRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def get(self, reo_id: int) -> Any:
+        """Get the premises summary of a REO."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh(self, reo_id: int) -> Any:
+        """Rebuild the premises summary of a REO from its active premises and sales."""
+        raise NotImplementedError
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from app.core.schemas.sale_schemas import SalesFilter
+
 
 class SalesRepositoryInterface(ABC):
 
@@ -15,8 +17,8 @@ class SalesRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all(self) -> list[dict]:
-        """Retrieve all sales records."""
+    async def get_all(self, user_id: int, filters: SalesFilter, after_id: int | None, limit: int) -> list[dict]:
+        """Retrieve a page of the user's sales records ordered by ID descending."""
         raise NotImplementedError
 
     @abstractmethod
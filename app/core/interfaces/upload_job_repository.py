@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+
+class UploadJobRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def create(self, data: dict) -> Any:
+        """Create a new upload job."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, id: int) -> Any:
+        """Retrieve an upload job by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def advance_received_size(self, id: int, offset: int, received_size: int) -> bool:
+        """Move the resume offset of an uploading job from `offset` to `received_size`, False if it moved meanwhile."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def enqueue(self, id: int, received_size: int) -> bool:
+        """Queue an uploading job whose offset is still `received_size`, False if the job changed meanwhile."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_next(self, stale_before: datetime) -> Any:
+        """
+        Take the oldest queued job, or a processing job without progress since `stale_before`, for processing.
+        Premises staged by an earlier attempt are dropped and the progress is reset. Returns None if there is none.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stage_premises(
+        self, job: Any, rows: list[dict], rows_processed: int, errors: list[dict], error_count: int
+    ) -> bool:
+        """
+        Insert inactive premises tagged with the job and record the progress in one transaction.
+        False if the job was claimed again by another worker.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def activate_staged_premises(self, job: Any, rows_processed: int, message: str | None) -> int | None:
+        """
+        Swap the premises staged by the job into the active set of its REO and complete the job in one transaction.
+        Returns the number of activated premises, or None if the job was claimed again by another worker.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fail(
+        self, job: Any, rows_processed: int, errors: list[dict], error_count: int, message: str | None
+    ) -> bool:
+        """Drop the premises staged by the job and mark it failed, False if the job was claimed again meanwhile."""
+        raise NotImplementedError
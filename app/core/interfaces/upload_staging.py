@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, BinaryIO
+
+
+class UploadStagingInterface(ABC):
+    """
+    Interface for the staging area of files uploaded in chunks.
+
+    A staged file belongs to one upload job and grows by appending chunks at the offset the job
+    has acknowledged, so an interrupted upload resumes where the last acknowledged chunk ended.
+    """
+
+    @abstractmethod
+    async def write(self, job_id: int, offset: int, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Write chunks at offset, dropping whatever was written after offset by an interrupted attempt.
+
+        Args:
+            job_id: Upload job the file belongs to
+            offset: Acknowledged size of the staged file
+            chunks: Body of the chunk request
+
+        Returns:
+            Size of the staged file after the write
+
+        Raises:
+            FileReadException: If the staged file is shorter than offset
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def open(self, job_id: int) -> BinaryIO:
+        """
+        Open the staged file for reading.
+
+        Raises:
+            FileReadException: If the staged file does not exist
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, job_id: int) -> None:
+        """Remove the staged file. A missing file is ignored."""
+        raise NotImplementedError
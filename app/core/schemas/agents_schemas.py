@@ -1,9 +1,11 @@
 import base64
+import hashlib
 import io
 from enum import StrEnum
-from typing import Any, Dict
+from typing import Dict, Optional
 
-from openai import OpenAI
+from app.core.schemas.pricing_config_schemas import PricingConfigResponse
+from app.core.utils.enums import AgentRunStatus
 from pydantic import BaseModel, Field, PrivateAttr
 
 
@@ -14,14 +16,31 @@ class FilesData(BaseModel):
     content_type: str
     file_name: str
     size: int
+    content_hash: str | None = None
 
-    _file_bytes: bytes = PrivateAttr()
-    _file_obj: io.BytesIO = PrivateAttr()
+    # base64 декодируется только при первом обращении: изображения передаются как есть, PDF - только при загрузке
+    _file_bytes: Optional[bytes] = PrivateAttr(default=None)
 
-    def model_post_init(self, context: Any) -> None:
-        self._file_bytes = base64.b64decode(self.base64)
-        self._file_obj = io.BytesIO(self._file_bytes)
-        self._file_obj.name = self.file_name
+    @property
+    def file_bytes(self) -> bytes:
+        if self._file_bytes is None:
+            self._file_bytes = base64.b64decode(self.base64)
+        return self._file_bytes
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.content_type == "application/pdf"
+
+    def file_obj(self) -> io.BytesIO:
+        """Содержимое файла для загрузки через files API"""
+        file_obj = io.BytesIO(self.file_bytes)
+        file_obj.name = self.file_name
+        return file_obj
+
+    @property
+    def content_digest(self) -> str:
+        """Хэш содержимого файла: content_hash вложения или sha256 декодированных байтов"""
+        return self.content_hash or hashlib.sha256(self.file_bytes).hexdigest()
 
     def _pdf_payload(self, file_id: str) -> list[dict]:
         descriptor = self.layout_type or self.view_from_window
@@ -52,14 +71,15 @@ class FilesData(BaseModel):
             },
         ]
 
-    def upload_and_get_payload(self, client: "OpenAI") -> list[dict]:
+    def get_payload(self, file_id: str | None = None) -> list[dict]:
         """
-        Загружает файл через API (если необходимо) и возвращает payload для OpenAI.
-        Для PDF файлов загружает через API, для изображений использует base64 напрямую.
+        Возвращает payload для OpenAI.
+        PDF передается ссылкой на файл file_id, загруженный через API, изображения - через base64 напрямую.
         """
-        if self.content_type == "application/pdf":
-            uploaded_file = client.files.create(file=self._file_obj, purpose="assistants")
-            return self._pdf_payload(uploaded_file.id)
+        if self.is_pdf:
+            if file_id is None:
+                raise ValueError(f"PDF file {self.file_name} must be uploaded before it is attached")
+            return self._pdf_payload(file_id)
 
         return self._image_payload()
 
@@ -126,3 +146,21 @@ class DynamicConfig(BaseModel):
 
 class WeightedFactorsResponse(BaseModel):
     dynamicConfig: DynamicConfig
+
+
+class EvaluatorsRunRequest(BaseModel):
+    agents: Optional[list[str]] = Field(None, description="Агенты для запуска; по умолчанию все зарегистрированные")
+    use_cache: bool = Field(True, description="Вернуть сохраненный ответ агента при тех же входных данных")
+
+
+class AgentRunReport(BaseModel):
+    agent_id: str
+    status: AgentRunStatus
+    seconds: float
+    error: Optional[str] = None
+
+
+class EvaluatorsRunResponse(BaseModel):
+    reo_id: int
+    agents: list[AgentRunReport]
+    pricing_config: Optional[PricingConfigResponse] = None
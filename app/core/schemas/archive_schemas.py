@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional
+
+from app.core.utils.enums import ArchiveTable
+from pydantic import BaseModel, Field
+
+
+class ArchivedRecordResponse(BaseModel):
+    id: int
+    table_name: ArchiveTable
+    record_id: int
+    reo_id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ArchivedRecordFilter(BaseModel):
+    table_name: Optional[ArchiveTable] = None
+    reo_id: Optional[int] = None
+
+
+class ArchiveRestoreRequest(BaseModel):
+    table_name: ArchiveTable
+    record_ids: list[int] = Field(..., min_length=1)
+
+
+class ArchiveRestoreResponse(BaseModel):
+    restored: list[int]
+
+
+class ArchiveRunResponse(BaseModel):
+    archived: dict[ArchiveTable, int]
+    purged: int
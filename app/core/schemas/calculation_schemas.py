@@ -49,6 +49,13 @@ class PremisesWithCalculation(PremisesResponse):
         return self
 
 
+class CommittedPremiseWithCalculation(PremisesWithCalculation):
+    """Premise row of a committed snapshot: current premise data plus the committed calculation"""
+
+    actual_price: float
+    x_rank: float
+
+
 class RealEstateObjectWithCalculations(RealEstateObjectFullResponse):
     distribution_config: DistributionConfigResponse
     premises: list[PremisesWithCalculation] = Field(default_factory=list)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
 
@@ -32,5 +32,35 @@ class CommittedPricesResponse(BaseModel):
         from_attributes = True
 
 
+class CommittedSnapshotResponse(BaseModel):
+    id: int
+    reo_id: int
+    pricing_config_id: int
+    distribution_config_id: int
+    created_at: datetime
+    is_active: bool
+    premises_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class CommittedPremisePriceResponse(BaseModel):
+    premise_id: int
+    actual_price_per_sqm: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CommittedPricesFilter(BaseModel):
+    reo_id: Optional[int] = None
+    pricing_config_id: Optional[int] = None
+    distribution_config_id: Optional[int] = None
+    is_active: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
 class BulkCommittedPricesCreate(BaseModel):
     commited_prices: list[CommittedPricesCreate]
@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+
+
+class OperationMetricsResponse(BaseModel):
+    calls: int
+    failures: int
+    rejected: int
+    in_flight: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    run_seconds_total: float
+    run_seconds_max: float
+
+    class Config:
+        from_attributes = True
+
+
+class LoopLagMetricsResponse(BaseModel):
+    samples: int
+    lag_seconds_total: float
+    lag_seconds_max: float
+
+    class Config:
+        from_attributes = True
+
+
+class FileProcessingMetricsResponse(BaseModel):
+    workers: int
+    capacity: int
+    operations: dict[str, OperationMetricsResponse]
+    event_loop_lag: LoopLagMetricsResponse
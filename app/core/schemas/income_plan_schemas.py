@@ -5,6 +5,9 @@ from typing import ClassVar, List, Optional
 import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 
+# Форматы дат периода плана в файлах и запросах
+INCOME_PLAN_DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S")
+
 
 class IncomePlanCreate(BaseModel):
     reo_id: int
@@ -23,7 +26,7 @@ class IncomePlanCreate(BaseModel):
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            for fmt in ("%d/%m/%Y", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"):
+            for fmt in INCOME_PLAN_DATE_FORMATS:
                 try:
                     return datetime.strptime(value, fmt)
                 except ValueError:
@@ -69,6 +72,14 @@ class IncomePlanResponse(BaseModel):
         from_attributes = True
 
 
+class IncomePlanFilter(BaseModel):
+    reo_id: Optional[int] = None
+    is_active: Optional[bool] = None
+    property_type: Optional[str] = None
+    period_from: Optional[datetime] = None
+    period_to: Optional[datetime] = None
+
+
 class IncomePlanFileResponse(BaseModel):
     PREDEFINED_COLUMNS: ClassVar[list[str]] = [
         "Property type",
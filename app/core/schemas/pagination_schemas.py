@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from app.core.exceptions import InvalidCursorException
+from pydantic import BaseModel
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(last_id: int) -> str:
+    """Упаковывает id последнего элемента страницы в непрозрачный курсор."""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Возвращает id, после которого начинается следующая страница (None - первая страница)."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = payload["id"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursorException(cursor=cursor)
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorException(cursor=cursor)
+    return last_id
+
+
+def build_cursor_page(rows: Sequence[Any], limit: int, schema: type[T]) -> CursorPage[T]:
+    """
+    Собирает страницу из результата запроса, выбравшего limit + 1 строк.
+
+    Лишняя строка только сигнализирует о наличии следующей страницы и в ответ не попадает.
+    """
+    page_rows = rows[:limit]
+    next_cursor = encode_cursor(page_rows[-1].id) if len(rows) > limit else None
+    return CursorPage[schema](  # type: ignore[valid-type]
+        items=[schema.model_validate(row) for row in page_rows], next_cursor=next_cursor
+    )
@@ -142,6 +142,14 @@ class PremisesResponse(BaseModel):
         from_attributes = True
 
 
+class PremisesFilter(BaseModel):
+    reo_id: Optional[int] = None
+    is_active: Optional[bool] = None
+    status: Optional[str] = None
+    uploaded_from: Optional[datetime] = None
+    uploaded_to: Optional[datetime] = None
+
+
 class PremisesFileSpecificationResponse(BaseModel):
     PREDEFINED_COLUMNS: ClassVar[list[str]] = [
         "Property type",
@@ -169,31 +177,35 @@ class PremisesFileSpecificationResponse(BaseModel):
         "Status",
         "Sales amount",
     ]
+    STUDIO_TRUE_VALUES: ClassVar[list] = ["Yes", 1, "1", "yes", "true", True, "да", "Да"]
+    PREMISES_ID_TEMPLATE: ClassVar[str] = "SV/A/{floor}/{number_of_unit}/{layout_type}/{number}"
 
     property_type: str = Field(alias="Property type")
     premises_id: str | int = Field(alias="Premises ID")
-    number_of_unit: int = Field(alias="Number of unit")
+    number_of_unit: int = Field(alias="Number of unit", ge=0)
     number: str | int = Field(alias="Number")
     entrance: int = Field(alias="Entrance")
     floor: int = Field(alias="Floor")
     layout_type: str = Field(alias="Layout type")
-    full_price: Optional[float] = Field(alias="Full price", default=None)
-    total_area_m2: float = Field(alias="Total area, m2")
-    estimated_area_m2: float = Field(alias="Estimated area, m2")
-    price_per_meter: Optional[float] = Field(alias="Price per meter", default=None)
-    number_of_rooms: Optional[int] = Field(alias="Number of rooms")
-    living_area_m2: Optional[float] = Field(alias="Living area, m2", default=None)
-    kitchen_area_m2: Optional[float] = Field(alias="Kitchen area, m2", default=None)
+    full_price: Optional[float] = Field(alias="Full price", default=None, ge=0)
+    total_area_m2: float = Field(alias="Total area, m2", ge=0)
+    estimated_area_m2: float = Field(alias="Estimated area, m2", ge=0)
+    price_per_meter: Optional[float] = Field(alias="Price per meter", default=None, ge=0)
+    number_of_rooms: Optional[int] = Field(alias="Number of rooms", ge=0)
+    living_area_m2: Optional[float] = Field(alias="Living area, m2", default=None, ge=0)
+    kitchen_area_m2: Optional[float] = Field(alias="Kitchen area, m2", default=None, ge=0)
     view_from_window: Optional[str] = Field(alias="View from window", default=None)
-    number_of_levels: Optional[int] = Field(alias="Number of levels", default=None)
-    number_of_loggias: Optional[int] = Field(alias="Number of loggias", default=None)
-    number_of_balconies: Optional[int] = Field(alias="Number of balconies", default=None)
-    number_of_bathrooms_with_toilets: Optional[int] = Field(alias="Number of bathrooms with toilets", default=None)
-    number_of_separate_bathrooms: Optional[int] = Field(alias="Number of separate bathrooms", default=None)
-    number_of_terraces: Optional[int] = Field(alias="Number of terraces", default=None)
+    number_of_levels: Optional[int] = Field(alias="Number of levels", default=None, ge=0)
+    number_of_loggias: Optional[int] = Field(alias="Number of loggias", default=None, ge=0)
+    number_of_balconies: Optional[int] = Field(alias="Number of balconies", default=None, ge=0)
+    number_of_bathrooms_with_toilets: Optional[int] = Field(
+        alias="Number of bathrooms with toilets", default=None, ge=0
+    )
+    number_of_separate_bathrooms: Optional[int] = Field(alias="Number of separate bathrooms", default=None, ge=0)
+    number_of_terraces: Optional[int] = Field(alias="Number of terraces", default=None, ge=0)
     studio: bool = Field(alias="Studio", default=False)
     status: str = Field(alias="Status")
-    sales_amount: Optional[float] = Field(alias="Sales amount", default=None)
+    sales_amount: Optional[float] = Field(alias="Sales amount", default=None, ge=0)
     customcontent: Optional[Dict] = None
 
     @field_validator("*", mode="before")
@@ -213,7 +225,7 @@ class PremisesFileSpecificationResponse(BaseModel):
     def validate_date_format(cls, value: str) -> bool:
         """Convert various representations of boolean to actual bool"""
         try:
-            if value in ["Yes", 1, "1", "yes", "true", True, "да", "Да"]:
+            if value in cls.STUDIO_TRUE_VALUES:
                 return True
             return False
         except ValueError:
@@ -223,7 +235,9 @@ class PremisesFileSpecificationResponse(BaseModel):
     def generate_premises_id(self) -> "PremisesFileSpecificationResponse":
         """Generate premises_id if it's None"""
         if not self.premises_id:
-            self.premises_id = f"SV/A/{self.floor}/{self.number_of_unit}/{self.layout_type}/{self.number}"
+            self.premises_id = self.PREMISES_ID_TEMPLATE.format(
+                floor=self.floor, number_of_unit=self.number_of_unit, layout_type=self.layout_type, number=self.number
+            )
         return self
 
     @classmethod
@@ -257,9 +271,14 @@ class BulkPremisesCreateRequest(BaseModel):
     premises: List[PremisesCreate]
 
 
+class SpecificationUploadResponse(BaseModel):
+    reo_id: int
+    premises_count: int
+
+
 class AttachmentCreate(BaseModel):
     reo_id: int
-    base64_file: str
+    content_hash: str
     content_type: str
     file_name: str
     file_size: int
@@ -283,7 +302,7 @@ class WindowViewAttachmentCreate(AttachmentCreate):
 
 
 class AttachmentUpdate(BaseModel):
-    base64_file: Optional[str] = None
+    content_hash: Optional[str] = None
     content_type: Optional[str] = None
     file_name: Optional[str] = None
     file_size: Optional[int] = None
@@ -303,7 +322,7 @@ class WindowViewAttachmentUpdate(AttachmentUpdate):
 class AttachmentResponse(BaseModel):
     id: int
     reo_id: int
-    base64_file: str
+    content_hash: str
     content_type: str
     file_name: str
     file_size: int
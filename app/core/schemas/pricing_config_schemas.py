@@ -28,6 +28,14 @@ class PricingConfigResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     content: dict
+    version: int
 
     class Config:
         from_attributes = True
+
+
+class PricingConfigFilter(BaseModel):
+    reo_id: Optional[int] = None
+    is_active: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
@@ -81,3 +81,58 @@ class RealEstateObjectFullResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class RealEstateObjectProfileResponse(BaseModel):
+    """
+    Объект недвижимости со связями, загруженными по профилю.
+    Связь, которую профиль не загружает, равна None, а не пустому списку.
+    """
+
+    id: int
+    name: str
+    lon: Optional[float]
+    lat: Optional[float]
+    curr: Optional[CurrencyEnum]
+    property_class: Optional[PropertyClassEnum]
+    url: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+    custom_fields: Optional[dict]
+
+    premises: Optional[list[PremisesResponse]] = None
+    pricing_configs: Optional[list[PricingConfigResponse]] = None
+    committed_prices: Optional[list[CommittedPricesResponse]] = None
+    income_plans: Optional[list[IncomePlanResponse]] = None
+    status_mappings: Optional[list[StatusMappingResponse]] = None
+    layout_type_attachments: Optional[list[LayoutTypeAttachmentResponse]] = None
+    window_view_attachments: Optional[list[WindowViewAttachmentResponse]] = None
+
+    class Config:
+        from_attributes = True
+
+
+class EntranceSummary(BaseModel):
+    entrance_number: str
+    apartments_in_entrance: int
+    floors_in_entrance: int
+
+
+class ReoPremisesSummaryResponse(BaseModel):
+    reo_id: int
+    premises_count: int
+    sold_count: int
+    available_count: int
+    min_price_per_meter: Optional[float]
+    max_price_per_meter: Optional[float]
+    avg_price_per_meter: Optional[float]
+    floors: list[int]
+    total_areas: list[float]
+    entrances: list[EntranceSummary]
+    sales_count: int
+    sales_amount: float
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
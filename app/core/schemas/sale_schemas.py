@@ -36,3 +36,11 @@ class SalesResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class SalesFilter(BaseModel):
+    reo_id: Optional[int] = None
+    premises_id: Optional[int] = None
+    is_deleted: Optional[bool] = None
+    saledate_from: Optional[datetime] = None
+    saledate_to: Optional[datetime] = None
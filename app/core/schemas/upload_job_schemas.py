@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from app.core.utils.enums import UploadJobStatus
+from pydantic import BaseModel, Field
+
+
+class UploadJobCreate(BaseModel):
+    filename: str = Field(..., min_length=1)
+    content_type: Optional[str] = None
+    total_size: Optional[int] = Field(None, gt=0)
+
+
+class UploadJobRowError(BaseModel):
+    row_number: int
+    errors: list[dict]
+
+
+class UploadJobResponse(BaseModel):
+    id: int
+    reo_id: int
+    filename: str
+    content_type: Optional[str]
+    status: UploadJobStatus
+    total_size: Optional[int]
+    received_size: int
+    rows_processed: int
+    premises_count: Optional[int]
+    error_count: int
+    errors: list[UploadJobRowError]
+    message: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
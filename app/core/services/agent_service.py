@@ -1,166 +1,353 @@
 import asyncio
+import base64
+import hashlib
 import json
+import time
+from typing import Any, Awaitable, Callable, ClassVar, Optional
 
 from app.core.exceptions import AgentExecutionError, AgentNotFound
-from app.core.schemas.agents_schemas import FilesData, ValidAgentFields
+from app.core.interfaces.agent_response_cache import AgentResponseCacheInterface
+from app.core.interfaces.attachment_storage import AttachmentStorageInterface
+from app.core.interfaces.image_preprocessor import ImagePreprocessorInterface
+from app.core.schemas.agents_schemas import (
+    AgentRunReport,
+    EvaluatorsRunResponse,
+    FilesData,
+    ValidAgentFields,
+)
+from app.core.schemas.real_estate_object_schemas import ReoPremisesSummaryResponse
 from app.core.schemas.user_schemas import UserOutputSchema
 from app.core.services.pricing_config_service import PricingConfigService
 from app.core.services.real_estate_object_service import RealEstateObjectService
+from app.core.utils.agent_limiter import AgentConcurrencyLimiter
+from app.core.utils.enums import AgentRunStatus, ReoLoadProfile
 from app.infrastructure.agents.agent_constants import AgentID
 from app.infrastructure.agents.agent_manager import AgentManager
+from app.infrastructure.agents.base_agent import BaseAgent
 from app.infrastructure.agents.prompt_manager import prompt_manager
 from loguru import logger
 
+# Запрос к агенту: пользовательский промпт и вложенные файлы
+AgentRequest = tuple[str, Optional[list[FilesData]]]
+
 
 class AgentService:
+    # Часть ключа кэша ответов: увеличить, если меняется состав ключа или формат сохраненного ответа
+    RESPONSE_CACHE_VERSION: ClassVar[int] = 1
+
+    # Какие данные объекта нужны агентам: помещения, вложения или сводка по помещениям
+    _NEEDS_PREMISES: ClassVar[frozenset[AgentID]] = frozenset({AgentID.BEST_FLAT_LABEL, AgentID.ROOM_EVALUATOR})
+    _NEEDS_MEDIA: ClassVar[frozenset[AgentID]] = frozenset({AgentID.LAYOUT_EVALUATOR, AgentID.WINDOW_VIEW_EVALUATOR})
+    _NEEDS_SUMMARY: ClassVar[frozenset[AgentID]] = frozenset(
+        {AgentID.BEST_FLAT_FLOOR, AgentID.TOTAL_AREA_EVALUATOR, AgentID.ENTRANCE_EVALUATOR}
+    )
+
     def __init__(
         self,
         agent_manager: AgentManager,
         real_estate_object_service: RealEstateObjectService,
         pricing_config_service: PricingConfigService,
+        attachment_storage: AttachmentStorageInterface,
+        limiter: AgentConcurrencyLimiter,
+        response_cache: Optional[AgentResponseCacheInterface] = None,
+        image_preprocessor: Optional[ImagePreprocessorInterface] = None,
     ):
         self.agent_manager = agent_manager
         self.real_estate_object_service = real_estate_object_service
         self.pricing_config_service = pricing_config_service
+        self.attachment_storage = attachment_storage
+        self.limiter = limiter
+        self.response_cache = response_cache
+        self.image_preprocessor = image_preprocessor
+        self._request_builders: dict[AgentID, Callable[[Any, Any], Awaitable[AgentRequest]]] = {
+            AgentID.BEST_FLAT_LABEL: self._best_flat_label_request,
+            AgentID.BEST_FLAT_FLOOR: self._best_floor_request,
+            AgentID.LAYOUT_EVALUATOR: self._layout_evaluator_request,
+            AgentID.WINDOW_VIEW_EVALUATOR: self._window_view_evaluator_request,
+            AgentID.TOTAL_AREA_EVALUATOR: self._total_area_evaluator_request,
+            AgentID.ENTRANCE_EVALUATOR: self._entrance_evaluator_request,
+            AgentID.ROOM_EVALUATOR: self._room_evaluator_request,
+            AgentID.WEIGHTED_FACTORS: self._weighted_factors_request,
+        }
+
+    async def _attachment_file(self, attachment: Any, **descriptor: Optional[str]) -> FilesData:
+        """
+        Вложение для агента. Изображения уменьшаются и пережимаются один раз: подготовленный вариант
+        сохраняется рядом с оригиналом и используется при следующих запусках без повторной обработки.
+        """
+        content_hash = attachment.content_hash
+        content_type = attachment.content_type
+        content = None
+
+        preprocessor = self.image_preprocessor
+        if preprocessor is not None and preprocessor.accepts(content_type):
+            content = await self.attachment_storage.read_variant(content_hash, preprocessor.variant)
+            if content is None:
+                processed = await preprocessor.process(await self.attachment_storage.read(content_hash), content_type)
+                # Пустой вариант означает, что обработка не уменьшила изображение и отправляется оригинал
+                content = processed or b""
+                await self.attachment_storage.save_variant(content_hash, preprocessor.variant, content)
+            if content:
+                content_hash = hashlib.sha256(content).hexdigest()
+                content_type = preprocessor.output_content_type(content_type)
+
+        if not content:
+            content = await self.attachment_storage.read(attachment.content_hash)
+        return FilesData(
+            **descriptor,
+            base64=base64.b64encode(content).decode("utf-8"),
+            content_hash=content_hash,
+            content_type=content_type,
+            file_name=attachment.file_name,
+            size=len(content),
+        )
 
-    def _run_blocking_agent(self, agent_id: AgentID, user_prompt: str, files: list[FilesData] | None = None) -> dict:
-        if self.agent_manager.get_agent(agent_id) is None:
+    async def _run_agent(
+        self,
+        agent_id: AgentID,
+        user_prompt: str,
+        user: UserOutputSchema,
+        files: list[FilesData] | None = None,
+        use_cache: bool = True,
+    ) -> dict:
+        """
+        Выполняет агента на асинхронном клиенте, не занимая поток: одновременно выполняется не больше
+        GPT_MAX_CONCURRENCY агентов и не больше GPT_MAX_CONCURRENCY_PER_USER агентов одного пользователя.
+
+        Если для тех же входных данных ответ уже сохранен, он возвращается без вызова LLM.
+        use_cache=False вызывает LLM в любом случае и заменяет сохраненный ответ.
+        """
+        agent = self.agent_manager.get_agent(agent_id)
+        if agent is None:
             raise AgentNotFound(agent_id=agent_id)
 
-        result = self.agent_manager.run_agent(agent_id, user_input=user_prompt, files=files)
+        cache_key = self._response_cache_key(agent_id, agent, user_prompt, files)
+        if self.response_cache is not None and use_cache:
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Agent {agent_id} response taken from cache")
+                return cached
+
+        async with self.limiter.slot(user.id):
+            result = await self.agent_manager.run_agent(agent_id, user_input=user_prompt, files=files)
 
         if result is None:
             raise AgentExecutionError(agent_id=agent_id)
 
-        return result.model_dump()
-
-    async def run_best_flat_label_agent(self, reo_id: int, user: UserOutputSchema) -> None:
+        result_dict = result.model_dump()
+        if self.response_cache is not None:
+            await self.response_cache.set(cache_key, result_dict)
+        return result_dict
+
+    @classmethod
+    def _response_cache_key(
+        cls, agent_id: AgentID, agent: BaseAgent, user_prompt: str, files: list[FilesData] | None
+    ) -> str:
+        """Ключ ответа: все, от чего зависит вызов LLM, включая содержимое и подписи вложенных файлов"""
+        key = {
+            "version": cls.RESPONSE_CACHE_VERSION,
+            "agent_id": agent_id,
+            "system_prompt": hashlib.sha256(agent.system_prompt.encode()).hexdigest(),
+            "user_prompt": user_prompt,
+            "model": agent.llm_model,
+            "temperature": agent.temperature,
+            "response_schema": agent.response_schema.model_json_schema(),
+            "files": [
+                [file.content_digest, file.file_name, file.content_type, file.layout_type, file.view_from_window]
+                for file in files or []
+            ],
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+    async def run_best_flat_label_agent(self, reo_id: int, user: UserOutputSchema, use_cache: bool = True) -> None:
         logger.info(f"Running best label agent for REO ID: {reo_id}")
+        await self._run_evaluator(AgentID.BEST_FLAT_LABEL, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info(f"Finished running best label agent for REO ID: {reo_id}")
 
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
+    async def run_best_floor_agent(self, reo_id: int, user: UserOutputSchema, use_cache: bool = True) -> None:
+        logger.info(f"Running best floor agent for REO ID: {reo_id}")
+        await self._run_evaluator(AgentID.BEST_FLAT_FLOOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info(f"Finished running best floor agent for REO ID: {reo_id}")
 
-        flat_numbers = [premise.number for premise in reo.premises]
-        user_prompt = prompt_manager.USER_PROMPT_BEST_FLAT_LABEL.format(flat_numbers=flat_numbers)
+    async def run_layout_evaluator_agent(self, reo_id: int, user: UserOutputSchema, use_cache: bool = True) -> None:
+        logger.info("Running layout evaluator agent")
+        await self._run_evaluator(AgentID.LAYOUT_EVALUATOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running layout evaluator agent")
 
-        result_dict = await asyncio.to_thread(self._run_blocking_agent, AgentID.BEST_FLAT_LABEL, user_prompt)
+    async def run_window_view_evaluator_agent(
+        self, reo_id: int, user: UserOutputSchema, use_cache: bool = True
+    ) -> None:
+        logger.info("Running window view evaluator agent")
+        await self._run_evaluator(AgentID.WINDOW_VIEW_EVALUATOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running layout evaluator agent")
 
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info(f"Finished running best label agent for REO ID: {reo_id}")
+    async def run_total_area_evaluator_agent(
+        self, reo_id: int, user: UserOutputSchema, use_cache: bool = True
+    ) -> None:
+        logger.info("Running total area evaluator agent")
+        await self._run_evaluator(AgentID.TOTAL_AREA_EVALUATOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running total area evaluator agent")
 
-    async def run_best_floor_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info(f"Running best floor agent for REO ID: {reo_id}")
+    async def run_best_entrance_agent(self, reo_id: int, user: UserOutputSchema, use_cache: bool = True) -> None:
+        logger.info("Running best entrance agent")
+        await self._run_evaluator(AgentID.ENTRANCE_EVALUATOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running best entrance agent")
 
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
+    async def run_room_quantity_evaluator_agent(
+        self, reo_id: int, user: UserOutputSchema, use_cache: bool = True
+    ) -> None:
+        logger.info("Running room quantity agent")
+        await self._run_evaluator(AgentID.ROOM_EVALUATOR, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running best entrance agent")
 
-        floor_numbers = sorted({premise.floor for premise in reo.premises})
-        user_prompt = prompt_manager.USER_PROMPT_BEST_FLAT_FLOOR.format(
-            latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, floors=floor_numbers
-        )
+    async def run_weighted_factors_agent(self, reo_id: int, user: UserOutputSchema, use_cache: bool = True) -> None:
+        logger.info("Running weighted factors agent")
+        await self._run_evaluator(AgentID.WEIGHTED_FACTORS, reo_id=reo_id, user=user, use_cache=use_cache)
+        logger.info("Finished running weighted factors agent")
+
+    async def run_evaluators(
+        self, reo_id: int, user: UserOutputSchema, agents: list[str] | None = None, use_cache: bool = True
+    ) -> EvaluatorsRunResponse:
+        """
+        Запускает несколько агентов-оценщиков для объекта и сохраняет их результаты в PricingConfig одной записью.
+
+        Объект, его помещения, вложения и сводка загружаются один раз для всех агентов; агенты выполняются
+        одновременно, а AgentConcurrencyLimiter пускает не больше GPT_MAX_CONCURRENCY_PER_USER сразу. Ошибка одного агента не останавливает
+        остальных и попадает в отчет; результаты успешных агентов сливаются с конфигом в одной транзакции.
+        """
+        agent_ids = self._resolve_evaluators(agents)
+        logger.info(f"Running evaluators {', '.join(agent_ids)} for REO ID: {reo_id}")
+        reo, summary = await self._load_inputs(reo_id, user, agent_ids)
+
+        async def run(agent_id: AgentID) -> tuple[AgentRunReport, dict | None]:
+            started = time.perf_counter()
+            try:
+                user_prompt, files = await self._request_builders[agent_id](reo, summary)
+                result = await self._run_agent(
+                    agent_id, user_prompt=user_prompt, user=user, files=files, use_cache=use_cache
+                )
+            except Exception as e:
+                logger.exception(f"Evaluator {agent_id} failed for REO ID: {reo_id}")
+                report = AgentRunReport(
+                    agent_id=agent_id,
+                    status=AgentRunStatus.FAILED,
+                    seconds=time.perf_counter() - started,
+                    error=str(e) or type(e).__name__,
+                )
+                return report, None
+            report = AgentRunReport(
+                agent_id=agent_id, status=AgentRunStatus.SUCCEEDED, seconds=time.perf_counter() - started
+            )
+            return report, result
+
+        outcomes = await asyncio.gather(*(run(agent_id) for agent_id in agent_ids))
+        results = [result for _, result in outcomes if result is not None]
 
-        result_dict = await asyncio.to_thread(self._run_blocking_agent, AgentID.BEST_FLAT_FLOOR, user_prompt)
+        pricing_config = None
+        if results:
+            pricing_config = await self.pricing_config_service.apply_agent_results(reo_id=reo_id, results=results)
+        logger.info(f"Finished running evaluators for REO ID: {reo_id}: {len(results)} of {len(agent_ids)} succeeded")
+        return EvaluatorsRunResponse(
+            reo_id=reo_id, agents=[report for report, _ in outcomes], pricing_config=pricing_config
+        )
 
+    def _resolve_evaluators(self, agents: list[str] | None) -> list[AgentID]:
+        if agents is None:
+            return [agent_id for agent_id in AgentID if self.agent_manager.get_agent(agent_id) is not None]
+
+        agent_ids: list[AgentID] = []
+        for agent in agents:
+            try:
+                agent_id = AgentID(agent)
+            except ValueError:
+                raise AgentNotFound(agent_id=agent)
+            if self.agent_manager.get_agent(agent_id) is None:
+                raise AgentNotFound(agent_id=agent_id)
+            if agent_id not in agent_ids:
+                agent_ids.append(agent_id)
+        return agent_ids
+
+    async def _run_evaluator(self, agent_id: AgentID, reo_id: int, user: UserOutputSchema, use_cache: bool) -> None:
+        reo, summary = await self._load_inputs(reo_id, user, [agent_id])
+        user_prompt, files = await self._request_builders[agent_id](reo, summary)
+        result_dict = await self._run_agent(
+            agent_id, user_prompt=user_prompt, user=user, files=files, use_cache=use_cache
+        )
         await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info(f"Finished running best floor agent for REO ID: {reo_id}")
 
-    async def run_layout_evaluator_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running layout evaluator agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
+    async def _load_inputs(
+        self, reo_id: int, user: UserOutputSchema, agent_ids: list[AgentID]
+    ) -> tuple[Any, Optional[ReoPremisesSummaryResponse]]:
+        """Загружает объект с теми связями и сводкой, которые нужны агентам agent_ids, одним набором запросов"""
+        needs_premises = any(agent_id in self._NEEDS_PREMISES for agent_id in agent_ids)
+        needs_media = any(agent_id in self._NEEDS_MEDIA for agent_id in agent_ids)
+
+        reo: Any
+        if needs_premises and needs_media:
+            reo = await self.real_estate_object_service.get_full(id=reo_id, user=user, profile=ReoLoadProfile.AGENTS)
+        elif needs_premises:
+            reo = await self.real_estate_object_service.get_full(
+                id=reo_id, user=user, profile=ReoLoadProfile.AGENTS_TEXT
+            )
+        elif needs_media:
+            reo = await self.real_estate_object_service.get_full(
+                id=reo_id, user=user, profile=ReoLoadProfile.AGENTS_MEDIA
+            )
+        else:
+            reo = await self.real_estate_object_service.get(id=reo_id, user=user)
+
+        summary = None
+        if any(agent_id in self._NEEDS_SUMMARY for agent_id in agent_ids):
+            summary = await self.real_estate_object_service.get_premises_summary(id=reo_id, user=user)
+        return reo, summary
+
+    async def _best_flat_label_request(self, reo: Any, summary: Any) -> AgentRequest:
+        flat_numbers = [premise.number for premise in reo.premises]
+        return prompt_manager.USER_PROMPT_BEST_FLAT_LABEL.format(flat_numbers=flat_numbers), None
+
+    async def _best_floor_request(self, reo: Any, summary: Any) -> AgentRequest:
+        user_prompt = prompt_manager.USER_PROMPT_BEST_FLAT_FLOOR.format(
+            latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, floors=summary.floors
+        )
+        return user_prompt, None
 
+    async def _layout_evaluator_request(self, reo: Any, summary: Any) -> AgentRequest:
         user_prompt = prompt_manager.USER_PROMPT_LAYOUT_EVALUATOR.format(
             latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class
         )
         files: list[FilesData] = []
 
         for file_attachment in reo.layout_type_attachments:
-            file = FilesData(
-                layout_type=file_attachment.layout_type,
-                base64=file_attachment.base64_file,
-                content_type=file_attachment.content_type,
-                file_name=file_attachment.file_name,
-                size=file_attachment.file_size,
-            )
+            file = await self._attachment_file(file_attachment, layout_type=file_attachment.layout_type)
             files.append(file)
+        return user_prompt, files
 
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.LAYOUT_EVALUATOR, user_prompt=user_prompt, files=files
-        )
-
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running layout evaluator agent")
-
-    async def run_window_view_evaluator_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running window view evaluator agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
-
+    async def _window_view_evaluator_request(self, reo: Any, summary: Any) -> AgentRequest:
         user_prompt = prompt_manager.USER_PROMPT_WINDOW_VIEW_EVALUATOR.format(
             latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class
         )
-
         files: list[FilesData] = []
 
         for file_attachment in reo.window_view_attachments:
-            file = FilesData(
-                view_from_window=file_attachment.view_from_window,
-                base64=file_attachment.base64_file,
-                content_type=file_attachment.content_type,
-                file_name=file_attachment.file_name,
-                size=file_attachment.file_size,
-            )
+            file = await self._attachment_file(file_attachment, view_from_window=file_attachment.view_from_window)
             files.append(file)
+        return user_prompt, files
 
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.WINDOW_VIEW_EVALUATOR, user_prompt=user_prompt, files=files
-        )
-
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running layout evaluator agent")
-
-    async def run_total_area_evaluator_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running total area evaluator agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
-
-        total_areas = sorted({premise.total_area_m2 for premise in reo.premises})
+    async def _total_area_evaluator_request(self, reo: Any, summary: Any) -> AgentRequest:
         user_prompt = prompt_manager.USER_PROMPT_TOTAL_AREA_EVALUATOR.format(
-            latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, total_areas=total_areas
-        )
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.TOTAL_AREA_EVALUATOR, user_prompt=user_prompt
+            latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, total_areas=summary.total_areas
         )
+        return user_prompt, None
 
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running total area evaluator agent")
-
-    async def run_best_entrance_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running best entrance agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
-        entrances = set(prem.entrance for prem in reo.premises)
-        entrance_result = []
-        for entrance in entrances:
-            apartments = [p for p in reo.premises if p.entrance == entrance]
-            floors = {p.floor for p in apartments}
-
-            entrance_result.append(
-                {
-                    "entrance_number": entrance,
-                    "apartments_in_entrance": len(apartments),
-                    "floors_in_entrance": len(floors),
-                }
-            )
-
+    async def _entrance_evaluator_request(self, reo: Any, summary: Any) -> AgentRequest:
+        entrance_result = [entrance.model_dump() for entrance in summary.entrances]
         entrance_json = json.dumps(entrance_result, ensure_ascii=False)
         user_prompt = prompt_manager.USER_PROMPT_ENTRANCE_EVALUATOR.format(
             latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, entrance_result=entrance_json
         )
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.ENTRANCE_EVALUATOR, user_prompt=user_prompt
-        )
+        return user_prompt, None
 
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running best entrance agent")
-
-    async def run_room_quantity_evaluator_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running room quantity agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
+    async def _room_evaluator_request(self, reo: Any, summary: Any) -> AgentRequest:
         possible_values = []
 
         for premise in reo.premises:
@@ -176,26 +363,13 @@ class AgentService:
         user_prompt = prompt_manager.USER_PROMPT_ROOM_QUANTITY_EVALUATOR.format(
             latitude=reo.lat, longitude=reo.lon, object_class=reo.property_class, isolated_bedroom=unique_values
         )
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.ROOM_EVALUATOR, user_prompt=user_prompt
-        )
-
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running best entrance agent")
-
-    async def run_weighted_factors_agent(self, reo_id: int, user: UserOutputSchema) -> None:
-        logger.info("Running weighted factors agent")
-        reo = await self.real_estate_object_service.get_full(id=reo_id, user=user)
+        return user_prompt, None
 
+    async def _weighted_factors_request(self, reo: Any, summary: Any) -> AgentRequest:
         user_prompt = prompt_manager.USER_PROMPT_WEIGHTED_FACTORS_EVALUATOR.format(
             latitude=reo.lat,
             longitude=reo.lon,
             object_class=reo.property_class,
             available_fields_list=ValidAgentFields.to_prompt_string(),
         )
-        result_dict = await asyncio.to_thread(
-            self._run_blocking_agent, AgentID.WEIGHTED_FACTORS, user_prompt=user_prompt
-        )
-
-        await self.pricing_config_service.update_reo_pricing_config(reo_id=reo_id, data=result_dict)
-        logger.info("Finished running weighted factors agent")
+        return user_prompt, None
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.core.exceptions import ObjectNotFound
+from app.core.interfaces.archive_repository import ArchiveRepositoryInterface
+from app.core.schemas.archive_schemas import (
+    ArchivedRecordFilter,
+    ArchivedRecordResponse,
+    ArchiveRestoreRequest,
+    ArchiveRestoreResponse,
+    ArchiveRunResponse,
+)
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
+from app.core.schemas.user_schemas import UserOutputSchema
+from app.core.utils.enums import ArchiveTable
+from app.settings import ArchiveSettings
+from loguru import logger
+
+# Коммиты архивируются раньше конфигов: конфиг, на который ссылается коммит, остается в горячей таблице
+ARCHIVE_ORDER = [
+    ArchiveTable.COMMITTED_PRICES,
+    ArchiveTable.COMMITTED_SNAPSHOTS,
+    ArchiveTable.PREMISES,
+    ArchiveTable.INCOME_PLANS,
+    ArchiveTable.PRICING_CONFIGS,
+]
+
+
+class ArchiveService:
+    def __init__(self, repository: ArchiveRepositoryInterface, config: ArchiveSettings):
+        self.repository = repository
+        self.config = config
+
+    async def run_retention(self, now: datetime | None = None, reo_id: int | None = None) -> ArchiveRunResponse:
+        """
+        Переносит в архив неактивные версии строк, деактивированные раньше ARCHIVE_AFTER_DAYS,
+        и удаляет архивные записи старше ARCHIVE_RETENTION_DAYS (если срок хранения задан).
+        reo_id ограничивает архивацию одним объектом, очистка архива всегда глобальная.
+        """
+        now = now or datetime.now()
+        archive_before = now - timedelta(days=self.config.ARCHIVE_AFTER_DAYS)
+
+        archived = {}
+        for table in ARCHIVE_ORDER:
+            total = 0
+            while True:
+                moved = await self.repository.archive_inactive(
+                    table=table, older_than=archive_before, limit=self.config.ARCHIVE_BATCH_SIZE, reo_id=reo_id
+                )
+                total += moved
+                if moved < self.config.ARCHIVE_BATCH_SIZE:
+                    break
+            archived[table] = total
+
+        purged = 0
+        if self.config.ARCHIVE_RETENTION_DAYS is not None:
+            purged = await self.repository.purge(older_than=now - timedelta(days=self.config.ARCHIVE_RETENTION_DAYS))
+
+        return ArchiveRunResponse(archived=archived, purged=purged)
+
+    async def run_periodically(self) -> None:
+        """Фоновый цикл архивации; ошибка одного прогона не останавливает следующие."""
+        while True:
+            try:
+                result = await self.run_retention()
+                logger.info(f"Archive run finished: archived={result.archived}, purged={result.purged}")
+            except Exception:
+                logger.exception("Archive run failed")
+            await asyncio.sleep(self.config.ARCHIVE_INTERVAL_SECONDS)
+
+    async def restore(self, user: UserOutputSchema, data: ArchiveRestoreRequest) -> ArchiveRestoreResponse:
+        """Возвращает архивные строки в их таблицы под прежними id; строки остаются неактивными."""
+        restored = await self.repository.restore(table=data.table_name, record_ids=data.record_ids, user_id=user.id)
+        if not restored:
+            raise ObjectNotFound(model_name="ArchivedRecord", id_=data.record_ids)
+        return ArchiveRestoreResponse(restored=restored)
+
+    async def get_all_archived_records(
+        self, user: UserOutputSchema, filters: ArchivedRecordFilter, cursor: str | None, limit: int
+    ) -> CursorPage[ArchivedRecordResponse]:
+        records = await self.repository.get_all(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(records, limit=limit, schema=ArchivedRecordResponse)
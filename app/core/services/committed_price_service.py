@@ -1,13 +1,113 @@
-from app.core.exceptions import ObjectNotFound, ValidationException
+from typing import Any, ClassVar
+
+from app.core.exceptions import CommittedSnapshotIntegrityException, ObjectNotFound, ValidationException
 from app.core.interfaces.committed_prices_repository import CommittedPricesRepositoryInterface
-from app.core.schemas.committed_price_schemas import BulkCommittedPricesCreate, CommittedPricesResponse
+from app.core.interfaces.committed_snapshot_repository import CommittedSnapshotRepositoryInterface
+from app.core.interfaces.export_cache import ExportCacheInterface
+from app.core.schemas.calculation_schemas import CommittedPremiseWithCalculation, PremisesContext
+from app.core.schemas.committed_price_schemas import (
+    BulkCommittedPricesCreate,
+    CommittedPremisePriceResponse,
+    CommittedPricesFilter,
+    CommittedPricesResponse,
+    CommittedSnapshotResponse,
+)
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
+from app.core.schemas.premise_schemas import PremisesFileSpecificationResponse, PremisesResponse
+from app.core.schemas.user_schemas import UserOutputSchema
+from app.core.utils.snapshot_codec import calculation_column, pack_calculation, unpack_calculation
 
 
 class CommittedPricesService:
-    def __init__(self, repository: CommittedPricesRepositoryInterface):
+    # Поля помещения, которые снимок хранит как закоммиченные: из них строится экспорт
+    SNAPSHOT_PREMISE_FIELDS: ClassVar[list[str]] = list(PremisesFileSpecificationResponse.model_fields)
+
+    def __init__(
+        self,
+        repository: CommittedPricesRepositoryInterface,
+        snapshot_repository: CommittedSnapshotRepositoryInterface,
+        export_cache: ExportCacheInterface,
+    ):
         self.repository = repository
+        self.snapshot_repository = snapshot_repository
+        self.export_cache = export_cache
 
     async def create_committed_price(self, data: BulkCommittedPricesCreate) -> list[CommittedPricesResponse]:
+        reo_id = await self._validate_commit(data)
+
+        if all(cp.is_active for cp in data.commited_prices):
+            await self.repository.deactivate_active_prices(reo_id=reo_id)
+            await self.snapshot_repository.deactivate_active_snapshots(reo_id=reo_id)
+
+        committed_data = [cp.model_dump() for cp in data.commited_prices]
+
+        committed_prices = await self.repository.create_bulk_committed_prices(data=committed_data, reo_id=reo_id)
+        # Exports of the previous commit are keyed by it and would never be requested again
+        await self.export_cache.invalidate(reo_id=reo_id)
+        return [CommittedPricesResponse.model_validate(price) for price in committed_prices]
+
+    async def create_committed_snapshot(self, data: BulkCommittedPricesCreate) -> CommittedSnapshotResponse:
+        """
+        Сохраняет коммит одной строкой-снимком: массивы id помещений, цен и x_rank, упакованная
+        матрица расчета и поля помещений для экспорта по столбцам, в том виде, в каком их закоммитили.
+        Расчет без какого-либо поля отклоняется: подставленный ноль нельзя отличить от настоящего.
+        """
+        reo_id = await self._validate_commit(data)
+        is_active = all(cp.is_active for cp in data.commited_prices)
+
+        if is_active:
+            await self.repository.deactivate_active_prices(reo_id=reo_id)
+            await self.snapshot_repository.deactivate_active_snapshots(reo_id=reo_id)
+
+        fields = list(PremisesContext.model_fields)
+        premise_ids, calculation_rows = [], []
+        premise_columns: dict[str, list] = {field: [] for field in self.SNAPSHOT_PREMISE_FIELDS}
+        for cp in data.commited_prices:
+            premise_id = cp.content.get("id")
+            if not isinstance(premise_id, int):
+                raise ValidationException("Кожен об'єкт повинен містити content.id приміщення")
+            premise_ids.append(premise_id)
+            calculation_rows.append(self._calculation_row(premise_id, cp.content.get("calculation"), fields))
+            for field, values in premise_columns.items():
+                values.append(cp.content.get(field))
+
+        first = data.commited_prices[0]
+        snapshot = await self.snapshot_repository.create(
+            data={
+                "reo_id": reo_id,
+                "pricing_config_id": first.pricing_config_id,
+                "distribution_config_id": first.distribution_config_id,
+                "is_active": is_active,
+                "premises_count": len(premise_ids),
+                "premise_ids": premise_ids,
+                "actual_prices": [cp.actual_price for cp in data.commited_prices],
+                "x_ranks": [cp.x_rank for cp in data.commited_prices],
+                "calculation_fields": fields,
+                "calculation": pack_calculation(calculation_rows, fields),
+                "premise_columns": premise_columns,
+            }
+        )
+        await self.export_cache.invalidate(reo_id=reo_id)
+        return CommittedSnapshotResponse.model_validate(snapshot)
+
+    @staticmethod
+    def _calculation_row(premise_id: int, calculation: Any, fields: list[str]) -> list[float]:
+        """Вектор расчета помещения в порядке fields; каждое поле обязано быть числом."""
+        if not isinstance(calculation, dict):
+            raise ValidationException(f"Приміщення {premise_id}: content.calculation відсутній")
+        missing = [field for field in fields if calculation.get(field) is None]
+        if missing:
+            raise ValidationException(f"Приміщення {premise_id}: у розрахунку відсутні поля {', '.join(missing)}")
+        try:
+            return [float(calculation[field]) for field in fields]
+        except (TypeError, ValueError):
+            raise ValidationException(f"Приміщення {premise_id}: поля розрахунку повинні бути числами")
+
+    async def _validate_commit(self, data: BulkCommittedPricesCreate) -> int:
+        """Проверяет, что все строки коммита относятся к одним конфигам и REO; возвращает reo_id."""
+        if not data.commited_prices:
+            raise ValidationException("Список commited_prices не може бути порожнім")
+
         distribution_config_ids = [
             cp.distribution_config_id for cp in data.commited_prices if cp.distribution_config_id
         ]
@@ -35,13 +135,43 @@ class CommittedPricesService:
         if not reo_id:
             raise ObjectNotFound(model_name="RealEstateObject", id_=reo_ids[0])
 
-        if all(cp.is_active for cp in data.commited_prices):
-            await self.repository.deactivate_active_prices(reo_id=reo_ids[0])
+        return reo_ids[0]
 
-        committed_data = [cp.model_dump() for cp in data.commited_prices]
+    async def get_committed_snapshot(self, id: int) -> CommittedSnapshotResponse:
+        snapshot = await self.snapshot_repository.get(id=id)
+        if not snapshot:
+            raise ObjectNotFound(model_name="CommittedSnapshot", id_=id)
+        return CommittedSnapshotResponse.model_validate(snapshot)
 
-        committed_prices = await self.repository.create_bulk_committed_prices(data=committed_data, reo_id=reo_ids[0])
-        return [CommittedPricesResponse.model_validate(price) for price in committed_prices]
+    async def get_committed_snapshot_premises(self, id: int) -> list[CommittedPremiseWithCalculation]:
+        """Построчное представление снимка: помещения по id, дополненные закоммиченным расчетом."""
+        snapshot = await self.snapshot_repository.get(id=id)
+        if not snapshot:
+            raise ObjectNotFound(model_name="CommittedSnapshot", id_=id)
+
+        premises = {
+            premise.id: premise for premise in await self.snapshot_repository.get_premises(snapshot.premise_ids)
+        }
+        missing = [premise_id for premise_id in snapshot.premise_ids if premise_id not in premises]
+        if missing:
+            raise CommittedSnapshotIntegrityException(snapshot_id=id, missing_premise_ids=missing)
+        fields = snapshot.calculation_fields
+        matrix = unpack_calculation(snapshot.calculation, fields)
+
+        result = []
+        for index, premise_id in enumerate(snapshot.premise_ids):
+            premise_data = PremisesResponse.model_validate(premises[premise_id]).model_dump()
+            result.append(
+                CommittedPremiseWithCalculation.model_validate(
+                    {
+                        **premise_data,
+                        "calculation": dict(zip(fields, matrix[index].tolist())),
+                        "actual_price": snapshot.actual_prices[index],
+                        "x_rank": snapshot.x_ranks[index],
+                    }
+                )
+            )
+        return result
 
     async def get_committed_price(self, id: int) -> CommittedPricesResponse:
         committed_price = await self.repository.get(id=id)
@@ -49,6 +179,39 @@ class CommittedPricesService:
             raise ObjectNotFound(model_name="CommittedPrices", id_=id)
         return CommittedPricesResponse.model_validate(committed_price)
 
-    async def get_all_committed_prices(self) -> list[CommittedPricesResponse]:
-        prices = await self.repository.get_all_committed_prices()
-        return [CommittedPricesResponse.model_validate(price) for price in prices]
+    async def get_actual_prices_per_sqm(
+        self, reo_id: int, distribution_config_id: int, premise_ids: list[int] | None = None
+    ) -> list[CommittedPremisePriceResponse]:
+        """
+        Цены за м² активного коммита. Колоночный снимок читается одним столбцом матрицы расчета,
+        для старых построчных коммитов значения извлекаются из content на стороне БД.
+        """
+        snapshot = await self.snapshot_repository.get_active(
+            reo_id=reo_id, distribution_config_id=distribution_config_id
+        )
+        if snapshot:
+            prices = calculation_column(snapshot.calculation, snapshot.calculation_fields, "actual_price_per_sqm")
+            wanted = set(premise_ids) if premise_ids is not None else None
+            return [
+                CommittedPremisePriceResponse(premise_id=premise_id, actual_price_per_sqm=price)
+                for premise_id, price in zip(snapshot.premise_ids, prices.tolist())
+                if wanted is None or premise_id in wanted
+            ]
+
+        rows = await self.repository.get_actual_prices_per_sqm(
+            reo_id=reo_id, distribution_config_id=distribution_config_id, premise_ids=premise_ids
+        )
+        if not rows:
+            raise ObjectNotFound(
+                model_name="CommittedPrices",
+                id_=f"reo_id={reo_id}, distribution_config_id={distribution_config_id}",
+            )
+        return [CommittedPremisePriceResponse.model_validate(row) for row in rows]
+
+    async def get_all_committed_prices(
+        self, user: UserOutputSchema, filters: CommittedPricesFilter, cursor: str | None, limit: int
+    ) -> CursorPage[CommittedPricesResponse]:
+        prices = await self.repository.get_all_committed_prices(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(prices, limit=limit, schema=CommittedPricesResponse)
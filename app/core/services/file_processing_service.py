@@ -1,23 +1,54 @@
-import pandas as pd
-from app.core.exceptions.domain import DataValidationException, MissingRequiredColumnsException, ObjectNotFound
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, ClassVar, Iterator, Optional
+
+from app.core.exceptions.domain import ObjectNotFound
 from app.core.interfaces.committed_prices_repository import CommittedPricesRepositoryInterface
+from app.core.interfaces.committed_snapshot_repository import CommittedSnapshotRepositoryInterface
 from app.core.interfaces.distribution_configs_repository import DistributionConfigsRepositoryInterface
+from app.core.interfaces.export_cache import ExportCacheInterface
 from app.core.interfaces.file_processing import FileProcessingInterface
 from app.core.interfaces.premises_repository import PremisesRepositoryInterface
 from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
-from app.core.schemas.calculation_schemas import PremisesWithCalculation
-from app.core.schemas.income_plan_schemas import IncomePlanFileResponse
+from app.core.schemas.file_processing_schemas import FileProcessingMetricsResponse
 from app.core.schemas.premise_schemas import PremisesFileSpecificationCreate, PremisesFileSpecificationResponse
+from app.core.utils.enums import ExportFormat
+from app.core.utils.file_executor import FileProcessingExecutor
+from app.core.utils.snapshot_codec import calculation_column
+from app.core.utils.specification_validation import (
+    FIRST_DATA_ROW,
+    INCOME_PLAN_RULES,
+    SPECIFICATION_RULES,
+    PreparedSpecification,
+    RowErrorCollector,
+    SchemaPlan,
+    compile_schema_plan,
+    validate_income_plan,
+    validate_specification,
+)
+from app.settings import FileProcessingSettings
 
 
 class FileProcessingService:
     """
-    Service for processing uploaded files (Excel specifications, income plans, etc.).
+    Service for processing uploaded files (Excel, CSV or Parquet specifications, income plans, etc.).
 
     This service contains all business logic for file processing, following the onion architecture pattern.
     It coordinates between the API layer and infrastructure layer while maintaining business rules.
     """
 
+    # Premise fields read from committed snapshot content for the Excel export
+    EXPORT_CONTENT_FIELDS: ClassVar[list[str]] = list(PremisesFileSpecificationResponse.model_fields)
+    # Export header: column title -> field, in the order PremisesFileSpecificationCreate dumps them by alias
+    EXPORT_HEADER: ClassVar[dict[str, str]] = {
+        info.alias or name: name for name, info in PremisesFileSpecificationCreate.model_fields.items()
+    }
+    # Part of the export cache key: bump it when the exported columns or values change,
+    # so that artifacts generated by the previous code are not served
+    EXPORT_LAYOUT_VERSION: ClassVar[int] = 1
+
     def __init__(
         self,
         file_processor: FileProcessingInterface,
@@ -25,22 +56,45 @@ class FileProcessingService:
         reo_repository: RealEstateObjectRepositoryInterface,
         premises_repository: PremisesRepositoryInterface,
         committed_prices_repository: CommittedPricesRepositoryInterface,
+        committed_snapshot_repository: CommittedSnapshotRepositoryInterface,
+        config: FileProcessingSettings,
+        executor: FileProcessingExecutor,
+        export_cache: ExportCacheInterface,
     ):
         """
         Initialize the file processing service.
 
         Args:
             file_processor: Implementation of FileProcessingInterface for technical file operations
+            config: File processing settings (batch size of streamed uploads)
+            executor: Bounded worker pool that runs parsing, validation and rendering off the event loop
+            export_cache: Storage of generated export files, keyed by the exported data
         """
         self.file_processor = file_processor
         self.distribution_repository = distribution_repository
         self.reo_repository = reo_repository
         self.premises_repository = premises_repository
         self.committed_prices_repository = committed_prices_repository
+        self.committed_snapshot_repository = committed_snapshot_repository
+        self.config = config
+        self.executor = executor
+        self.export_cache = export_cache
+
+    def get_metrics(self) -> FileProcessingMetricsResponse:
+        """Return timing metrics of the file processing executor and the event loop lag."""
+        return FileProcessingMetricsResponse.model_validate(
+            {
+                "workers": self.executor.max_workers,
+                "capacity": self.executor.capacity,
+                "operations": dict(self.executor.operations),
+                "event_loop_lag": self.executor.loop_lag,
+            },
+            from_attributes=True,
+        )
 
     async def process_specification(
-        self, file_content: bytes, filename: str
-    ) -> list[PremisesFileSpecificationResponse]:
+        self, file_content: bytes, filename: str, reo_id: int, content_type: Optional[str] = None
+    ) -> PreparedSpecification:
         """
         Process uploaded premises specification file.
 
@@ -48,188 +102,362 @@ class FileProcessingService:
         - File format validation
         - Reading file content
         - Column validation
-        - Data validation and transformation
+        - Column-wise data validation and transformation
 
         Args:
             file_content: Raw file content as bytes
             filename: Name of the uploaded file
+            reo_id: Real estate object the premises rows are built for
+            content_type: Content type of the upload, picks the format when the extension does not
 
         Returns:
-            List of validated premises data dictionaries
+            Premises rows for the bulk insert (no per-row model objects) and the upload response records
 
         Raises:
             FileProcessingException: If file processing fails
         """
         # Step 1: Validate file format (business rule)
-        self.file_processor.validate_file_format(filename)
+        self.file_processor.validate_file_format(filename, content_type)
+
+        # Steps 2-4 block on pandas/openpyxl, so they run in the file processing executor
+        return await self.executor.run(
+            "process_specification", self._parse_specification, file_content, filename, reo_id, content_type
+        )
+
+    def _parse_specification(
+        self, file_content: bytes, filename: str, reo_id: int, content_type: Optional[str]
+    ) -> PreparedSpecification:
+        # Step 2: Read file (technical operation)
+        df = self.file_processor.read_file(file_content, filename, content_type)
+
+        # Step 3: Map the header to the upload schema, failing on missing required columns (business rule)
+        plan = compile_schema_plan(tuple(df.columns), SPECIFICATION_RULES)
 
-        # Step 2: Read Excel file (technical operation)
-        df = await self.file_processor.read_excel_file(file_content, filename)
+        # Step 4: Validate data column by column (business logic)
+        return validate_specification(df, plan=plan).prepare(reo_id=reo_id)
+
+    def validate_specification_format(self, filename: str, content_type: Optional[str] = None) -> None:
+        """
+        Check that a specification upload is in a supported format before its content arrives.
+
+        Raises:
+            InvalidFileFormatException: If the format is not supported
+        """
+        self.file_processor.validate_file_format(filename, content_type)
+
+    async def stream_specification(
+        self,
+        file: BinaryIO,
+        filename: str,
+        reo_id: int,
+        content_type: Optional[str] = None,
+        row_errors: Optional[RowErrorCollector] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Process uploaded premises specification file batch by batch.
 
-        # Step 3: Validate required columns (business rule)
-        self._validate_required_columns(df, PremisesFileSpecificationResponse.PREDEFINED_COLUMNS)
+        Same rules as process_specification, but the workbook is streamed in batches of
+        SPECIFICATION_BATCH_SIZE rows and each batch is validated as soon as it is read,
+        so memory stays bounded regardless of file size. Row numbers in errors refer to the file,
+        and duplicate premises_id are detected across batches.
 
-        # Step 4: Process and validate data (business logic)
-        premises_list: list[PremisesFileSpecificationResponse] = []
+        Args:
+            file: Seekable binary file with the workbook
+            filename: Name of the uploaded file
+            reo_id: Real estate object the premises rows are built for
+            content_type: Content type of the upload, picks the format when the extension does not
+            row_errors: When given, invalid and duplicate rows are recorded here and skipped
+                instead of failing the stream
 
-        for i, row in df.iterrows():
-            try:
-                # Validate row data using Pydantic model (business logic)
-                premises_row = PremisesFileSpecificationResponse.custom_model_validate(dict(row))
-                premises_list.append(premises_row)
+        Yields:
+            Premises rows of each validated batch in file order
 
-            except Exception as e:
-                # Extract validation errors for better error reporting
-                error_details = str(e)
-                if hasattr(e, "errors"):
-                    error_details = str(e.errors())
+        Raises:
+            FileProcessingException: If file processing fails; batches yielded before stay valid
+        """
+        self.file_processor.validate_file_format(filename, content_type)
 
-                raise DataValidationException(row_number=i + 2, error_details=error_details)
+        batches = self._parse_specification_batches(file, filename, reo_id, content_type, row_errors)
+        async for batch in self.executor.iterate("stream_specification", batches):
+            yield batch
 
-        return premises_list
+    def _parse_specification_batches(
+        self,
+        file: BinaryIO,
+        filename: str,
+        reo_id: int,
+        content_type: Optional[str],
+        row_errors: Optional[RowErrorCollector],
+    ) -> Iterator[list[dict]]:
+        first_row = FIRST_DATA_ROW
+        seen_premises_ids: set[str] = set()
+        plan: Optional[SchemaPlan] = None
+        batch_size = self.config.SPECIFICATION_BATCH_SIZE
+        for df in self.file_processor.iter_file_batches(file, filename, batch_size, content_type):
+            # All batches share the header, so the schema plan is built from the first one
+            if plan is None:
+                plan = compile_schema_plan(tuple(df.columns), SPECIFICATION_RULES)
+            batch = validate_specification(
+                df, first_row=first_row, seen_premises_ids=seen_premises_ids, row_errors=row_errors, plan=plan
+            )
+            yield batch.to_premises_rows(reo_id=reo_id)
+            first_row += len(df)
 
-    async def process_income_plan(self, file_content: bytes, filename: str) -> list[IncomePlanFileResponse]:
+    async def process_income_plan(
+        self, file_content: bytes, filename: str, reo_id: int, content_type: Optional[str] = None
+    ) -> list[dict]:
         """
         Process uploaded income plan file.
 
         Args:
             file_content: Raw file content as bytes
             filename: Name of the uploaded file
+            reo_id: Real estate object the income plan rows are built for
+            content_type: Content type of the upload, picks the format when the extension does not
 
         Returns:
-            List of validated income plan data dictionaries
+            Active income plan rows for the bulk insert, periods parsed to datetimes
 
         Raises:
-            NotImplementedError: Method not yet implemented
+            FileProcessingException: If file processing fails
         """
         # Step 1: Validate file format (business rule)
-        self.file_processor.validate_file_format(filename)
-
-        # Step 2: Read Excel file (technical operation)
-        df = await self.file_processor.read_excel_file(file_content, filename)
+        self.file_processor.validate_file_format(filename, content_type)
 
-        # Step 3: Validate required columns (business rule)
-        self._validate_required_columns(df, IncomePlanFileResponse.PREDEFINED_COLUMNS)
-
-        income_plans: list[IncomePlanFileResponse] = []
-        for i, row in df.iterrows():
-            try:
-                # Validate row data using Pydantic model (business logic)
-                income_plan_row = IncomePlanFileResponse.model_validate(dict(row))
-                income_plans.append(income_plan_row)
+        return await self.executor.run(
+            "process_income_plan", self._parse_income_plan, file_content, filename, reo_id, content_type
+        )
 
-            except Exception as e:
-                # Extract validation errors for better error reporting
-                error_details = str(e)
-                if hasattr(e, "errors"):
-                    error_details = str(e.errors())
+    def _parse_income_plan(
+        self, file_content: bytes, filename: str, reo_id: int, content_type: Optional[str]
+    ) -> list[dict]:
+        # Step 2: Read file (technical operation)
+        df = self.file_processor.read_file(file_content, filename, content_type)
 
-                raise DataValidationException(row_number=i + 2, error_details=error_details)
+        # Step 3: Map the header to the upload schema, failing on missing required columns (business rule)
+        plan = compile_schema_plan(tuple(df.columns), INCOME_PLAN_RULES)
 
-        return income_plans
+        # Step 4: Validate data column by column (business logic)
+        return validate_income_plan(df, plan=plan).to_income_plan_rows(reo_id=reo_id)
 
-    def _validate_required_columns(self, df: pd.DataFrame, predefined_columns: list[str]) -> None:
+    async def get_export_key(
+        self, reo_id: int, distribution_config_id: int, export_format: ExportFormat = ExportFormat.XLSX
+    ) -> "ExportKey":
         """
-        Validate that all required columns are present in the DataFrame.
+        Identify the export of committed prices without generating it.
 
-        This is a business rule that defines which columns must be present
-        in premises specification files.
-
-        Args:
-            df: DataFrame to validate
+        The digest covers the active commit (the snapshot ID, or the number and the last ID of legacy
+        per-premise rows), the export format and EXPORT_LAYOUT_VERSION. It changes whenever the content of the file would change,
+        so it serves both as the cache key of the artifact and as its ETag.
 
         Raises:
-            MissingRequiredColumnsException: If required columns are missing
+            ObjectNotFound: If no prices are committed for the REO and distribution config
         """
-        # Clean column names (remove extra whitespace)
-        df.columns = df.columns.str.strip()
-
-        # Check for missing required columns
-        missing_columns = [col for col in predefined_columns if col.strip() not in df.columns]
-
-        if missing_columns:
-            raise MissingRequiredColumnsException(missing_columns)
+        snapshot = await self.committed_snapshot_repository.get_active(
+            reo_id=reo_id, distribution_config_id=distribution_config_id
+        )
+        if snapshot is not None:
+            state: dict[str, Any] = {"snapshot_id": snapshot.id}
+        else:
+            count, last_id = await self.committed_prices_repository.get_active_revision(
+                reo_id=reo_id, distribution_config_id=distribution_config_id
+            )
+            if not count:
+                raise ObjectNotFound(
+                    model_name="CommittedPrices",
+                    id_=f"reo_id={reo_id}, distribution_config_id={distribution_config_id}",
+                )
+            state = {"committed_prices": [count, last_id]}
+
+        state.update(
+            layout=self.EXPORT_LAYOUT_VERSION,
+            format=export_format.value,
+            reo_id=reo_id,
+            distribution_config_id=distribution_config_id,
+        )
+        digest = hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode()).hexdigest()
+        return ExportKey(
+            reo_id=reo_id,
+            distribution_config_id=distribution_config_id,
+            export_format=export_format,
+            digest=digest,
+            snapshot=snapshot,
+        )
 
-    async def generate_excel_with_actual_price(self, reo_id: int, distribution_config_id: int) -> bytes:
+    async def get_export_file(self, key: "ExportKey") -> Path:
         """
-        Generate Excel file with premises data and actual_price_per_sqm from committed prices.
+        Get the export file with premises data and actual_price_per_sqm from committed prices.
+
+        Served from the export cache when an artifact with the same key exists,
+        otherwise generated and stored there first.
 
         Args:
-            reo_id: Real estate object ID
-            distribution_config_id: Distribution config ID
+            key: Export key from get_export_key
 
         Returns:
-            Excel file content as bytes
+            Lease on the cached artifact: it stays readable if the cache is invalidated meanwhile
+            and has to be passed to release_export_file once the file is sent
 
         Raises:
             ObjectNotFound: If premises or committed prices not found
         """
-        # Get committed prices
-        committed_prices = await self.committed_prices_repository.get_by_reo_and_distribution_config(
-            reo_id=reo_id, distribution_config_id=distribution_config_id, is_active=True
-        )
-        if not committed_prices:
-            raise ObjectNotFound(
-                model_name="CommittedPrices",
-                id_=f"reo_id={reo_id}, distribution_config_id={distribution_config_id}",
-            )
+        extension = key.export_format.value
+        path = await self.export_cache.get(key.reo_id, key.distribution_config_id, key.digest, extension)
+        if path is not None:
+            return path
+
+        file = await self._render_export(key)
+        try:
+            return await self.export_cache.store(key.reo_id, key.distribution_config_id, key.digest, extension, file)
+        finally:
+            file.close()
+
+    async def release_export_file(self, path: Path) -> None:
+        """Release a file returned by get_export_file."""
+        await self.export_cache.release(path)
+
+    async def _render_export(self, key: "ExportKey") -> BinaryIO:
+        """
+        Generate the export file.
+
+        Committed rows are read from the database in batches of EXPORT_BATCH_SIZE and appended to a write-only
+        file in the file processing executor, so neither the rows nor the workbook are held in memory.
+        The header has to be written first, so custom columns are collected by a first pass
+        that reads only property_type and customcontent.
 
-        # Parse committed prices using Pydantic models
-        premises_with_calculations: list[PremisesWithCalculation] = []
-        for cp in committed_prices:
-            # cp.content contains the full premise data with calculation
-            content = cp.content if hasattr(cp, "content") else {}
-            if not isinstance(content, dict):
-                continue
-
-            # Validate using PremisesWithCalculation model
-            try:
-                premise_with_calc = PremisesWithCalculation.model_validate(content)
-                premises_with_calculations.append(premise_with_calc)
-            except Exception:
-                continue
-
-        if not premises_with_calculations:
+        Returns:
+            Temporary file with the content, positioned at the start; the caller closes it
+        """
+        reo_id, distribution_config_id, snapshot = key.reo_id, key.distribution_config_id, key.snapshot
+
+        custom_columns: dict[str, None] = {}
+        has_premises = False
+        async for rows in self._iter_export_rows(reo_id, distribution_config_id, snapshot, ["customcontent"]):
+            for premise_data in rows:
+                # Skip snapshot rows whose content is not a premise document
+                if premise_data["property_type"] is None:
+                    continue
+                has_premises = True
+                # Custom content never overrides the exported columns, e.g. a re-uploaded "Actual price per sqm"
+                custom_columns.update(
+                    (column, None)
+                    for column in premise_data["customcontent"] or {}
+                    if column not in self.EXPORT_HEADER
+                )
+        if not has_premises:
             raise ObjectNotFound(
                 model_name="CommittedPrices",
                 id_=f"reo_id={reo_id}, distribution_config_id={distribution_config_id}",
             )
 
-        # Convert to Excel format using PremisesFileSpecificationCreate model
-        rows = []
-        for premise_with_calc in premises_with_calculations:
-            # Unpack premise data (exclude id, reo_id, uploaded, calculation)
-            premise_data = premise_with_calc.model_dump(
-                exclude={"id", "reo_id", "uploaded", "calculation"}, exclude_none=False
-            )
-
-            # Convert entrance from str to int if possible
-            if isinstance(premise_data["entrance"], str) and premise_data["entrance"].isdigit():
-                premise_data["entrance"] = int(premise_data["entrance"])
-
-            # Convert studio from bool to "Yes"/"No"
-            premise_data["studio"] = "Yes" if premise_data["studio"] else "No"
-
-            # Add actual_price_per_sqm from calculation
-            if premise_with_calc.calculation and premise_with_calc.calculation.actual_price_per_sqm is not None:
-                premise_data["actual_price_per_sqm"] = premise_with_calc.calculation.actual_price_per_sqm
-
-            # Create PremisesFileSpecificationCreate instance using model_construct
-            # to work with field names (not aliases) directly
-            premise_spec = PremisesFileSpecificationCreate.model_construct(**premise_data)
-
-            # Convert to dict with aliases for Excel and add custom content
-            premise_dict = premise_spec.model_dump(by_alias=True, exclude_none=False)
-
-            # Add custom content if exists
-            if premise_with_calc.customcontent:
-                premise_dict.update(premise_with_calc.customcontent)
-
-            rows.append(premise_dict)
-
-        # Create DataFrame
-        df = pd.DataFrame(rows)
+        writer = await self.executor.run(
+            "render_export", self.file_processor.open_writer, [*self.EXPORT_HEADER, *custom_columns], key.filename
+        )
+        try:
+            async for rows in self._iter_export_rows(
+                reo_id, distribution_config_id, snapshot, self.EXPORT_CONTENT_FIELDS
+            ):
+                values = [
+                    self._export_row(premise_data, custom_columns)
+                    for premise_data in rows
+                    if premise_data["property_type"] is not None
+                ]
+                await self.executor.run("render_export", writer.write_rows, values)
+            return await self.executor.run("render_export", writer.close)
+        except BaseException:
+            writer.discard()
+            raise
+
+    async def _iter_export_rows(
+        self, reo_id: int, distribution_config_id: int, snapshot: Any, fields: list[str]
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Committed rows of the export in batches of EXPORT_BATCH_SIZE, in commit order.
 
-        # Generate Excel file
-        excel_bytes = await self.file_processor.write_excel_file(df)
-        return excel_bytes
+        Each row has the requested premise fields plus property_type and actual_price_per_sqm.
+        For a columnar snapshot the fields are sliced from the premise columns stored with it and the price
+        is taken as a single column of the packed calculation matrix; legacy per-premise commits are paged
+        by record ID and the fields are extracted on the database side.
+        """
+        fields = list(dict.fromkeys(["property_type", *fields]))
+        batch_size = self.config.EXPORT_BATCH_SIZE
+
+        if snapshot is None:
+            after_id = None
+            while True:
+                rows = await self.committed_prices_repository.get_content_fields(
+                    reo_id=reo_id,
+                    distribution_config_id=distribution_config_id,
+                    fields=fields,
+                    after_id=after_id,
+                    limit=batch_size,
+                )
+                if rows:
+                    yield rows
+                if len(rows) < batch_size:
+                    return
+                after_id = rows[-1]["committed_price_id"]
+
+        prices = calculation_column(snapshot.calculation, snapshot.calculation_fields, "actual_price_per_sqm")
+        columns = snapshot.premise_columns
+        for start in range(0, len(snapshot.premise_ids), batch_size):
+            end = start + batch_size
+            yield [
+                {field: columns[field][index] for field in fields} | {"actual_price_per_sqm": price}
+                for index, price in enumerate(prices[start:end].tolist(), start)
+            ]
+
+    def _export_row(self, premise_data: dict, custom_columns: dict[str, None]) -> list[Any]:
+        """Values of one premise in the order of the export header."""
+        customcontent = premise_data["customcontent"] or {}
+
+        # Keep the sold price logic of PremisesWithCalculation
+        if premise_data["status"] == "sold":
+            for key in ("full_price", "sales_amount"):
+                if premise_data[key] is not None:
+                    premise_data[key] = 0.0
+            premise_data["actual_price_per_sqm"] = 0.0
+
+        # Convert entrance from str to int if possible
+        if isinstance(premise_data["entrance"], str) and premise_data["entrance"].isdigit():
+            premise_data["entrance"] = int(premise_data["entrance"])
+
+        # Convert studio from bool to "Yes"/"No"
+        premise_data["studio"] = "Yes" if premise_data["studio"] else "No"
+
+        # customcontent itself is exported as its text as well, like the previous DataFrame-based export
+        return [premise_data.get(field) for field in self.EXPORT_HEADER.values()] + [
+            customcontent.get(key) for key in custom_columns
+        ]
+
+
+@dataclass
+class ExportKey:
+    """Identity of one export of committed prices, see FileProcessingService.get_export_key."""
+
+    reo_id: int
+    distribution_config_id: int
+    export_format: ExportFormat
+    digest: str
+    # Active committed snapshot the export is built from; None for legacy per-premise commits
+    snapshot: Any
+
+    MEDIA_TYPES: ClassVar[dict[ExportFormat, str]] = {
+        ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ExportFormat.CSV: "text/csv; charset=utf-8",
+    }
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    @property
+    def media_type(self) -> str:
+        return self.MEDIA_TYPES[self.export_format]
+
+    @property
+    def filename(self) -> str:
+        return (
+            f"premises_with_actual_price_reo_{self.reo_id}_dist_{self.distribution_config_id}"
+            f".{self.export_format.value}"
+        )
@@ -2,7 +2,13 @@ from app.core.exceptions import ObjectNotFound, ValidationException
 from app.core.exceptions.domain import IncomePlanRequiredException
 from app.core.interfaces.income_plans_repository import IncomePlanRepositoryInterface
 from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
-from app.core.schemas.income_plan_schemas import BulkIncomePlanCreate, IncomePlanCreate, IncomePlanResponse
+from app.core.schemas.income_plan_schemas import (
+    BulkIncomePlanCreate,
+    IncomePlanCreate,
+    IncomePlanFilter,
+    IncomePlanResponse,
+)
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
 from app.core.schemas.user_schemas import UserOutputSchema
 
 
@@ -12,6 +18,7 @@ class IncomePlanService:
         self.reo_repository = reo_repository
 
     async def get_active_plan_by_reo_id(self, reo_id: int) -> list[IncomePlanResponse]:
+        """Активные планы объекта в порядке period_begin."""
         income_plans = await self.repository.get_active_plan_by_reo_id(reo_id=reo_id)
         if not income_plans:
             raise IncomePlanRequiredException(
@@ -36,8 +43,17 @@ class IncomePlanService:
             raise ObjectNotFound(model_name="RealEstateObject", id_=reo_id)
         plans_data = [plan.model_dump() for plan in request.plans]
 
-        await self.repository.deactivate_active_plans(reo_id=reo.id)
-        income_plans = await self.repository.create_bulk_income_plans(data=plans_data, reo_id=reo.id)
+        income_plans = await self.repository.replace_active_plans(reo_id=reo.id, data=plans_data)
+        return [IncomePlanResponse.model_validate(plan) for plan in income_plans]
+
+    async def replace_active_plans(
+        self, reo_id: int, rows: list[dict], user: UserOutputSchema
+    ) -> list[IncomePlanResponse]:
+        """Заменяет активные планы объекта строками загруженного файла одним bulk insert."""
+        reo = await self.reo_repository.get(id=reo_id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=reo_id)
+        income_plans = await self.repository.replace_active_plans(reo_id=reo.id, data=rows)
         return [IncomePlanResponse.model_validate(plan) for plan in income_plans]
 
     async def create(self, data: IncomePlanCreate) -> IncomePlanResponse:
@@ -57,9 +73,13 @@ class IncomePlanService:
 
         return IncomePlanResponse.model_validate(plan)
 
-    async def get_all(self) -> list[IncomePlanResponse]:
-        plans = await self.repository.get_all()
-        return [IncomePlanResponse.model_validate(plan) for plan in plans]
+    async def get_all(
+        self, user: UserOutputSchema, filters: IncomePlanFilter, cursor: str | None, limit: int
+    ) -> CursorPage[IncomePlanResponse]:
+        plans = await self.repository.get_all(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(plans, limit=limit, schema=IncomePlanResponse)
 
     async def update(self, id: int, data: IncomePlanCreate) -> IncomePlanResponse:
         plan = await self.repository.get(plan_id=id)
@@ -1,4 +1,7 @@
+from typing import AsyncIterator, BinaryIO
+
 from app.core.exceptions import ObjectNotFound
+from app.core.interfaces.attachment_storage import AttachmentStorageInterface
 from app.core.interfaces.layout_type_attachment_repository import PremisesAttachmentRepositoryInterface
 from app.core.schemas.premise_schemas import (
     LayoutTypeAttachmentCreate,
@@ -12,8 +15,30 @@ from app.core.schemas.premise_schemas import (
 
 class PremisesAttachmentService:
 
-    def __init__(self, repository: PremisesAttachmentRepositoryInterface):
+    def __init__(self, repository: PremisesAttachmentRepositoryInterface, storage: AttachmentStorageInterface):
         self.repository = repository
+        self.storage = storage
+
+    async def store_file(self, source: BinaryIO) -> tuple[str, int]:
+        """Сохраняет содержимое файла в хранилище и возвращает (content_hash, размер в байтах)."""
+        return await self.storage.save(source)
+
+    def iter_file(self, content_hash: str) -> AsyncIterator[bytes]:
+        return self.storage.iter_chunks(content_hash)
+
+    async def _release_blob(self, content_hash: str | None) -> None:
+        """Удаляет файл из хранилища, если на него больше не ссылается ни одно вложение."""
+        if not content_hash:
+            return
+        async with self.repository.content_hash_lock(content_hash):
+            if not await self.repository.is_content_hash_referenced(content_hash=content_hash):
+                await self.storage.delete(content_hash)
+
+    async def _restore_blob(self, content_hash: str, source: BinaryIO) -> None:
+        """Сохраняет файл повторно, если его удалили между загрузкой и блокировкой хэша."""
+        if not await self.storage.exists(content_hash):
+            source.seek(0)
+            await self.storage.save(source)
 
     async def get(self, id: int) -> LayoutTypeAttachmentResponse:
         attachment = await self.repository.get(id=id)
@@ -46,17 +71,27 @@ class PremisesAttachmentService:
         return LayoutTypeAttachmentResponse.model_validate(attachment)
 
     async def update_or_create_layout_type(
-        self, reo_id: int, layout_type: str, data: LayoutTypeAttachmentCreate
+        self, reo_id: int, layout_type: str, data: LayoutTypeAttachmentCreate, source: BinaryIO
     ) -> LayoutTypeAttachmentResponse:
-        """Обновляет существующую запись или создает новую по reo_id и layout_type."""
-        existing = await self.repository.get_by_reo_id_and_layout_type(reo_id=reo_id, layout_type=layout_type)
-        if existing:
-            update_data = LayoutTypeAttachmentUpdate(**data.model_dump())
-            attachment = await self.repository.update(
-                attachment=existing, data=update_data.model_dump(exclude_unset=True)
-            )
-        else:
-            attachment = await self.repository.create_layout_type(data.model_dump())
+        """
+        Обновляет существующую запись или создает новую по reo_id и layout_type.
+        source - загруженный файл, из него восстанавливается блоб, если его успели удалить.
+        """
+        previous_hash = None
+        async with self.repository.content_hash_lock(data.content_hash):
+            await self._restore_blob(data.content_hash, source)
+            existing = await self.repository.get_by_reo_id_and_layout_type(reo_id=reo_id, layout_type=layout_type)
+            if existing:
+                previous_hash = existing.content_hash
+                update_data = LayoutTypeAttachmentUpdate(**data.model_dump())
+                attachment = await self.repository.update(
+                    attachment=existing, data=update_data.model_dump(exclude_unset=True)
+                )
+            else:
+                attachment = await self.repository.create_layout_type(data.model_dump())
+        # Старый хэш освобождается после снятия блокировки нового, чтобы не держать две блокировки сразу
+        if previous_hash != attachment.content_hash:
+            await self._release_blob(previous_hash)
         return LayoutTypeAttachmentResponse.model_validate(attachment)
 
     async def delete_layout_type(self, reo_id: int, layout_type: str) -> None:
@@ -67,6 +102,21 @@ class PremisesAttachmentService:
             raise ObjectNotFound(model_name="LayoutTypeAttachment", id_=layout_type)
 
         await self.repository.delete(attachment=attachment_existing)
+        await self._release_blob(attachment_existing.content_hash)
+
+    async def get_layout_type(self, reo_id: int, layout_type: str) -> LayoutTypeAttachmentResponse:
+        attachment = await self.repository.get_by_reo_id_and_layout_type(reo_id=reo_id, layout_type=layout_type)
+        if not attachment:
+            raise ObjectNotFound(model_name="LayoutTypeAttachment", id_=layout_type)
+        return LayoutTypeAttachmentResponse.model_validate(attachment)
+
+    async def get_window_view(self, reo_id: int, view_from_window: str) -> WindowViewAttachmentResponse:
+        attachment = await self.repository.get_by_reo_id_and_window_view(
+            reo_id=reo_id, view_from_window=view_from_window
+        )
+        if not attachment:
+            raise ObjectNotFound(model_name="WindowViewAttachment", id_=view_from_window)
+        return WindowViewAttachmentResponse.model_validate(attachment)
 
     async def delete_view_from_window(self, reo_id: int, view_from_window: str) -> None:
         attachment_existing = await self.repository.get_by_reo_id_and_window_view(
@@ -76,19 +126,29 @@ class PremisesAttachmentService:
             raise ObjectNotFound(model_name="WindowViewAttachment", id_=view_from_window)
 
         await self.repository.delete(attachment=attachment_existing)
+        await self._release_blob(attachment_existing.content_hash)
 
     async def update_or_create_window_view(
-        self, reo_id: int, view_from_window: str, data: WindowViewAttachmentCreate
+        self, reo_id: int, view_from_window: str, data: WindowViewAttachmentCreate, source: BinaryIO
     ) -> WindowViewAttachmentResponse:
-        """Обновляет существующую запись или создает новую по reo_id и view_from_window."""
-        existing = await self.repository.get_by_reo_id_and_window_view(
-            reo_id=reo_id, view_from_window=view_from_window
-        )
-        if existing:
-            update_data = WindowViewAttachmentUpdate(**data.model_dump())
-            attachment = await self.repository.update(
-                attachment=existing, data=update_data.model_dump(exclude_unset=True)
+        """
+        Обновляет существующую запись или создает новую по reo_id и view_from_window.
+        source - загруженный файл, из него восстанавливается блоб, если его успели удалить.
+        """
+        previous_hash = None
+        async with self.repository.content_hash_lock(data.content_hash):
+            await self._restore_blob(data.content_hash, source)
+            existing = await self.repository.get_by_reo_id_and_window_view(
+                reo_id=reo_id, view_from_window=view_from_window
             )
-        else:
-            attachment = await self.repository.create_window_view(data.model_dump())
+            if existing:
+                previous_hash = existing.content_hash
+                update_data = WindowViewAttachmentUpdate(**data.model_dump())
+                attachment = await self.repository.update(
+                    attachment=existing, data=update_data.model_dump(exclude_unset=True)
+                )
+            else:
+                attachment = await self.repository.create_window_view(data.model_dump())
+        if previous_hash != attachment.content_hash:
+            await self._release_blob(previous_hash)
         return WindowViewAttachmentResponse.model_validate(attachment)
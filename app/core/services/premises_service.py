@@ -1,11 +1,13 @@
+from typing import AsyncIterator
+
 from app.core.exceptions import ObjectNotFound, ValidationException
-from app.core.exceptions.domain import DuplicatePremisesIdException
 from app.core.interfaces.premises_repository import PremisesRepositoryInterface
 from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
 from app.core.schemas.premise_schemas import (
     BulkPremisesCreateRequest,
     PremisesCreate,
-    PremisesFileSpecificationResponse,
+    PremisesFilter,
     PremisesResponse,
     PremisesUpdate,
 )
@@ -17,23 +19,19 @@ class PremisesService:
         self.repository = repository
         self.reo_repository = reo_repository
 
-    async def check_unique_premises_id(self, premises: list[PremisesFileSpecificationResponse]) -> None:
-        duplicates: set[str] = set()
-        seen: set[str] = set()
-
-        for premise in premises:
-            premises_id = premise.premises_id
-
-            if premises_id is None:
-                continue
-
-            if premises_id in seen:
-                duplicates.add(premises_id)
-            else:
-                seen.add(premises_id)
+    async def replace_active_premises(self, reo_id: int, rows: list[dict], user: UserOutputSchema) -> int:
+        reo = await self.reo_repository.get(id=reo_id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=reo_id)
+        return await self.repository.replace_active_premises(reo_id=reo.id, data=rows)
 
-        if duplicates:
-            raise DuplicatePremisesIdException(premises_ids=sorted(duplicates))
+    async def replace_active_premises_in_batches(
+        self, reo_id: int, batches: AsyncIterator[list[dict]], user: UserOutputSchema
+    ) -> int:
+        reo = await self.reo_repository.get(id=reo_id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=reo_id)
+        return await self.repository.replace_active_premises_in_batches(reo_id=reo.id, batches=batches)
 
     async def create_bulk_premises(
         self, data: BulkPremisesCreateRequest, user: UserOutputSchema
@@ -61,9 +59,13 @@ class PremisesService:
             raise ObjectNotFound(model_name="Premises", id_=id)
         return PremisesResponse.model_validate(premises)
 
-    async def get_all(self) -> list[PremisesResponse]:
-        premises_list = await self.repository.get_all()
-        return [PremisesResponse.model_validate(premises) for premises in premises_list]
+    async def get_all(
+        self, user: UserOutputSchema, filters: PremisesFilter, cursor: str | None, limit: int
+    ) -> CursorPage[PremisesResponse]:
+        premises_list = await self.repository.get_all(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(premises_list, limit=limit, schema=PremisesResponse)
 
     async def update(self, id: int, data: PremisesUpdate) -> PremisesResponse:
         premises = await self.repository.get(id=id)
@@ -1,21 +1,34 @@
+import asyncio
 import copy
-from datetime import datetime
+import random
+from typing import ClassVar
 
-from app.core.exceptions import ObjectNotFound
+from app.core.exceptions import ObjectNotFound, PricingConfigConflictException
 from app.core.interfaces.pricing_config_repository import PricingConfigRepositoryInterface
+from app.core.interfaces.reo_summary_repository import ReoSummaryRepositoryInterface
 from app.core.schemas.distribution_config_schemas import DistributionConfigResponse
 from app.core.schemas.income_plan_schemas import IncomePlanResponse
-from app.core.schemas.premise_schemas import PremisesCreate
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
 from app.core.schemas.pricing_config_schemas import (
     PricingConfigCreate,
+    PricingConfigFilter,
     PricingConfigResponse,
     PricingConfigUpdate,
 )
+from app.core.schemas.real_estate_object_schemas import ReoPremisesSummaryResponse
+from app.core.schemas.user_schemas import UserOutputSchema
 
 
 class PricingConfigService:
-    def __init__(self, repository: PricingConfigRepositoryInterface):
+    # Сколько раз пересчитываются изменения от агентов, если конфиг меняется между чтением и записью
+    PATCH_ATTEMPTS: ClassVar[int] = 5
+    PATCH_RETRY_DELAY: ClassVar[float] = 0.05
+
+    def __init__(
+        self, repository: PricingConfigRepositoryInterface, summary_repository: ReoSummaryRepositoryInterface
+    ):
         self.repository = repository
+        self.summary_repository = summary_repository
 
     async def create_pricing_config(self, data: PricingConfigCreate) -> PricingConfigResponse:
         if data.is_active:
@@ -37,9 +50,22 @@ class PricingConfigService:
 
         return PricingConfigResponse.model_validate(pricing_config)
 
-    async def get_all_pricing_configs(self) -> list[PricingConfigResponse]:
-        pricing_configs = await self.repository.get_all()
-        return [PricingConfigResponse.model_validate(config) for config in pricing_configs]
+    async def get_ranging_for_factor(self, reo_id: int, factor: str) -> dict:
+        """Возвращает ranging одного фактора активного конфига, не загружая весь content."""
+        row = await self.repository.get_ranging_for_factor(reo_id=reo_id, factor=factor)
+        if not row:
+            raise ObjectNotFound(model_name="PricingConfig", id_=reo_id)
+        if row.ranging is None:
+            raise ObjectNotFound(model_name="PricingConfig.ranging", id_=factor)
+        return row.ranging
+
+    async def get_all_pricing_configs(
+        self, user: UserOutputSchema, filters: PricingConfigFilter, cursor: str | None, limit: int
+    ) -> CursorPage[PricingConfigResponse]:
+        pricing_configs = await self.repository.get_all(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(pricing_configs, limit=limit, schema=PricingConfigResponse)
 
     async def update_pricing_config(self, config_id: int, data: PricingConfigUpdate) -> PricingConfigResponse:
         pricing_config = await self.repository.get(plan_id=config_id)
@@ -50,85 +76,88 @@ class PricingConfigService:
         return PricingConfigResponse.model_validate(pricing_config)
 
     async def update_reo_pricing_config(self, reo_id: int, data: dict) -> PricingConfigResponse:
-        is_weighted_factors = "dynamicConfig" in data and isinstance(data.get("dynamicConfig"), dict)
+        return await self.apply_agent_results(reo_id=reo_id, results=[data])
 
-        if is_weighted_factors:
-            return await self._update_reo_pricing_config_weighted_factors(reo_id=reo_id, data=data)
-        return await self._update_reo_pricing_config_ranging(reo_id=reo_id, data=data)
+    async def apply_agent_results(self, reo_id: int, results: list[dict]) -> PricingConfigResponse:
+        """
+        Вносит результаты агентов в активный pricing config, создавая его при отсутствии.
 
-    async def _update_reo_pricing_config_weighted_factors(self, reo_id: int, data: dict) -> PricingConfigResponse:
-        """Обновляет только dynamicConfig.importantFields и dynamicConfig.weights (результат агента weighted factors)."""
-        dconf = data["dynamicConfig"]
-        new_important_fields = dict(dconf.get("importantFields", {}))
-        new_weights = dict(dconf.get("weights", {}))
+        В базу отправляются только изменения: новые ключи ranging и dynamicConfig.importantFields/weights,
+        рассчитанные по прочитанной версии конфига. Если конфиг за это время изменился, изменения
+        пересчитываются заново (до PATCH_ATTEMPTS раз), поэтому одновременные агенты не теряют результаты друг друга.
 
-        pricing_config = await self.repository.get_by_reo_id(reo_id=reo_id)
-        if not pricing_config:
-            content = {
-                "staticConfig": {},
-                "dynamicConfig": {
-                    "importantFields": new_important_fields,
-                    "weights": new_weights,
-                },
-                "ranging": {},
-            }
-            create_data = PricingConfigCreate(
-                is_active=True,
+        Результаты ranging-агентов применяются в переданном порядке, результат weighted factors - последним:
+        его importantFields и weights заменяют веса, которые ranging-агенты добавляют для своих полей.
+        """
+        ordered = sorted(results, key=self._is_weighted_factors)
+
+        for attempt in range(self.PATCH_ATTEMPTS):
+            if attempt:
+                # Случайная пауза разводит повторные попытки агентов, столкнувшихся на одной версии
+                await asyncio.sleep(random.uniform(0, self.PATCH_RETRY_DELAY * attempt))
+            current = await self.repository.get_active_dynamic_config(reo_id=reo_id)
+            if current is None:
+                content = self._merge_agent_results({"staticConfig": {}, "dynamicConfig": {}, "ranging": {}}, ordered)
+                return await self.create_pricing_config(
+                    data=PricingConfigCreate(is_active=True, reo_id=reo_id, content=content)
+                )
+
+            # Копируется только dynamicConfig; ranging собирает лишь ключи из результатов агентов
+            delta = self._merge_agent_results(
+                {"dynamicConfig": copy.deepcopy(current.dynamic_config or {}), "ranging": {}}, ordered
+            )
+            dynamic_config = delta["dynamicConfig"]
+            pricing_config = await self.repository.patch_active_content(
                 reo_id=reo_id,
-                content=content,
+                sections={
+                    "dynamicConfig": {
+                        "importantFields": dynamic_config.get("importantFields", {}),
+                        "weights": dynamic_config.get("weights", {}),
+                    },
+                    "ranging": delta["ranging"],
+                },
+                expected_version=current.version,
             )
-            pricing_config = await self.repository.create(data=create_data.model_dump())
-        else:
-            content = copy.deepcopy(pricing_config.content)
-            if "dynamicConfig" not in content:
-                content["dynamicConfig"] = {}
-            content["dynamicConfig"]["importantFields"] = new_important_fields
-            content["dynamicConfig"]["weights"] = new_weights
-            if "ranging" not in content:
-                content["ranging"] = {}
+            if pricing_config is not None:
+                return PricingConfigResponse.model_validate(pricing_config)
 
-            update_data = PricingConfigUpdate(is_active=True, content=content)
-            pricing_config = await self.repository.update(pricing_config, update_data.model_dump())
+        raise PricingConfigConflictException(reo_id=reo_id)
 
-        return PricingConfigResponse.model_validate(pricing_config)
+    def _merge_agent_results(self, content: dict, ordered: list[dict]) -> dict:
+        for data in ordered:
+            if self._is_weighted_factors(data):
+                self._apply_weighted_factors(content, data)
+            else:
+                self._apply_ranging(content, data)
+        return content
 
-    async def _update_reo_pricing_config_ranging(self, reo_id: int, data: dict) -> PricingConfigResponse:
-        """Обновляет ranging и при необходимости importantFields/weights для одного поля (результат ranging-агентов)."""
-        key = next(iter(data))
-        pricing_config = await self.repository.get_by_reo_id(reo_id=reo_id)
-        if not pricing_config:
-            content = self._build_content_from_keys(key, data)
-            create_data = PricingConfigCreate(
-                is_active=True,
-                reo_id=reo_id,
-                content=content,
-            )
-            pricing_config = await self.repository.create(data=create_data.model_dump())
-        else:
-            content = copy.deepcopy(pricing_config.content)
-
-            if "dynamicConfig" not in content:
-                content["dynamicConfig"] = {}
-            if "importantFields" not in content["dynamicConfig"]:
-                content["dynamicConfig"]["importantFields"] = {}
-            if "weights" not in content["dynamicConfig"]:
-                content["dynamicConfig"]["weights"] = {}
-            if "ranging" not in content:
-                content["ranging"] = {}
+    @staticmethod
+    def _is_weighted_factors(data: dict) -> bool:
+        return "dynamicConfig" in data and isinstance(data.get("dynamicConfig"), dict)
 
-            important_fields = content["dynamicConfig"]["importantFields"]
-            if key not in important_fields or not important_fields[key]:
-                important_fields[key] = True
+    def _apply_weighted_factors(self, content: dict, data: dict) -> None:
+        """Заменяет dynamicConfig.importantFields и dynamicConfig.weights (результат агента weighted factors)."""
+        dconf = data["dynamicConfig"]
+        content.setdefault("dynamicConfig", {})
+        content["dynamicConfig"]["importantFields"] = dict(dconf.get("importantFields", {}))
+        content["dynamicConfig"]["weights"] = dict(dconf.get("weights", {}))
+        content.setdefault("ranging", {})
 
-            if key not in content["dynamicConfig"]["weights"]:
-                content["dynamicConfig"]["weights"] = self._ensure_weight(content["dynamicConfig"]["weights"], key)
+    def _apply_ranging(self, content: dict, data: dict) -> None:
+        """Обновляет ranging и при необходимости importantFields/weights для одного поля (результат ranging-агентов)."""
+        key = next(iter(data))
+        dynamic_config = content.setdefault("dynamicConfig", {})
+        important_fields = dynamic_config.setdefault("importantFields", {})
+        dynamic_config.setdefault("weights", {})
+        content.setdefault("ranging", {})
 
-            content["ranging"][key] = data[key]
+        if key not in important_fields or not important_fields[key]:
+            important_fields[key] = True
 
-            update_data = PricingConfigUpdate(is_active=True, content=content)
-            pricing_config = await self.repository.update(pricing_config, update_data.model_dump())
+        if key not in dynamic_config["weights"]:
+            dynamic_config["weights"] = self._ensure_weight(dynamic_config["weights"], key)
 
-        return PricingConfigResponse.model_validate(pricing_config)
+        content["ranging"][key] = data[key]
 
     def _ensure_weight(self, weights: dict[str, float], key: str) -> dict[str, float]:
         if key in weights:
@@ -145,16 +174,6 @@ class PricingConfigService:
 
         return weights
 
-    def _build_content_from_keys(self, key: str, data: dict) -> dict:
-        return {
-            "staticConfig": {},
-            "dynamicConfig": {
-                "importantFields": {key: True},
-                "weights": {key: 1},
-            },
-            "ranging": data,
-        }
-
     async def delete_pricing_config(self, plan_id: int) -> None:
         pricing_config = await self.repository.get(plan_id=plan_id)
         if not pricing_config:
@@ -164,8 +183,7 @@ class PricingConfigService:
 
     def calculate_current_price_per_sqm(
         self,
-        all_premises: list[PremisesCreate],
-        available_premises: list[PremisesCreate],
+        summary: ReoPremisesSummaryResponse,
         active_plans: list[IncomePlanResponse],
     ) -> float:
         """
@@ -176,32 +194,18 @@ class PricingConfigService:
         - Если нет active_plans: средняя цена из available помещений
 
         Args:
-            all_premises: Все помещения (для расчета soldout)
-            available_premises: Доступные помещения с ценами (для базовой цены)
-            active_plans: Активные планы доходов (опционально)
+            summary: Сводка по активным помещениям объекта (soldout и базовая цена)
+            active_plans: Активные планы доходов (опционально) в порядке period_begin,
+                как их возвращает IncomePlanService.get_active_plan_by_reo_id
 
         Returns:
             float: Рассчитанная цена за м², округленная до 2 знаков
         """
-        prices = [p.price_per_meter for p in available_premises if p.price_per_meter]
-        base_price = sum(prices) / len(prices) if prices else 0.0
-
-        sold_count = sum(1 for p in all_premises if p.status == "sold")
-        total_count = len(all_premises)
-        soldout = sold_count / total_count if total_count > 0 else 0.0
-
-        try:
-            sorted_plans = sorted(
-                active_plans,
-                key=lambda x: (
-                    datetime.fromisoformat(x.period_begin.replace("Z", "+00:00"))
-                    if isinstance(x.period_begin, str)
-                    else (x.period_begin if hasattr(x.period_begin, "isoformat") else datetime.min)
-                ),
-            )
-        except (ValueError, AttributeError):
-            sorted_plans = active_plans
+        base_price = summary.avg_price_per_meter or 0.0
+        soldout = summary.sold_count / summary.premises_count if summary.premises_count > 0 else 0.0
 
+        # Планы уже упорядочены по индексу периодов в базе, повторно не разбираются и не сортируются
+        sorted_plans = active_plans
         plan_count = len(sorted_plans)
         calculated_price = base_price
 
@@ -230,30 +234,32 @@ class PricingConfigService:
     async def sync_pricing_config_after_premises_upload(
         self,
         reo_id: int,
-        premises: list[PremisesCreate],
         active_plans: list[IncomePlanResponse],
         distribution_config: DistributionConfigResponse,
     ) -> PricingConfigResponse:
-        available_premises = [
-            p for p in premises if p.status == "available" and p.price_per_meter is not None and p.price_per_meter > 0
-        ]
+        # Сводка пересчитывается в той же транзакции, что и загрузка помещений
+        summary = await self.summary_repository.get(reo_id=reo_id)
+        if not summary:
+            summary = await self.summary_repository.refresh(reo_id=reo_id)
+        premises_summary = ReoPremisesSummaryResponse.model_validate(summary)
         calculated_current_price = self.calculate_current_price_per_sqm(
-            all_premises=premises,
-            available_premises=available_premises,
-            active_plans=active_plans,
+            summary=premises_summary, active_plans=active_plans
         )
 
-        # Проверяем существование pricing config
-        pricing_config = await self.get_active_pricing_config(reo_id=reo_id)
+        # Текущая цена записывается в staticConfig активного конфига одним UPDATE, без чтения документа
+        pricing_config = await self.repository.patch_active_content(
+            reo_id=reo_id,
+            sections={"staticConfig": {"current_price_per_sqm": round(calculated_current_price, 2)}},
+            expected_version=None,
+        )
 
         if not pricing_config:
             # Создаем новый pricing config
             oversold_method = "pieces"
 
-            # Вычисляем min/max цены из available_premises
-            prices = [p.price_per_meter for p in available_premises if p.price_per_meter]
-            minimum_liq_refusal_price = round(min(prices, default=0), 2)
-            maximum_liq_refusal_price = round(max(prices, default=0), 2)
+            # min/max цены available помещений берем из сводки
+            minimum_liq_refusal_price = round(premises_summary.min_price_per_meter or 0, 2)
+            maximum_liq_refusal_price = round(premises_summary.max_price_per_meter or 0, 2)
 
             config = PricingConfigCreate(
                 is_active=True,
@@ -284,15 +290,4 @@ class PricingConfigService:
 
             return await self.create_pricing_config(data=config)
         else:
-            # Обновляем существующий pricing config
-            existing_content = pricing_config.content or {}
-            static_config = existing_content.get("staticConfig", {})
-            static_config["current_price_per_sqm"] = round(calculated_current_price, 2)
-            existing_content["staticConfig"] = static_config
-
-            upd_config = PricingConfigUpdate(content=existing_content)
-
-            return await self.update_pricing_config(
-                config_id=pricing_config.id,
-                data=upd_config,
-            )
+            return PricingConfigResponse.model_validate(pricing_config)
@@ -1,17 +1,24 @@
 from app.core.exceptions import ObjectAlreadyExists, ObjectNotFound
 from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
+from app.core.interfaces.reo_summary_repository import ReoSummaryRepositoryInterface
 from app.core.schemas.real_estate_object_schemas import (
     RealEstateObjectCreate,
     RealEstateObjectFullResponse,
+    RealEstateObjectProfileResponse,
     RealEstateObjectResponse,
     RealEstateObjectUpdate,
+    ReoPremisesSummaryResponse,
 )
 from app.core.schemas.user_schemas import UserOutputSchema
+from app.core.utils.enums import PROFILE_RELATIONSHIPS, REO_RELATIONSHIPS, ReoLoadProfile
 
 
 class RealEstateObjectService:
-    def __init__(self, repository: RealEstateObjectRepositoryInterface):
+    def __init__(
+        self, repository: RealEstateObjectRepositoryInterface, summary_repository: ReoSummaryRepositoryInterface
+    ):
         self.repository = repository
+        self.summary_repository = summary_repository
 
     async def create(self, data: RealEstateObjectCreate, user: UserOutputSchema) -> RealEstateObjectResponse:
         reo = await self.get_by_name(name=data.name, user_id=user.id)
@@ -21,13 +28,48 @@ class RealEstateObjectService:
         reo = await self.repository.create(data.model_dump(), user_id=user.id)
         return RealEstateObjectResponse.model_validate(reo)
 
-    async def get_full(self, id: int, user: UserOutputSchema) -> RealEstateObjectFullResponse:
-        reo = await self.repository.get_full(id, user_id=user.id)
+    async def get(self, id: int, user: UserOutputSchema) -> RealEstateObjectResponse:
+        reo = await self.repository.get(id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=id)
+
+        return RealEstateObjectResponse.model_validate(reo)
+
+    async def get_full(
+        self, id: int, user: UserOutputSchema, profile: ReoLoadProfile = ReoLoadProfile.FULL
+    ) -> RealEstateObjectFullResponse:
+        reo = await self.repository.get_full(id, user_id=user.id, profile=profile)
         if not reo:
             raise ObjectNotFound(model_name="RealEstateObject", id_=id)
 
         return RealEstateObjectFullResponse.model_validate(reo)
 
+    async def get_profile(
+        self, id: int, user: UserOutputSchema, profile: ReoLoadProfile = ReoLoadProfile.FULL
+    ) -> RealEstateObjectProfileResponse:
+        """Объект для API: связи, которые профиль не загружал, отдаются как None, а не как пустые списки."""
+        reo = await self.repository.get_full(id, user_id=user.id, profile=profile)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=id)
+
+        skipped = [name for name in REO_RELATIONSHIPS if name not in PROFILE_RELATIONSHIPS[profile]]
+        response = RealEstateObjectProfileResponse.model_validate(reo)
+        return response.model_copy(update=dict.fromkeys(skipped))
+
+    async def get_premises_summary(self, id: int, user: UserOutputSchema) -> ReoPremisesSummaryResponse:
+        """
+        Возвращает агрегаты по активным помещениям объекта одним запросом по reo_id.
+        Сводка объекта, у которого еще не было записей после ее появления, строится при первом чтении.
+        """
+        reo = await self.repository.get(id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=id)
+
+        summary = await self.summary_repository.get(reo_id=id)
+        if not summary:
+            summary = await self.summary_repository.refresh(reo_id=id)
+        return ReoPremisesSummaryResponse.model_validate(summary)
+
     async def get_all(self, user: UserOutputSchema) -> list[RealEstateObjectResponse]:
         reos = await self.repository.get_all(user_id=user.id)
         return [RealEstateObjectResponse.model_validate(reo) for reo in reos]
@@ -1,6 +1,8 @@
 from app.core.exceptions import ObjectNotFound
 from app.core.interfaces.sales_repository import SalesRepositoryInterface
-from app.core.schemas.sale_schemas import SalesCreate, SalesResponse
+from app.core.schemas.pagination_schemas import CursorPage, build_cursor_page, decode_cursor
+from app.core.schemas.sale_schemas import SalesCreate, SalesFilter, SalesResponse
+from app.core.schemas.user_schemas import UserOutputSchema
 
 
 class SalesService:
@@ -17,9 +19,13 @@ class SalesService:
             raise ObjectNotFound(model_name="Sales", id_=id)
         return SalesResponse.model_validate(sales)
 
-    async def get_all(self) -> list[SalesResponse]:
-        sales_list = await self.repository.get_all()
-        return [SalesResponse.model_validate(sales) for sales in sales_list]
+    async def get_all(
+        self, user: UserOutputSchema, filters: SalesFilter, cursor: str | None, limit: int
+    ) -> CursorPage[SalesResponse]:
+        sales_list = await self.repository.get_all(
+            user_id=user.id, filters=filters, after_id=decode_cursor(cursor), limit=limit + 1
+        )
+        return build_cursor_page(sales_list, limit=limit, schema=SalesResponse)
 
     async def update(self, id: int, data: dict) -> SalesResponse:
         sales = await self.repository.get(id)
@@ -23,6 +23,7 @@ from app.core.services.scoring.steps import (
     CalculateSpread,
     FilterAndScoreFlats,
 )
+from app.core.utils.enums import ReoLoadProfile
 
 
 class ScoringCalculationService:
@@ -37,7 +38,7 @@ class ScoringCalculationService:
     async def calculate_scoring(
         self, reo_id: int, distribution_config_id: int, user: UserOutputSchema
     ) -> RealEstateObjectWithCalculations:
-        reo = await self.reo_repository.get_full(id=reo_id, user_id=user.id)
+        reo = await self.reo_repository.get_full(id=reo_id, user_id=user.id, profile=ReoLoadProfile.SCORING)
         distribution_config = await self.distribution_config_repository.get(
             config_id=distribution_config_id, user_id=user.id
         )
@@ -0,0 +1,281 @@
+import asyncio
+import contextlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, ClassVar
+
+from app.core.exceptions import (
+    FileProcessingBusyException,
+    FileProcessingException,
+    FileReadException,
+    IncomePlanRequiredException,
+    ObjectNotFound,
+    UploadJobConflictException,
+)
+from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
+from app.core.interfaces.upload_job_repository import UploadJobRepositoryInterface
+from app.core.interfaces.upload_staging import UploadStagingInterface
+from app.core.schemas.upload_job_schemas import UploadJobCreate, UploadJobResponse
+from app.core.schemas.user_schemas import UserOutputSchema
+from app.core.services.distribution_config_service import DistributionConfigsService
+from app.core.services.file_processing_service import FileProcessingService
+from app.core.services.income_plan_service import IncomePlanService
+from app.core.services.pricing_config_service import PricingConfigService
+from app.core.utils.enums import UploadJobStatus
+from app.core.utils.specification_validation import RowErrorCollector
+from app.settings import UploadJobSettings
+from loguru import logger
+
+
+class UploadJobService:
+    """
+    Фоновая загрузка спецификаций: файл принимается частями в staging, затем фоновый обработчик
+    разбирает его пакетами в неактивные помещения задачи и одной транзакцией делает их активными.
+
+    Пока файл не проверен целиком, активные помещения объекта не меняются: ошибка в любой строке
+    оставляет прежний набор, а в задаче сохраняются номера строк и ошибки.
+    """
+
+    # Части одной загрузки пишутся по очереди; блокировки живут в процессе, как и пул разбора файлов
+    _chunk_locks: ClassVar[defaultdict[int, asyncio.Lock]] = defaultdict(asyncio.Lock)
+
+    def __init__(
+        self,
+        repository: UploadJobRepositoryInterface,
+        reo_repository: RealEstateObjectRepositoryInterface,
+        staging: UploadStagingInterface,
+        file_processing_service: FileProcessingService,
+        income_plan_service: IncomePlanService,
+        distribution_config_service: DistributionConfigsService,
+        pricing_config_service: PricingConfigService,
+        config: UploadJobSettings,
+        wakeup: asyncio.Event,
+    ):
+        self.repository = repository
+        self.reo_repository = reo_repository
+        self.staging = staging
+        self.file_processing_service = file_processing_service
+        self.income_plan_service = income_plan_service
+        self.distribution_config_service = distribution_config_service
+        self.pricing_config_service = pricing_config_service
+        self.config = config
+        self.wakeup = wakeup
+
+    async def create_job(self, reo_id: int, data: UploadJobCreate, user: UserOutputSchema) -> UploadJobResponse:
+        """Создает задачу загрузки; формат файла и наличие плана доходов проверяются сразу, до передачи файла."""
+        reo = await self.reo_repository.get(id=reo_id, user_id=user.id)
+        if not reo:
+            raise ObjectNotFound(model_name="RealEstateObject", id_=reo_id)
+        self.file_processing_service.validate_specification_format(data.filename, data.content_type)
+        if data.total_size is not None and data.total_size > self.config.UPLOAD_JOB_MAX_SIZE:
+            raise FileReadException(f"File exceeds the maximum upload size of {self.config.UPLOAD_JOB_MAX_SIZE} bytes")
+        await self.income_plan_service.get_active_plan_by_reo_id(reo_id=reo.id)
+
+        job = await self.repository.create(
+            data={
+                "reo_id": reo.id,
+                "user_id": user.id,
+                "filename": data.filename,
+                "content_type": data.content_type,
+                "total_size": data.total_size,
+            }
+        )
+        return UploadJobResponse.model_validate(job)
+
+    async def get_job(self, job_id: int, user: UserOutputSchema) -> UploadJobResponse:
+        return UploadJobResponse.model_validate(await self._get_user_job(job_id, user))
+
+    async def upload_chunk(
+        self, job_id: int, offset: int, chunks: AsyncIterator[bytes], user: UserOutputSchema
+    ) -> UploadJobResponse:
+        """
+        Дописывает часть файла с позиции offset, которая должна совпадать с received_size задачи.
+
+        Часть принимается целиком или не принимается: после обрыва ее нужно отправить заново с того же offset,
+        недописанные байты будут перезаписаны.
+        """
+        job = await self._get_user_job(job_id, user)
+        self._check_uploading(job)
+        if offset != job.received_size:
+            raise UploadJobConflictException(
+                f"Upload continues at offset {job.received_size}, got {offset}", received_size=job.received_size
+            )
+
+        lock = self._chunk_locks[job.id]
+        if lock.locked():
+            raise UploadJobConflictException(
+                "Another chunk of this upload is being written", received_size=job.received_size
+            )
+        try:
+            async with lock:
+                limit = self.config.UPLOAD_JOB_MAX_SIZE if job.total_size is None else job.total_size
+                received_size = await self.staging.write(
+                    job.id, offset, self._limit_chunks(chunks, limit - offset, job.received_size)
+                )
+                if not await self.repository.advance_received_size(
+                    id=job.id, offset=offset, received_size=received_size
+                ):
+                    job = await self._get_user_job(job_id, user)
+                    raise UploadJobConflictException(
+                        f"Upload job changed while the chunk was written, status {job.status}",
+                        received_size=job.received_size,
+                    )
+        finally:
+            if not lock.locked():
+                self._chunk_locks.pop(job.id, None)
+        return await self.get_job(job_id, user)
+
+    async def complete_upload(self, job_id: int, user: UserOutputSchema) -> UploadJobResponse:
+        """Ставит полностью переданный файл в очередь на обработку."""
+        job = await self._get_user_job(job_id, user)
+        self._check_uploading(job)
+        if job.received_size == 0 or (job.total_size is not None and job.received_size != job.total_size):
+            raise UploadJobConflictException(
+                f"Upload is incomplete: received {job.received_size} of {job.total_size or 'unknown'} bytes",
+                received_size=job.received_size,
+            )
+        if not await self.repository.enqueue(id=job.id, received_size=job.received_size):
+            job = await self._get_user_job(job_id, user)
+            raise UploadJobConflictException(
+                f"Upload job changed meanwhile, status {job.status}", received_size=job.received_size
+            )
+        self.wakeup.set()
+        return await self.get_job(job_id, user)
+
+    async def run_periodically(self) -> None:
+        """
+        Фоновый обработчик очереди: разбирает задачи одну за другой, пока очередь не опустеет,
+        затем ждет завершения новой загрузки или UPLOAD_JOB_POLL_SECONDS. Ошибка не останавливает цикл.
+        """
+        while True:
+            self.wakeup.clear()
+            try:
+                while await self.process_next():
+                    pass
+            except Exception:
+                logger.exception("Upload job run failed")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.wakeup.wait(), timeout=self.config.UPLOAD_JOB_POLL_SECONDS)
+
+    async def process_next(self) -> bool:
+        """Берет и обрабатывает следующую задачу; False, если очередь пуста."""
+        stale_before = datetime.now() - timedelta(seconds=self.config.UPLOAD_JOB_STALE_SECONDS)
+        job = await self.repository.claim_next(stale_before=stale_before)
+        if job is None:
+            return False
+        await self.process_job(job)
+        return True
+
+    async def process_job(self, job: Any) -> None:
+        """
+        Разбирает файл задачи пакетами в неактивные помещения и при отсутствии ошибок заменяет ими активные.
+
+        После первой ошибочной строки пакеты больше не сохраняются, но файл проверяется до конца,
+        чтобы вернуть ошибки всех строк (не больше UPLOAD_JOB_MAX_ERRORS). Файл в staging удаляется,
+        когда задача завершена или отклонена; если задачу перехватил другой обработчик, файл остается ему.
+        """
+        row_errors = RowErrorCollector(limit=self.config.UPLOAD_JOB_MAX_ERRORS)
+        valid_rows = 0
+        finished = False
+        try:
+            active_plans = await self.income_plan_service.get_active_plan_by_reo_id(reo_id=job.reo_id)
+            file = await self.staging.open(job.id)
+            try:
+                batches = self.file_processing_service.stream_specification(
+                    file=file,
+                    filename=job.filename,
+                    reo_id=job.reo_id,
+                    content_type=job.content_type,
+                    row_errors=row_errors,
+                )
+                async for rows in batches:
+                    valid_rows += len(rows)
+                    staged = await self.repository.stage_premises(
+                        job=job,
+                        rows=[] if row_errors.count else rows,
+                        rows_processed=valid_rows + row_errors.count,
+                        errors=row_errors.rows,
+                        error_count=row_errors.count,
+                    )
+                    if not staged:
+                        logger.warning(f"Upload job {job.id} was taken over by another worker")
+                        return
+            finally:
+                await asyncio.to_thread(file.close)
+
+            rows_processed = valid_rows + row_errors.count
+            if row_errors.count:
+                finished = await self.repository.fail(
+                    job=job,
+                    rows_processed=rows_processed,
+                    errors=row_errors.rows,
+                    error_count=row_errors.count,
+                    message=f"{row_errors.count} rows failed validation",
+                )
+                return
+
+            premises_count = await self.repository.activate_staged_premises(
+                job=job, rows_processed=rows_processed, message=None
+            )
+            finished = premises_count is not None
+            if finished:
+                await self._sync_pricing_config(job, active_plans)
+        except FileProcessingBusyException:
+            # Очередь разбора переполнена: задача остается в обработке и будет взята заново как зависшая
+            logger.warning(f"Upload job {job.id} postponed, file processing is busy")
+        except (FileProcessingException, IncomePlanRequiredException) as e:
+            finished = await self.repository.fail(
+                job=job,
+                rows_processed=valid_rows + row_errors.count,
+                errors=row_errors.rows,
+                error_count=row_errors.count,
+                message=str(e),
+            )
+        except Exception:
+            logger.exception(f"Upload job {job.id} failed")
+            finished = await self.repository.fail(
+                job=job,
+                rows_processed=valid_rows + row_errors.count,
+                errors=row_errors.rows,
+                error_count=row_errors.count,
+                message="Internal error while processing the upload",
+            )
+        finally:
+            if finished:
+                await self.staging.delete(job.id)
+
+    async def _sync_pricing_config(self, job: Any, active_plans: list) -> None:
+        # Помещения уже заменены, поэтому сбой синхронизации только логируется, как и в синхронной загрузке
+        try:
+            distribution_config = await self.distribution_config_service.get_or_create_base_config()
+            await self.pricing_config_service.sync_pricing_config_after_premises_upload(
+                reo_id=job.reo_id,
+                active_plans=active_plans,
+                distribution_config=distribution_config,
+            )
+        except Exception:
+            logger.exception(f"Pricing config sync after upload job {job.id} failed")
+
+    async def _get_user_job(self, job_id: int, user: UserOutputSchema) -> Any:
+        job = await self.repository.get(id=job_id)
+        if not job or job.user_id != user.id:
+            raise ObjectNotFound(model_name="UploadJob", id_=job_id)
+        return job
+
+    @staticmethod
+    def _check_uploading(job: Any) -> None:
+        if job.status != UploadJobStatus.UPLOADING:
+            raise UploadJobConflictException(
+                f"Upload job is {job.status}, it does not accept chunks", received_size=job.received_size
+            )
+
+    @staticmethod
+    async def _limit_chunks(chunks: AsyncIterator[bytes], limit: int, received_size: int) -> AsyncIterator[bytes]:
+        written = 0
+        async for chunk in chunks:
+            written += len(chunk)
+            if written > limit:
+                raise UploadJobConflictException(
+                    "Chunk goes past the declared size of the file", received_size=received_size
+                )
+            yield chunk
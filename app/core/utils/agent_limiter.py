@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Hashable, Optional
+
+from app.core.exceptions.domain import AgentBusyException
+
+
+@dataclass
+class _KeySlots:
+    semaphore: asyncio.Semaphore
+    # Сколько запусков этого ключа выполняется или ждет: при нуле слоты ключа удаляются
+    holders: int = 0
+
+
+@dataclass
+class AgentLimiterMetrics:
+    in_flight: int = 0
+    waiting: int = 0
+    rejected: int = 0
+    in_flight_max: int = 0
+
+
+@dataclass
+class _LoopSlots:
+    loop: asyncio.AbstractEventLoop
+    total: asyncio.Semaphore
+    per_key: dict[Hashable, _KeySlots] = field(default_factory=dict)
+
+
+class AgentConcurrencyLimiter:
+    """
+    Ограничивает число одновременно выполняемых агентов: не больше max_concurrency в процессе
+    и не больше max_per_key на один ключ (пользователя), чтобы один пользователь не занял все места.
+
+    Сначала занимается место ключа, затем общее, так что ожидающие запуски одного пользователя
+    не держат общие места. Если место не освободилось за queue_timeout секунд, запуск отклоняется
+    AgentBusyException.
+    """
+
+    def __init__(self, max_concurrency: int, max_per_key: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_per_key = max_per_key
+        self.queue_timeout = queue_timeout
+        self.metrics = AgentLimiterMetrics()
+        self._slots: Optional[_LoopSlots] = None
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: Hashable) -> AsyncIterator[None]:
+        """Занимает место для одного запуска агента на время блока."""
+        slots = self._loop_slots()
+        key_slots = slots.per_key.setdefault(key, _KeySlots(asyncio.Semaphore(self.max_per_key)))
+        key_slots.holders += 1
+        self.metrics.waiting += 1
+        try:
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await key_slots.semaphore.acquire()
+                    try:
+                        await slots.total.acquire()
+                    except BaseException:
+                        key_slots.semaphore.release()
+                        raise
+            except TimeoutError:
+                self.metrics.rejected += 1
+                raise AgentBusyException(retry_after=self.queue_timeout)
+            finally:
+                self.metrics.waiting -= 1
+
+            self.metrics.in_flight += 1
+            self.metrics.in_flight_max = max(self.metrics.in_flight_max, self.metrics.in_flight)
+            try:
+                yield
+            finally:
+                self.metrics.in_flight -= 1
+                slots.total.release()
+                key_slots.semaphore.release()
+        finally:
+            key_slots.holders -= 1
+            if not key_slots.holders:
+                slots.per_key.pop(key, None)
+
+    def _loop_slots(self) -> _LoopSlots:
+        loop = asyncio.get_running_loop()
+        # Семафоры привязаны к event loop, поэтому создаются заново, если ограничитель используют из другого loop
+        if self._slots is None or self._slots.loop is not loop:
+            self._slots = _LoopSlots(loop=loop, total=asyncio.Semaphore(self.max_concurrency))
+        return self._slots
@@ -17,3 +17,69 @@ class CurrencyEnum(StrEnum):
     USD = "USD"
     EUR = "EUR"
     UAH = "UAH"
+
+
+class ReoLoadProfile(StrEnum):
+    """Какие связи и колонки грузить вместе с объектом недвижимости."""
+
+    PREMISES_ONLY = "premises-only"
+    SCORING = "scoring"
+    AGENTS_TEXT = "agents-text"
+    AGENTS_MEDIA = "agents-media"
+    AGENTS = "agents"
+    FULL = "full"
+
+
+REO_RELATIONSHIPS = (
+    "premises",
+    "pricing_configs",
+    "committed_prices",
+    "income_plans",
+    "status_mappings",
+    "layout_type_attachments",
+    "window_view_attachments",
+)
+
+# Связи, которые загружаются для профиля; остальные не запрашиваются
+PROFILE_RELATIONSHIPS: dict[ReoLoadProfile, tuple[str, ...]] = {
+    ReoLoadProfile.PREMISES_ONLY: ("premises",),
+    ReoLoadProfile.SCORING: ("premises", "pricing_configs"),
+    ReoLoadProfile.AGENTS_TEXT: ("premises",),
+    ReoLoadProfile.AGENTS_MEDIA: ("layout_type_attachments", "window_view_attachments"),
+    ReoLoadProfile.AGENTS: ("premises", "layout_type_attachments", "window_view_attachments"),
+    ReoLoadProfile.FULL: REO_RELATIONSHIPS,
+}
+
+
+class ArchiveTable(StrEnum):
+    """Таблицы, неактивные версии строк которых переносятся в архив."""
+
+    PREMISES = "premises"
+    COMMITTED_PRICES = "committed_prices"
+    COMMITTED_SNAPSHOTS = "committed_snapshots"
+    PRICING_CONFIGS = "pricing_configs"
+    INCOME_PLANS = "income_plans"
+
+
+class ExportFormat(StrEnum):
+    """Форматы файла выгрузки зафиксированных цен."""
+
+    XLSX = "xlsx"
+    CSV = "csv"
+
+
+class UploadJobStatus(StrEnum):
+    """Состояния фоновой загрузки спецификации."""
+
+    UPLOADING = "uploading"
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AgentRunStatus(StrEnum):
+    """Итог запуска одного агента при запуске нескольких агентов сразу."""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
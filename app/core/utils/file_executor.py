@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from app.core.exceptions.domain import FileProcessingBusyException
+
+T = TypeVar("T")
+
+# Значение, которым поток-исполнитель сообщает об окончании итератора
+_EXHAUSTED = object()
+
+
+@dataclass
+class OperationMetrics:
+    calls: int = 0
+    failures: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+    run_seconds_max: float = 0.0
+
+    def record(self, wait_seconds: float, run_seconds: float) -> None:
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        self.run_seconds_total += run_seconds
+        self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+
+
+@dataclass
+class LoopLagMetrics:
+    samples: int = 0
+    lag_seconds_total: float = 0.0
+    lag_seconds_max: float = 0.0
+
+
+class FileProcessingExecutor:
+    """
+    Отдельный пул потоков для разбора, проверки и формирования файлов, чтобы pandas/openpyxl
+    не блокировали event loop.
+
+    Одновременно выполняется не больше max_workers задач и ждет в очереди не больше max_pending.
+    Если место не освободилось за queue_timeout секунд, вызов отклоняется FileProcessingBusyException,
+    так что под нагрузкой запросы получают отказ, а не копят файлы в памяти.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_pending
+        self.queue_timeout = queue_timeout
+        self.operations: defaultdict[str, OperationMetrics] = defaultdict(OperationMetrics)
+        self.loop_lag = LoopLagMetrics()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-processing")
+        self._slots: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """Выполняет блокирующую функцию в пуле и учитывает время ожидания и выполнения под именем operation."""
+        slots = await self._acquire(operation)
+        try:
+            return await self._submit(operation, func, *args)
+        finally:
+            slots.release()
+
+    async def iterate(self, operation: str, iterator: Iterator[T]) -> AsyncIterator[T]:
+        """
+        Получает элементы блокирующего итератора в пуле, по одному вызову next на элемент.
+
+        Место в пуле занято на все время обхода: одновременно открытых потоковых файлов не больше емкости пула.
+        """
+        slots = await self._acquire(operation)
+        try:
+            while True:
+                item = await self._submit(operation, next, iterator, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            slots.release()
+
+    async def watch_event_loop(self, interval: float = 0.1) -> None:
+        """Фоновая задача: измеряет, насколько позже запланированного просыпается event loop."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(time.perf_counter() - started - interval, 0.0)
+            self.loop_lag.samples += 1
+            self.loop_lag.lag_seconds_total += lag
+            self.loop_lag.lag_seconds_max = max(self.loop_lag.lag_seconds_max, lag)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _acquire(self, operation: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        # Семафор привязан к event loop, поэтому создается заново, если исполнитель используют из другого loop
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.capacity))
+        slots = self._slots[1]
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.operations[operation].rejected += 1
+            raise FileProcessingBusyException(retry_after=self.queue_timeout)
+        return slots
+
+    async def _submit(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        metrics = self.operations[operation]
+        submitted = time.perf_counter()
+        started = submitted
+
+        def timed() -> Any:
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args)
+
+        metrics.calls += 1
+        metrics.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, timed)
+        except Exception:
+            metrics.failures += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.record(wait_seconds=started - submitted, run_seconds=time.perf_counter() - started)
@@ -0,0 +1,20 @@
+import numpy as np
+
+# Little-endian float64, чтобы упакованная матрица читалась одинаково на любой платформе
+CALCULATION_DTYPE = np.dtype("<f8")
+
+
+def pack_calculation(rows: list[list[float]], fields: list[str]) -> bytes:
+    """Упаковывает векторы расчета (по строке на помещение) в row-major матрицу float64."""
+    matrix = np.asarray(rows, dtype=CALCULATION_DTYPE).reshape(len(rows), len(fields))
+    return matrix.tobytes()
+
+
+def unpack_calculation(blob: bytes, fields: list[str]) -> np.ndarray:
+    """Восстанавливает матрицу расчета формы (помещения, поля) из упакованного снимка."""
+    return np.frombuffer(blob, dtype=CALCULATION_DTYPE).reshape(-1, len(fields))
+
+
+def calculation_column(blob: bytes, fields: list[str], field: str) -> np.ndarray:
+    """Возвращает один столбец матрицы расчета без распаковки остальных значений в объекты Python."""
+    return unpack_calculation(blob, fields)[:, fields.index(field)]
@@ -0,0 +1,504 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional, get_args
+
+import numpy as np
+import pandas as pd
+from annotated_types import Ge, Gt
+from app.core.exceptions.domain import (
+    DataValidationException,
+    DuplicatePremisesIdException,
+    MissingRequiredColumnsException,
+)
+from app.core.schemas.income_plan_schemas import INCOME_PLAN_DATE_FORMATS, IncomePlanFileResponse
+from app.core.schemas.premise_schemas import PremisesFileSpecificationResponse
+from pydantic import BaseModel
+
+# Значения, которые загрузчик считает пустой ячейкой (после strip и lower)
+EMPTY_CELL_VALUES = ["nan", "none", ""]
+
+# Номер первой строки данных в файле: строка 1 занята заголовками
+FIRST_DATA_ROW = 2
+
+# Поля, которые при отсутствии значения генерируются, а не считаются ошибкой
+GENERATED_FIELDS = {"premises_id"}
+
+# Необязательные поля PremisesCreate, которые при сохранении заменяются нулем
+PREMISES_ZERO_DEFAULTS: dict[str, Any] = {
+    "number_of_rooms": 0,
+    "living_area_m2": 0.0,
+    "kitchen_area_m2": 0.0,
+    "number_of_levels": 0,
+    "number_of_loggias": 0,
+    "number_of_balconies": 0,
+    "number_of_bathrooms_with_toilets": 0,
+    "number_of_separate_bathrooms": 0,
+    "number_of_terraces": 0,
+}
+
+TYPE_ERRORS = {
+    "str": "Input should be a valid string",
+    "int": "Input should be a valid integer",
+    "float": "Input should be a valid number",
+    "str_or_int": "Input should be a valid string or integer",
+}
+
+# Столбцы плана доходов с датами: строки в INCOME_PLAN_DATE_FORMATS или даты Excel, от которых остается только день
+INCOME_PLAN_PERIOD_FIELDS = {"period_begin", "period_end"}
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    field: str
+    column: str
+    kind: str
+    nullable: bool
+    ge: Optional[Any] = None
+    gt: Optional[Any] = None
+    # Значение пустой ячейки при сохранении; в ответе загрузки ячейка остается пустой
+    default: Optional[Any] = None
+
+
+@dataclass
+class ColumnErrors:
+    column: str
+    mask: np.ndarray
+    message: str
+    values: pd.Series
+
+
+def compile_column_rules(
+    model: type[BaseModel], columns: list[str], overrides: Optional[dict[str, dict[str, Any]]] = None
+) -> tuple[ColumnRule, ...]:
+    """
+    Собирает правила проверки столбцов из полей Pydantic-модели: тип, допустимость пустых значений и границы.
+
+    overrides задает для поля значения правила, которые не выводятся из аннотации (kind, nullable, default).
+    """
+    overrides = overrides or {}
+    rules = []
+    for name, info in model.model_fields.items():
+        if info.alias not in columns:
+            continue
+        args = get_args(info.annotation) or (info.annotation,)
+        types = {arg for arg in args if arg is not type(None)}
+        kind = "str_or_int" if types == {str, int} else next(iter(types)).__name__
+        rule = ColumnRule(
+            field=name,
+            column=info.alias,
+            kind=kind,
+            nullable=type(None) in args,
+            ge=next((item.ge for item in info.metadata if isinstance(item, Ge)), None),
+            gt=next((item.gt for item in info.metadata if isinstance(item, Gt)), None),
+        )
+        rules.append(replace(rule, **overrides.get(name, {})))
+    return tuple(rules)
+
+
+SPECIFICATION_RULES = compile_column_rules(
+    PremisesFileSpecificationResponse,
+    PremisesFileSpecificationResponse.PREDEFINED_COLUMNS,
+    overrides={
+        **{field: {"nullable": True} for field in GENERATED_FIELDS},
+        **{field: {"default": default} for field, default in PREMISES_ZERO_DEFAULTS.items()},
+    },
+)
+INCOME_PLAN_RULES = compile_column_rules(
+    IncomePlanFileResponse,
+    IncomePlanFileResponse.PREDEFINED_COLUMNS,
+    overrides={field: {"kind": "date"} for field in INCOME_PLAN_PERIOD_FIELDS},
+)
+
+# Ключи ответа загрузки спецификации: поле -> название столбца файла
+SPECIFICATION_RESPONSE_COLUMNS = {rule.field: rule.column for rule in SPECIFICATION_RULES}
+
+
+@dataclass(frozen=True)
+class SchemaPlan:
+    """
+    План разбора загрузки, собранный один раз по строке заголовков.
+
+    columns сопоставляет позиции столбцов файла правилам полей, custom_columns - позиции и названия
+    остальных столбцов, которые складываются в customcontent. Пакеты строк разбираются по позициям,
+    без поиска столбцов по названиям и повторной очистки заголовков.
+    """
+
+    columns: tuple[tuple[int, ColumnRule], ...]
+    custom_columns: tuple[tuple[int, str], ...]
+
+    def coerce(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[ColumnErrors]]:
+        """Приводит столбцы пакета к типам полей; возвращает по столбцу на поле и ошибки всех столбцов."""
+        frame = pd.DataFrame(index=pd.RangeIndex(len(df)))
+        errors: list[ColumnErrors] = []
+        for position, rule in self.columns:
+            values, column_errors = _coerce_column(df.iloc[:, position].reset_index(drop=True), rule)
+            frame[rule.field] = values
+            errors.extend(column_errors)
+        return frame, errors
+
+    def custom_content(self, df: pd.DataFrame) -> Optional[list[dict]]:
+        """Пользовательские столбцы пакета по строкам; None, если в файле их нет."""
+        if not self.custom_columns:
+            return None
+        custom = df.iloc[:, [position for position, _ in self.custom_columns]].reset_index(drop=True)
+        custom.columns = [name for _, name in self.custom_columns]
+        return _to_records(custom)
+
+
+@lru_cache(maxsize=128)
+def compile_schema_plan(header: tuple[Any, ...], rules: tuple[ColumnRule, ...]) -> SchemaPlan:
+    """
+    Собирает план разбора по заголовкам файла: названия очищаются от пробелов, при повторе названия
+    берется первый столбец. Одинаковые заголовки разных загрузок используют один план.
+
+    Raises:
+        MissingRequiredColumnsException: если в заголовках нет столбцов из rules
+    """
+    names = [str(column).strip() for column in header]
+    positions: dict[str, int] = {}
+    for position, name in enumerate(names):
+        positions.setdefault(name, position)
+
+    missing_columns = [rule.column for rule in rules if rule.column not in positions]
+    if missing_columns:
+        raise MissingRequiredColumnsException(missing_columns)
+
+    predefined = {rule.column for rule in rules}
+    return SchemaPlan(
+        columns=tuple((positions[rule.column], rule) for rule in rules),
+        custom_columns=tuple((position, name) for position, name in enumerate(names) if name not in predefined),
+    )
+
+
+class RowErrorCollector:
+    """
+    Ошибки спецификации по строкам вместо исключения на первой ошибке.
+
+    Хранит не больше limit строк с ошибками, а count считает все ошибочные строки файла.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.rows: list[dict] = []
+        self.count = 0
+
+    def add(self, row_number: int, errors: list[dict]) -> None:
+        self.count += 1
+        if len(self.rows) < self.limit:
+            self.rows.append({"row_number": row_number, "errors": errors})
+
+
+@dataclass
+class PreparedSpecification:
+    """Строки спецификации, готовые к вставке в premises и к ответу загрузки."""
+
+    premises_rows: list[dict]
+    response_records: list[dict]
+
+
+@dataclass
+class ValidatedSpecification:
+    """
+    Проверенная спецификация помещений в виде столбцов.
+
+    frame содержит по столбцу на поле PremisesFileSpecificationResponse (включая customcontent),
+    пустые значения - None. Строки остаются в порядке файла.
+    """
+
+    frame: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def to_response_records(self) -> list[dict]:
+        """Строки в формате ответа загрузки: ключи - названия столбцов файла."""
+        return _to_records(self.frame.rename(columns=SPECIFICATION_RESPONSE_COLUMNS))
+
+    def to_premises_rows(self, reo_id: int) -> list[dict]:
+        """
+        Строки для bulk insert в premises с теми же значениями по умолчанию, что у PremisesCreate:
+        price_per_meter вычисляется из full_price и площади, пустые счетчики и площади становятся нулем.
+        """
+        frame = self.frame.copy()
+        frame["reo_id"] = reo_id
+        frame["premises_id"] = frame["premises_id"].astype(str)
+        frame["number"] = pd.to_numeric(frame["number"]).astype("int64")
+        frame["entrance"] = frame["entrance"].astype(str)
+
+        price = frame["price_per_meter"].astype("float64")
+        full_price = frame["full_price"].astype("float64")
+        area = frame["total_area_m2"].astype("float64")
+        calculated = (full_price / area.where(area > 0)).fillna(0.0)
+        frame["price_per_meter"] = price.fillna(calculated)
+
+        for rule in SPECIFICATION_RULES:
+            if rule.default is not None:
+                frame[rule.field] = frame[rule.field].astype(object).where(frame[rule.field].notna(), rule.default)
+
+        return _to_records(frame)
+
+    def prepare(self, reo_id: int) -> PreparedSpecification:
+        return PreparedSpecification(
+            premises_rows=self.to_premises_rows(reo_id=reo_id), response_records=self.to_response_records()
+        )
+
+
+def validate_specification(
+    df: pd.DataFrame,
+    first_row: int = FIRST_DATA_ROW,
+    seen_premises_ids: Optional[set[str]] = None,
+    row_errors: Optional[RowErrorCollector] = None,
+    plan: Optional[SchemaPlan] = None,
+) -> ValidatedSpecification:
+    """
+    Проверяет спецификацию помещений по столбцам вместо построчной валидации Pydantic.
+
+    Применяет те же правила, что и PremisesFileSpecificationResponse: очистка пустых значений,
+    приведение типов, обязательные поля и границы, генерация premises_id.
+
+    При потоковой обработке df - очередной пакет строк: first_row - номер его первой строки в файле,
+    seen_premises_ids накапливает premises_id предыдущих пакетов для поиска дубликатов между пакетами,
+    а plan собирается по заголовкам один раз на файл. Без plan он собирается по столбцам df.
+
+    Если передан row_errors, ошибки не прерывают проверку: строки с ошибками (и повторы уже встреченных
+    premises_id) записываются в row_errors и не попадают в результат.
+
+    Raises:
+        MissingRequiredColumnsException: если в заголовках нет обязательных столбцов
+        DataValidationException: с номером первой ошибочной строки файла и всеми ошибками этой строки
+        DuplicatePremisesIdException: если premises_id повторяется
+    """
+    if plan is None:
+        plan = compile_schema_plan(tuple(df.columns), SPECIFICATION_RULES)
+    frame, errors = plan.coerce(df)
+
+    # Отсутствующий premises_id генерируется из этажа, номера секции, планировки и номера
+    missing_id = frame["premises_id"].isna() | (frame["premises_id"] == 0)
+    if missing_id.any():
+        template = PremisesFileSpecificationResponse.PREMISES_ID_TEMPLATE
+        parts = frame.loc[missing_id, ["floor", "number_of_unit", "layout_type", "number"]]
+        frame.loc[missing_id, "premises_id"] = [template.format(**row) for row in _to_records(parts)]
+
+    # В базе номер помещения хранится целым числом
+    numbers = pd.to_numeric(frame["number"], errors="coerce")
+    errors.append(
+        ColumnErrors(
+            column="Number",
+            mask=(frame["number"].notna() & (numbers.isna() | (numbers % 1 != 0))).to_numpy(),
+            message=TYPE_ERRORS["int"],
+            values=frame["number"],
+        )
+    )
+
+    if row_errors is None:
+        _raise_first_error(errors, first_row)
+        valid = np.ones(len(frame), dtype=bool)
+    else:
+        valid = ~_collect_row_errors(errors, len(frame), first_row, row_errors)
+
+    premises_ids = frame["premises_id"].astype(str)
+    if row_errors is None:
+        duplicated = premises_ids.duplicated(keep=False)
+        if seen_premises_ids:
+            duplicated |= premises_ids.isin(seen_premises_ids)
+        if duplicated.any():
+            raise DuplicatePremisesIdException(premises_ids=sorted(premises_ids[duplicated].unique()))
+    else:
+        # Первое вхождение premises_id остается, повторы становятся ошибками своих строк
+        duplicated = premises_ids.where(valid).duplicated(keep="first") & valid
+        if seen_premises_ids:
+            duplicated |= premises_ids.isin(seen_premises_ids) & valid
+        for position in np.flatnonzero(duplicated.to_numpy()):
+            row_errors.add(
+                int(position) + first_row,
+                [{"loc": ("Premises ID",), "msg": "Duplicate premises ID", "input": premises_ids.iloc[position]}],
+            )
+        valid &= ~duplicated.to_numpy()
+    if seen_premises_ids is not None:
+        seen_premises_ids.update(premises_ids[valid])
+
+    frame["customcontent"] = plan.custom_content(df)
+
+    if not valid.all():
+        frame = frame[valid].reset_index(drop=True)
+    return ValidatedSpecification(frame=frame)
+
+
+@dataclass
+class ValidatedIncomePlan:
+    """Проверенный план доходов: по столбцу на поле IncomePlanCreate, периоды уже разобраны в datetime."""
+
+    frame: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def to_income_plan_rows(self, reo_id: int) -> list[dict]:
+        """Строки для bulk insert в income_plans, все планы файла становятся активными."""
+        frame = self.frame.copy()
+        frame["reo_id"] = reo_id
+        frame["is_active"] = True
+        return _to_records(frame)
+
+
+def validate_income_plan(
+    df: pd.DataFrame, first_row: int = FIRST_DATA_ROW, plan: Optional[SchemaPlan] = None
+) -> ValidatedIncomePlan:
+    """
+    Проверяет план доходов по столбцам по правилам IncomePlanFileResponse и разбирает даты периодов
+    так же, как IncomePlanCreate. Без plan он собирается по столбцам df; прочие столбцы файла не сохраняются.
+
+    Raises:
+        MissingRequiredColumnsException: если в заголовках нет обязательных столбцов
+        DataValidationException: с номером первой ошибочной строки файла и всеми ошибками этой строки
+    """
+    if plan is None:
+        plan = compile_schema_plan(tuple(df.columns), INCOME_PLAN_RULES)
+    frame, errors = plan.coerce(df)
+    _raise_first_error(errors, first_row)
+    return ValidatedIncomePlan(frame=frame)
+
+
+def _coerce_date_column(series: pd.Series, rule: ColumnRule) -> tuple[pd.Series, list[ColumnErrors]]:
+    is_string = _string_cells(series)
+    empty = _empty_cells(series, is_string)
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        is_date = series.notna()
+    else:
+        is_date = series.map(lambda value: isinstance(value, datetime)) & ~empty
+
+    dates = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    if is_date.any():
+        dates[is_date] = pd.to_datetime(series[is_date]).dt.normalize()
+    strings = series.where(is_string & ~empty)
+    for date_format in INCOME_PLAN_DATE_FORMATS:
+        dates = dates.fillna(pd.to_datetime(strings, format=date_format, errors="coerce"))
+
+    errors = [ColumnErrors(rule.column, empty.to_numpy(), "Field required", series)] if not rule.nullable else []
+    errors += [
+        ColumnErrors(rule.column, (~empty & ~is_string & ~is_date).to_numpy(), TYPE_ERRORS["str"], series),
+        ColumnErrors(
+            rule.column,
+            (is_string & ~empty & dates.isna()).to_numpy(),
+            "Invalid date format. Expected DD/MM/YYYY or ISO8601.",
+            series,
+        ),
+    ]
+    values = pd.Series(dates.array.to_pydatetime(), index=series.index, dtype=object)
+    return values.where(dates.notna(), None), errors
+
+
+def _coerce_column(series: pd.Series, rule: ColumnRule) -> tuple[pd.Series, list[ColumnErrors]]:
+    if rule.kind == "date":
+        return _coerce_date_column(series, rule)
+
+    is_string = _string_cells(series)
+    empty = _empty_cells(series, is_string)
+    values = series.astype(object).where(~empty, None)
+    errors: list[ColumnErrors] = []
+
+    if rule.kind == "bool":
+        return series.isin(PremisesFileSpecificationResponse.STUDIO_TRUE_VALUES) & ~empty, errors
+
+    if not rule.nullable:
+        errors.append(ColumnErrors(rule.column, empty.to_numpy(), "Field required", series))
+
+    if rule.kind == "str":
+        errors.append(ColumnErrors(rule.column, (~empty & ~is_string).to_numpy(), TYPE_ERRORS["str"], series))
+        return values, errors
+
+    numbers = pd.to_numeric(values.where(~is_string) if rule.kind == "str_or_int" else values, errors="coerce")
+    not_number = ~empty & numbers.isna() & (~is_string if rule.kind == "str_or_int" else True)
+    errors.append(ColumnErrors(rule.column, not_number.to_numpy(), TYPE_ERRORS[rule.kind], series))
+
+    if rule.kind in ("int", "str_or_int"):
+        fractional = numbers.notna() & (numbers % 1 != 0)
+        errors.append(
+            ColumnErrors(
+                rule.column,
+                fractional.to_numpy(),
+                "Input should be a valid integer, got a number with a fractional part",
+                series,
+            )
+        )
+    if rule.ge is not None:
+        errors.append(
+            ColumnErrors(
+                rule.column,
+                (numbers < rule.ge).to_numpy(),
+                f"Input should be greater than or equal to {rule.ge}",
+                series,
+            )
+        )
+    if rule.gt is not None:
+        errors.append(
+            ColumnErrors(
+                rule.column, (numbers <= rule.gt).to_numpy(), f"Input should be greater than {rule.gt}", series
+            )
+        )
+
+    if rule.kind == "float":
+        return numbers.astype("float64").astype(object).where(numbers.notna(), None), errors
+    integers = numbers.where(numbers % 1 == 0).astype("Int64").astype(object).where(numbers.notna(), None)
+    if rule.kind == "int":
+        return integers, errors
+    return values.where(is_string, integers), errors
+
+
+def _string_cells(series: pd.Series) -> pd.Series:
+    if series.dtype != object and not pd.api.types.is_string_dtype(series.dtype):
+        return pd.Series(False, index=series.index)
+    return series.map(type).eq(str)
+
+
+def _empty_cells(series: pd.Series, is_string: pd.Series) -> pd.Series:
+    empty = series.isna()
+    if is_string.any():
+        empty |= series.where(is_string, "-").str.strip().str.lower().isin(EMPTY_CELL_VALUES)
+    return empty
+
+
+def _rows_with_errors(errors: list[ColumnErrors]) -> np.ndarray:
+    return np.vstack([error.mask for error in errors]).any(axis=0).astype(bool)
+
+
+def _row_error_details(errors: list[ColumnErrors], position: int) -> list[dict]:
+    return [
+        {"loc": (error.column,), "msg": error.message, "input": _native(error.values.iloc[position])}
+        for error in errors
+        if error.mask[position]
+    ]
+
+
+def _raise_first_error(errors: list[ColumnErrors], first_row: int) -> None:
+    if not errors:
+        return
+    rows_with_errors = _rows_with_errors(errors)
+    if not rows_with_errors.any():
+        return
+
+    position = int(rows_with_errors.argmax())
+    details = _row_error_details(errors, position)
+    raise DataValidationException(row_number=position + first_row, error_details=str(details))
+
+
+def _collect_row_errors(
+    errors: list[ColumnErrors], rows: int, first_row: int, row_errors: RowErrorCollector
+) -> np.ndarray:
+    if not errors:
+        return np.zeros(rows, dtype=bool)
+    rows_with_errors = _rows_with_errors(errors)
+    for position in np.flatnonzero(rows_with_errors):
+        row_errors.add(int(position) + first_row, _row_error_details(errors, int(position)))
+    return rows_with_errors
+
+
+def _to_records(frame: pd.DataFrame) -> list[dict]:
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _native(value: Any) -> Any:
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
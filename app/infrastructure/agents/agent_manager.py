@@ -1,11 +1,16 @@
-from typing import Any, Type
+from typing import Any, Optional, Type
 
+import httpx
+import instructor
+from app.core.interfaces.agent_response_cache import AgentResponseCacheInterface
 from app.core.schemas import agents_schemas
 from app.core.schemas.agents_schemas import FilesData
 from app.infrastructure.agents.agent_constants import AgentID
 from app.infrastructure.agents.base_agent import BaseAgent
 from app.infrastructure.agents.prompt_manager import prompt_manager
+from app.infrastructure.agents.uploaded_files import UploadedFileRegistry
 from app.settings import AgentConfig
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from pydantic import BaseModel
 
 
@@ -31,8 +36,10 @@ class AgentManager:
             cls._INSTANCE = super(AgentManager, cls).__new__(cls)
         return cls._INSTANCE
 
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, file_cache: Optional[AgentResponseCacheInterface] = None):
         self.config = config
+        self.client = self._create_client(config)
+        self.uploaded_files = UploadedFileRegistry(client=self.client, config=config, cache=file_cache)
         self._agents: dict[str, BaseAgent] = {}
         self._agent_definitions: dict[str, AgentDefinition] = {}
         self.__register_all_agents()
@@ -43,6 +50,8 @@ class AgentManager:
             config=self.config,
             system_prompt=definition.system_prompt,
             response_model=definition.response_model,
+            client=self.client,
+            uploaded_files=self.uploaded_files,
         )
         self._agents[definition.agent_id] = agent
         self._agent_definitions[definition.agent_id] = definition
@@ -51,17 +60,40 @@ class AgentManager:
         """Получает агента по ID"""
         return self._agents.get(agent_id)
 
-    def run_agent(self, agent_id: str, user_input: str, files: list[FilesData] | None = None) -> BaseModel | None:
+    async def run_agent(
+        self, agent_id: str, user_input: str, files: list[FilesData] | None = None
+    ) -> BaseModel | None:
         """Запускает агента с переданным user_input"""
         agent = self.get_agent(agent_id)
         if agent is None:
             return None
-        return agent.run(user_input, files=files)
+        return await agent.run(user_input, files=files)
 
     def list_agents(self) -> list[str]:
         """Возвращает список всех зарегистрированных агентов"""
         return list(self._agents.keys())
 
+    async def aclose(self) -> None:
+        """Закрывает общий пул HTTP-соединений агентов"""
+        await self.client.close()
+
+    @staticmethod
+    def _create_client(config: AgentConfig) -> AsyncOpenAI:
+        """Один асинхронный клиент на всех агентов: общий пул соединений и таймауты из настроек"""
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=config.MAX_CONNECTIONS, max_keepalive_connections=config.MAX_CONNECTIONS
+            ),
+        )
+        client = AsyncOpenAI(
+            api_key=config.TOKEN.get_secret_value(),
+            base_url=config.BASE_URL,
+            timeout=httpx.Timeout(config.TIMEOUT_SECONDS, connect=config.CONNECT_TIMEOUT_SECONDS),
+            max_retries=config.MAX_RETRIES,
+            http_client=http_client,
+        )
+        return instructor.patch(client)
+
     def __register_all_agents(self) -> None:
         """Регистрирует всех агентов в системе"""
         methods = [
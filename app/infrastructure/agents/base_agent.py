@@ -1,22 +1,32 @@
 from typing import Type
 
-import instructor
 from app.core.schemas.agents_schemas import FilesData
+from app.infrastructure.agents.uploaded_files import UploadedFileRegistry
 from app.settings import AgentConfig
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 
 class BaseAgent:
 
-    def __init__(self, config: AgentConfig, system_prompt: str, response_model: Type[BaseModel]):
+    def __init__(
+        self,
+        config: AgentConfig,
+        system_prompt: str,
+        response_model: Type[BaseModel],
+        client: AsyncOpenAI,
+        uploaded_files: UploadedFileRegistry,
+    ):
 
         self.llm_model = config.MODEL
         self.temperature = config.TEMPERATURE
         self._system_prompt = system_prompt
         self.response_schema = response_model
 
-        self.client = instructor.patch(OpenAI(api_key=config.TOKEN.get_secret_value()))
+        # Async client patched by instructor, shared by all agents of the manager and their connection pool
+        self.client = client
+        # PDF attachments are uploaded once per content hash, not on every run
+        self.uploaded_files = uploaded_files
 
     @property
     def system_prompt(self) -> str:
@@ -26,18 +36,19 @@ class BaseAgent:
     def system_prompt(self, new_system_prompt: str) -> None:
         self._system_prompt = new_system_prompt
 
-    def run(self, user_input: str, files: list[FilesData] | None = None) -> BaseModel:
+    async def run(self, user_input: str, files: list[FilesData] | None = None) -> BaseModel:
         content = [{"type": "text", "text": user_input}]
 
         for file in files or []:
-            content.extend(file.upload_and_get_payload(self.client))
+            file_id = await self.uploaded_files.file_id(file) if file.is_pdf else None
+            content.extend(file.get_payload(file_id))
 
         messages = [
             {"role": "system", "content": self._system_prompt},
             {"role": "user", "content": content},
         ]
 
-        conversation_result = self.client.chat.completions.create(
+        conversation_result = await self.client.chat.completions.create(
             model=self.llm_model, response_model=self.response_schema, messages=messages, temperature=self.temperature
         )
         return conversation_result
@@ -0,0 +1,89 @@
+import asyncio
+import io
+from types import ModuleType
+from typing import Any, ClassVar, Optional
+
+from app.core.interfaces.image_preprocessor import ImagePreprocessorInterface
+from loguru import logger
+
+
+def _pil() -> Optional[ModuleType]:
+    try:
+        import PIL.Image
+        import PIL.ImageOps  # noqa: F401
+    except ImportError:
+        return None
+    return PIL
+
+
+class PillowImagePreprocessor(ImagePreprocessorInterface):
+    """
+    Downsizes attached images to ``max_edge`` pixels on the longer side and recompresses them with Pillow.
+
+    EXIF orientation is applied to the pixels, then the image is saved without EXIF, text chunks
+    and color profiles. PNG stays PNG (floor plans are mostly line drawings), other formats become
+    JPEG of the given quality. An image that is not reduced and would not get smaller is sent as is.
+    Pillow is pinned in requirements.txt; if it is still missing, ``available()`` is False and images are sent unchanged.
+    """
+
+    # Increase when the processing changes, so previously stored variants are not reused
+    VERSION: ClassVar[int] = 2
+    CONTENT_TYPES: ClassVar[frozenset[str]] = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+    def __init__(self, max_edge: int, quality: int) -> None:
+        self.max_edge = max_edge
+        self.quality = quality
+
+    @staticmethod
+    def available() -> bool:
+        return _pil() is not None
+
+    @property
+    def variant(self) -> str:
+        return f"agent-v{self.VERSION}-{self.max_edge}px-q{self.quality}"
+
+    def accepts(self, content_type: str) -> bool:
+        return content_type in self.CONTENT_TYPES
+
+    def output_content_type(self, content_type: str) -> str:
+        return "image/png" if content_type == "image/png" else "image/jpeg"
+
+    async def process(self, content: bytes, content_type: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self.process_image, content, content_type)
+
+    def process_image(self, content: bytes, content_type: str) -> Optional[bytes]:
+        """Blocking counterpart of ``process``."""
+        pil = _pil()
+        if pil is None:
+            return None
+        try:
+            with pil.Image.open(io.BytesIO(content)) as source:
+                image = pil.ImageOps.exif_transpose(source)
+                resized = max(image.size) > self.max_edge
+                if resized:
+                    image.thumbnail((self.max_edge, self.max_edge), pil.Image.Resampling.LANCZOS)
+
+                output = io.BytesIO()
+                if self.output_content_type(content_type) == "image/png":
+                    # The PNG encoder falls back to image.info for the color profile, JPEG takes only what is passed
+                    image.save(output, format="PNG", optimize=True, icc_profile=None)
+                else:
+                    if image.mode != "RGB":
+                        image = self._flatten(pil, image)
+                    image.save(output, format="JPEG", quality=self.quality, optimize=True)
+        except (OSError, ValueError, pil.Image.DecompressionBombError) as e:
+            logger.warning(f"Image is sent unprocessed, it could not be processed: {e}")
+            return None
+
+        processed = output.getvalue()
+        if not resized and len(processed) >= len(content):
+            return None
+        return processed
+
+    @staticmethod
+    def _flatten(pil: ModuleType, image: Any) -> Any:
+        # JPEG has no transparency: transparent areas become white, as on a printed plan
+        rgba = image.convert("RGBA")
+        background = pil.Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
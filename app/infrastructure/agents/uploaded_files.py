@@ -0,0 +1,51 @@
+import hashlib
+from collections import OrderedDict
+from typing import ClassVar, Optional
+
+from app.core.interfaces.agent_response_cache import AgentResponseCacheInterface
+from app.core.schemas.agents_schemas import FilesData
+from app.settings import AgentConfig
+from loguru import logger
+from openai import AsyncOpenAI
+
+
+class UploadedFileRegistry:
+    """
+    Provider file ids of uploaded attachments, keyed by content hash.
+
+    A PDF is uploaded to the files API once and its id is reused by later agent runs. Ids are kept
+    in memory and, when a cache is given, stored in it, so they survive restarts and are shared
+    between workers until the cache entry expires. Ids belong to the account of the API key, so
+    the key and the base URL are part of the cache key.
+    """
+
+    # File ids kept in memory; the cache keeps the rest
+    MEMORY_SIZE: ClassVar[int] = 1024
+
+    def __init__(
+        self, client: AsyncOpenAI, config: AgentConfig, cache: Optional[AgentResponseCacheInterface] = None
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self._scope = hashlib.sha256(f"{config.BASE_URL}\n{config.TOKEN.get_secret_value()}".encode()).hexdigest()
+        self._file_ids: OrderedDict[str, str] = OrderedDict()
+
+    async def file_id(self, file: FilesData) -> str:
+        """Return the provider file id of the file, uploading it only if it was not uploaded before."""
+        key = f"uploaded-file:{self._scope}:{file.content_digest}"
+        file_id = self._file_ids.get(key)
+        if file_id is None and self.cache is not None:
+            cached = await self.cache.get(key)
+            file_id = None if cached is None else cached["file_id"]
+        if file_id is None:
+            uploaded_file = await self.client.files.create(file=file.file_obj(), purpose="assistants")
+            file_id = uploaded_file.id
+            logger.info(f"Uploaded {file.file_name} to the files API as {file_id}")
+            if self.cache is not None:
+                await self.cache.set(key, {"file_id": file_id})
+
+        self._file_ids[key] = file_id
+        self._file_ids.move_to_end(key)
+        if len(self._file_ids) > self.MEMORY_SIZE:
+            self._file_ids.popitem(last=False)
+        return file_id
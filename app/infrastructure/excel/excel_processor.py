@@ -1,11 +1,70 @@
+from datetime import date, datetime, time, timedelta
 from io import BytesIO
+from tempfile import TemporaryFile
+from typing import Any, BinaryIO, Generator, Optional, Sequence
 
 import pandas as pd
-from app.core.exceptions.domain import FileReadException, InvalidFileFormatException
-from app.core.interfaces.file_processing import FileProcessingInterface
+from app.core.exceptions.domain import FileReadException
+from app.core.interfaces.file_processing import TabularFileWriterInterface
+from app.infrastructure.file_processing.base import TabularFileProcessor
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 
+# Types openpyxl stores as cell values; anything else (dicts, lists) is written as its str()
+CELL_VALUE_TYPES = (str, int, float, bool, date, datetime, time, timedelta)
 
-class ExcelProcessor(FileProcessingInterface):
+
+class ExcelFileWriter(TabularFileWriterInterface):
+    """
+    Writes an .xlsx file row batch by row batch with an openpyxl write-only workbook.
+
+    Rows go straight to the sheet XML in a temporary file, so memory does not grow with the number of rows.
+    The header looks like the one ``DataFrame.to_excel`` writes (bold, bordered, centered).
+    """
+
+    SHEET_TITLE = "Sheet1"
+
+    def __init__(self, columns: list[str]):
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(self.SHEET_TITLE)
+        self.sheet.append([self._header_cell(column) for column in columns])
+
+    def _header_cell(self, value: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.sheet, value=value)
+        thin = Side(style="thin")
+        cell.font = Font(bold=True)
+        cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cell.alignment = Alignment(horizontal="center", vertical="top")
+        return cell
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        try:
+            for row in rows:
+                self.sheet.append(
+                    [value if value is None or isinstance(value, CELL_VALUE_TYPES) else str(value) for value in row]
+                )
+        except Exception as e:
+            raise FileReadException(f"Failed to write Excel file: {str(e)}")
+
+    def close(self) -> BinaryIO:
+        output = TemporaryFile()
+        try:
+            self.workbook.save(output)
+        except Exception as e:
+            output.close()
+            raise FileReadException(f"Failed to write Excel file: {str(e)}")
+        output.seek(0)
+        return output
+
+    def discard(self) -> None:
+        # The sheet XML is a named temporary file of openpyxl, removed only by saving the workbook
+        if not self.sheet.closed:
+            self.sheet.close()
+            self.sheet._writer.cleanup()
+
+
+class ExcelProcessor(TabularFileProcessor):
     """
     Infrastructure layer implementation for Excel file processing.
 
@@ -13,13 +72,17 @@ class ExcelProcessor(FileProcessingInterface):
     while business logic remains in the service layer.
     """
 
-    async def read_excel_file(self, file_content: bytes, filename: str) -> pd.DataFrame:
+    EXTENSIONS = (".xlsx", ".xls")
+    CONTENT_TYPES = ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "application/vnd.ms-excel")
+
+    def read_file(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> pd.DataFrame:
         """
         Read Excel file content into pandas DataFrame.
 
         Args:
             file_content: Raw file content as bytes
             filename: Name of the file for validation
+            content_type: Not used, the processor reads Excel only
 
         Returns:
             pandas DataFrame with file content
@@ -33,20 +96,80 @@ class ExcelProcessor(FileProcessingInterface):
         except Exception as e:
             raise FileReadException(f"Failed to read Excel file '{filename}': {str(e)}")
 
-    def validate_file_format(self, filename: str) -> None:
+    def iter_file_batches(
+        self, file: BinaryIO, filename: str, batch_size: int, content_type: Optional[str] = None
+    ) -> Generator[pd.DataFrame, None, None]:
         """
-        Validate that the file is in Excel format.
+        Read the first sheet of an .xlsx file as DataFrames of at most ``batch_size`` rows.
+
+        The workbook is opened in openpyxl read-only mode, so rows are parsed from the sheet XML
+        as they are consumed and only the current batch is held in memory. Columns and empty rows
+        follow ``pd.read_excel``: unnamed headers become ``Unnamed: N``, repeated ones get a ``.N`` suffix,
+        and trailing empty rows and columns are dropped. A file with headers only yields one empty batch.
+        Blocking: callers iterate it off the event loop.
 
         Args:
-            filename: Name of the file to validate
+            file: Seekable binary file with the workbook, e.g. the spooled file of an upload
+            filename: Name of the file for error messages
+            batch_size: Maximum number of rows per batch
+            content_type: Not used, the processor reads Excel only
+
+        Yields:
+            pandas DataFrames with consecutive rows of the sheet
 
         Raises:
-            InvalidFileFormatException: If file format is invalid
+            FileReadException: If file cannot be read
         """
-        if not filename or not filename.endswith((".xlsx", ".xls")):
-            raise InvalidFileFormatException(f"File '{filename}' must be in .xlsx or .xls format")
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception as e:
+            raise FileReadException(f"Failed to read Excel file '{filename}': {str(e)}")
 
-    async def write_excel_file(self, df: pd.DataFrame) -> bytes:
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            columns = self._header_columns(next(rows, ()))
+            batch: list[tuple] = []
+            empty_rows: list[tuple] = []
+            yielded = False
+
+            for row in rows:
+                values = tuple(row[: len(columns)]) + (None,) * (len(columns) - len(row))
+                if all(value is None for value in values):
+                    # Empty rows count only when data follows them
+                    empty_rows.append(values)
+                    continue
+                batch.extend(empty_rows)
+                empty_rows.clear()
+                batch.append(values)
+                while len(batch) >= batch_size:
+                    yield pd.DataFrame(batch[:batch_size], columns=columns)
+                    batch = batch[batch_size:]
+                    yielded = True
+
+            if batch or not yielded:
+                yield pd.DataFrame(batch, columns=columns)
+        except FileReadException:
+            raise
+        except Exception as e:
+            raise FileReadException(f"Failed to read Excel file '{filename}': {str(e)}")
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _header_columns(header: tuple[Any, ...]) -> list[str]:
+        header = tuple(header)
+        while header and header[-1] is None:
+            header = header[:-1]
+        columns: list[str] = []
+        for position, value in enumerate(header):
+            name = f"Unnamed: {position}" if value is None else str(value)
+            unique_name, suffix = name, 1
+            while unique_name in columns:
+                unique_name, suffix = f"{name}.{suffix}", suffix + 1
+            columns.append(unique_name)
+        return columns
+
+    def write_file(self, df: pd.DataFrame) -> bytes:
         """
         Write pandas DataFrame to Excel file and return as bytes.
 
@@ -66,3 +189,16 @@ class ExcelProcessor(FileProcessingInterface):
             return output.getvalue()
         except Exception as e:
             raise FileReadException(f"Failed to write Excel file: {str(e)}")
+
+    def open_writer(self, columns: list[str], filename: str) -> ExcelFileWriter:
+        """
+        Start an .xlsx file written in constant memory, see ExcelFileWriter.
+
+        Args:
+            columns: Header of the sheet
+            filename: Not used, the processor writes Excel only
+
+        Returns:
+            Writer of the file
+        """
+        return ExcelFileWriter(columns)
@@ -0,0 +1,34 @@
+from typing import ClassVar, Optional
+
+from app.core.exceptions.domain import InvalidFileFormatException
+from app.core.interfaces.file_processing import FileProcessingInterface
+
+
+class TabularFileProcessor(FileProcessingInterface):
+    """
+    Base class of the processors for one tabular file format.
+
+    A file belongs to the format by its extension or, failing that, by the content type of the upload.
+    Every format produces the same DataFrame shape, so uploads of any format go through
+    the same column checks and validation in the service layer.
+    """
+
+    EXTENSIONS: ClassVar[tuple[str, ...]] = ()
+    CONTENT_TYPES: ClassVar[tuple[str, ...]] = ()
+
+    def matches_extension(self, filename: str) -> bool:
+        return (filename or "").lower().endswith(self.EXTENSIONS)
+
+    def matches_content_type(self, content_type: Optional[str]) -> bool:
+        media_type = (content_type or "").split(";", 1)[0].strip().lower()
+        return media_type in self.CONTENT_TYPES
+
+    def validate_file_format(self, filename: str, content_type: Optional[str] = None) -> None:
+        """
+        Validate that the file is in the format of this processor.
+
+        Raises:
+            InvalidFileFormatException: If file format is invalid
+        """
+        if not (self.matches_extension(filename) or self.matches_content_type(content_type)):
+            raise InvalidFileFormatException(f"File '{filename}' must be in {' or '.join(self.EXTENSIONS)} format")
@@ -0,0 +1,130 @@
+import codecs
+import csv
+from io import BytesIO, TextIOWrapper
+from tempfile import TemporaryFile
+from typing import Any, BinaryIO, Generator, Optional, Sequence
+
+import pandas as pd
+from app.core.exceptions.domain import FileReadException
+from app.core.interfaces.file_processing import TabularFileWriterInterface
+from app.infrastructure.file_processing.base import TabularFileProcessor
+
+
+class CsvFileWriter(TabularFileWriterInterface):
+    """Writes a UTF-8 CSV file row batch by row batch into a temporary file."""
+
+    def __init__(self, columns: list[str]):
+        self.output = TemporaryFile()
+        self.text = TextIOWrapper(self.output, encoding="utf-8", newline="")
+        self.writer = csv.writer(self.text)
+        self.writer.writerow(columns)
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        try:
+            self.writer.writerows(rows)
+        except Exception as e:
+            raise FileReadException(f"Failed to write CSV file: {str(e)}")
+
+    def close(self) -> BinaryIO:
+        self.text.flush()
+        # Detach so that closing the wrapper does not close the file handed to the caller
+        self.text.detach()
+        self.output.seek(0)
+        return self.output
+
+    def discard(self) -> None:
+        self.text.close()
+
+
+class CsvProcessor(TabularFileProcessor):
+    """
+    Infrastructure layer implementation for CSV file processing.
+
+    Values are read as text and only empty cells become missing, so numbers and flags are converted
+    by the same validation rules as Excel cells. The delimiter (comma, semicolon or tab) and the encoding
+    (UTF-8 with or without BOM, otherwise Windows-1251) are detected from the beginning of the file.
+    """
+
+    EXTENSIONS = (".csv",)
+    CONTENT_TYPES = ("text/csv", "application/csv", "text/comma-separated-values")
+    SAMPLE_SIZE = 64 * 1024
+    DELIMITERS = "\t;,"
+
+    def read_file(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Read CSV file content into pandas DataFrame.
+
+        Raises:
+            FileReadException: If file cannot be read
+        """
+        try:
+            return pd.read_csv(BytesIO(file_content), **self._read_options(file_content[: self.SAMPLE_SIZE]))
+        except Exception as e:
+            raise FileReadException(f"Failed to read CSV file '{filename}': {str(e)}")
+
+    def iter_file_batches(
+        self, file: BinaryIO, filename: str, batch_size: int, content_type: Optional[str] = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Read a CSV file in chunks of at most ``batch_size`` rows, holding only the current chunk in memory.
+        A file with headers only yields one empty batch. Blocking: callers iterate it off the event loop.
+
+        Raises:
+            FileReadException: If file cannot be read
+        """
+        try:
+            options = self._read_options(file.read(self.SAMPLE_SIZE))
+            file.seek(0)
+            yielded = False
+            with pd.read_csv(file, chunksize=batch_size, **options) as chunks:
+                for chunk in chunks:
+                    yielded = True
+                    yield chunk.reset_index(drop=True)
+            if not yielded:
+                file.seek(0)
+                yield pd.read_csv(file, nrows=0, **options)
+        except Exception as e:
+            raise FileReadException(f"Failed to read CSV file '{filename}': {str(e)}")
+
+    def write_file(self, df: pd.DataFrame) -> bytes:
+        """
+        Write pandas DataFrame to CSV file and return as bytes.
+
+        Raises:
+            FileReadException: If file cannot be written
+        """
+        try:
+            return df.to_csv(index=False).encode("utf-8")
+        except Exception as e:
+            raise FileReadException(f"Failed to write CSV file: {str(e)}")
+
+    def open_writer(self, columns: list[str], filename: str) -> CsvFileWriter:
+        """Start a CSV file written in constant memory."""
+        return CsvFileWriter(columns)
+
+    def _read_options(self, sample: bytes) -> dict[str, Any]:
+        encoding = self._detect_encoding(sample)
+        text = sample.decode(encoding, errors="ignore")
+        lines = text.splitlines() if len(sample) < self.SAMPLE_SIZE else text.splitlines()[:-1]
+        delimiter = self._detect_delimiter(lines[:20])
+        return {"sep": delimiter, "encoding": encoding, "dtype": str, "keep_default_na": False, "na_values": [""]}
+
+    def _detect_delimiter(self, lines: list[str]) -> str:
+        """
+        The first delimiter that splits every line into the same number of fields (more than one).
+        Tab and semicolon go first: header names like "Total area, m2" and decimal commas contain commas.
+        """
+        for delimiter in self.DELIMITERS:
+            field_counts = {len(fields) for fields in csv.reader(lines, delimiter=delimiter)}
+            if len(field_counts) == 1 and field_counts.pop() > 1:
+                return delimiter
+        return ","
+
+    @staticmethod
+    def _detect_encoding(sample: bytes) -> str:
+        try:
+            # The sample may end in the middle of a character, so the decoder is not finalized
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        except UnicodeDecodeError:
+            return "cp1251"
+        return "utf-8-sig"
@@ -0,0 +1,45 @@
+from typing import BinaryIO, Iterator, Optional
+
+import pandas as pd
+from app.core.exceptions.domain import InvalidFileFormatException
+from app.core.interfaces.file_processing import FileProcessingInterface, TabularFileWriterInterface
+from app.infrastructure.file_processing.base import TabularFileProcessor
+
+
+class FileProcessorRegistry(FileProcessingInterface):
+    """
+    Picks the processor of an upload by its extension, or by its content type if no extension matches.
+
+    Generated files are written by the processor of their extension; ``write_file`` always uses ``writer``.
+    """
+
+    def __init__(self, processors: list[TabularFileProcessor], writer: FileProcessingInterface):
+        self.processors = processors
+        self.writer = writer
+
+    def resolve(self, filename: str, content_type: Optional[str] = None) -> TabularFileProcessor:
+        for processor in self.processors:
+            if processor.matches_extension(filename):
+                return processor
+        for processor in self.processors:
+            if processor.matches_content_type(content_type):
+                return processor
+        extensions = ", ".join(extension for processor in self.processors for extension in processor.EXTENSIONS)
+        raise InvalidFileFormatException(f"File '{filename}' must be in one of the formats: {extensions}")
+
+    def read_file(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> pd.DataFrame:
+        return self.resolve(filename, content_type).read_file(file_content, filename, content_type)
+
+    def iter_file_batches(
+        self, file: BinaryIO, filename: str, batch_size: int, content_type: Optional[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        return self.resolve(filename, content_type).iter_file_batches(file, filename, batch_size, content_type)
+
+    def validate_file_format(self, filename: str, content_type: Optional[str] = None) -> None:
+        self.resolve(filename, content_type).validate_file_format(filename, content_type)
+
+    def write_file(self, df: pd.DataFrame) -> bytes:
+        return self.writer.write_file(df)
+
+    def open_writer(self, columns: list[str], filename: str) -> TabularFileWriterInterface:
+        return self.resolve(filename).open_writer(columns, filename)
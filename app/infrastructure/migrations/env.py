@@ -13,7 +13,12 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-config.set_main_option("sqlalchemy.url", settings.database.DATABASE_URL)
+# Percent signs from URL-encoded credentials or socket paths are escaped for configparser
+config.set_main_option("sqlalchemy.url", settings.database.DATABASE_URL.replace("%", "%%"))
+
+# Migrations are written for PostgreSQL; a SQLite database gets its schema from the models on startup
+if settings.database.IS_SQLITE:
+    raise RuntimeError("Migrations target PostgreSQL, SQLite schema is created by the application on startup")
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
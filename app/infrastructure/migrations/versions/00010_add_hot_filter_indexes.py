@@ -0,0 +1,115 @@
+"""add hot filter indexes
+
+Revision ID: 00010
+Revises: 00009
+Create Date: 2026-10-19 10:12:41.503216
+
+Partial indexes on ``is_active`` back the active-set filters used by the repositories and
+stay small while inactive history keeps growing. No query filters the inactive rows of one
+REO, so premises and committed prices get no full (reo_id, is_active) index next to the
+partial one. ``users.email`` is already covered by ``users_email_key``.
+Indexes are built concurrently so the migration does not lock the tables.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00010"
+down_revision: Union[str, None] = "00009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_premises_reo_id_active",
+            "premises",
+            ["reo_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_committed_prices_reo_id_distribution_config_id_active",
+            "committed_prices",
+            ["reo_id", "distribution_config_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pricing_configs_reo_id_active",
+            "pricing_configs",
+            ["reo_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_income_plans_reo_id_active",
+            "income_plans",
+            ["reo_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_real_estate_objects_user_id_is_deleted",
+            "real_estate_objects",
+            ["user_id", "is_deleted"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_sales_premises_id"),
+            "sales",
+            ["premises_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_layout_type_attachments_reo_id_layout_type",
+            "layout_type_attachments",
+            ["reo_id", "layout_type"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_window_view_attachments_reo_id_view_from_window",
+            "window_view_attachments",
+            ["reo_id", "view_from_window"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_window_view_attachments_reo_id_view_from_window",
+            table_name="window_view_attachments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_layout_type_attachments_reo_id_layout_type",
+            table_name="layout_type_attachments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(op.f("ix_sales_premises_id"), table_name="sales", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_real_estate_objects_user_id_is_deleted", table_name="real_estate_objects", postgresql_concurrently=True
+        )
+        op.drop_index("ix_income_plans_reo_id_active", table_name="income_plans", postgresql_concurrently=True)
+        op.drop_index("ix_pricing_configs_reo_id_active", table_name="pricing_configs", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_committed_prices_reo_id_distribution_config_id_active",
+            table_name="committed_prices",
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_premises_reo_id_active", table_name="premises", postgresql_concurrently=True)
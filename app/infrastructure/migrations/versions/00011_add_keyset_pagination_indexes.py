@@ -0,0 +1,59 @@
+"""add keyset pagination indexes
+
+Revision ID: 00011
+Revises: 00010
+Create Date: 2026-10-19 11:03:17.284903
+
+List endpoints page by ``id`` descending inside a REO, so (reo_id, id) lets the
+planner walk the index backwards and stop after one page instead of sorting.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00011"
+down_revision: Union[str, None] = "00010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_premises_reo_id_id", "premises", ["reo_id", "id"], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_premises_reo_id_status", "premises", ["reo_id", "status"], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_committed_prices_reo_id_id",
+            "committed_prices",
+            ["reo_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pricing_configs_reo_id_id",
+            "pricing_configs",
+            ["reo_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_income_plans_reo_id_id", "income_plans", ["reo_id", "id"], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(op.f("ix_sales_saledate"), "sales", ["saledate"], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f("ix_sales_saledate"), table_name="sales", postgresql_concurrently=True)
+        op.drop_index("ix_income_plans_reo_id_id", table_name="income_plans", postgresql_concurrently=True)
+        op.drop_index("ix_pricing_configs_reo_id_id", table_name="pricing_configs", postgresql_concurrently=True)
+        op.drop_index("ix_committed_prices_reo_id_id", table_name="committed_prices", postgresql_concurrently=True)
+        op.drop_index("ix_premises_reo_id_status", table_name="premises", postgresql_concurrently=True)
+        op.drop_index("ix_premises_reo_id_id", table_name="premises", postgresql_concurrently=True)
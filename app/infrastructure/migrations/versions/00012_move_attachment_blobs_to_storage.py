@@ -0,0 +1,84 @@
+"""move attachment blobs to storage
+
+Revision ID: 00012
+Revises: 00011
+Create Date: 2026-10-19 12:21:54.730118
+
+Attachment files are moved from the base64 ``base64_file`` column into the
+content-addressed attachment storage (``ATTACHMENTS_DIR``); rows keep only the
+sha256 ``content_hash``. Downgrade reads the blobs back from the same storage.
+"""
+
+import base64
+import io
+from typing import Iterator, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from app.infrastructure.storage.local_attachment_storage import LocalAttachmentStorage
+from app.settings import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "00012"
+down_revision: Union[str, None] = "00011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ATTACHMENT_TABLES = ("layout_type_attachments", "window_view_attachments")
+BATCH_SIZE = 100
+
+
+def _iter_batches(table: str, column: str) -> Iterator[Sequence[sa.Row]]:
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.text(f"SELECT id, {column} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    storage = LocalAttachmentStorage(root_dir=settings.storage.ATTACHMENTS_DIR)
+    connection = op.get_bind()
+
+    for table in ATTACHMENT_TABLES:
+        op.add_column(table, sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+        for rows in _iter_batches(table, "base64_file"):
+            for row in rows:
+                content_hash, _ = storage.write_blob(io.BytesIO(base64.b64decode(row.base64_file)))
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET content_hash = :content_hash WHERE id = :id"),
+                    {"content_hash": content_hash, "id": row.id},
+                )
+
+        op.alter_column(table, "content_hash", nullable=False)
+        op.create_index(op.f(f"ix_{table}_content_hash"), table, ["content_hash"], unique=False)
+        op.drop_column(table, "base64_file")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    storage = LocalAttachmentStorage(root_dir=settings.storage.ATTACHMENTS_DIR)
+    connection = op.get_bind()
+
+    for table in ATTACHMENT_TABLES:
+        op.add_column(table, sa.Column("base64_file", sa.Text(), nullable=True))
+
+        for rows in _iter_batches(table, "content_hash"):
+            for row in rows:
+                content = storage.read_blob(row.content_hash)
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET base64_file = :base64_file WHERE id = :id"),
+                    {"base64_file": base64.b64encode(content).decode("utf-8"), "id": row.id},
+                )
+
+        op.alter_column(table, "base64_file", nullable=False)
+        op.drop_index(op.f(f"ix_{table}_content_hash"), table_name=table)
+        op.drop_column(table, "content_hash")
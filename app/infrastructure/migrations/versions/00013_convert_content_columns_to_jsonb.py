@@ -0,0 +1,78 @@
+"""convert content columns to jsonb
+
+Revision ID: 00013
+Revises: 00012
+Create Date: 2026-10-19 14:02:55.618342
+
+``pricing_configs.content`` and ``committed_prices.content`` become JSONB so the
+repositories can extract single fields (ranging of one factor, actual price per sqm)
+in the database instead of loading whole documents. The expression index backs
+per-premise lookups inside the active committed snapshot of a REO.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "00013"
+down_revision: Union[str, None] = "00012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "pricing_configs",
+        "content",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="content::jsonb",
+    )
+    op.alter_column(
+        "committed_prices",
+        "content",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="content::jsonb",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_committed_prices_reo_id_premise_id_active",
+            "committed_prices",
+            ["reo_id", sa.text("((content ->> 'id')::integer)")],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_committed_prices_reo_id_premise_id_active",
+            table_name="committed_prices",
+            postgresql_concurrently=True,
+        )
+    op.alter_column(
+        "committed_prices",
+        "content",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="content::json",
+    )
+    op.alter_column(
+        "pricing_configs",
+        "content",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="content::json",
+    )
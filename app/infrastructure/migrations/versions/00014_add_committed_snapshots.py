@@ -0,0 +1,70 @@
+"""add committed snapshots
+
+Revision ID: 00014
+Revises: 00013
+Create Date: 2026-10-19 15:21:08.904117
+
+A commit is stored as one header row with parallel premise/price arrays and a packed
+calculation matrix instead of one ``committed_prices`` row with a full JSON copy of the
+premise per premise. Existing ``committed_prices`` rows are left in place and stay readable.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00014"
+down_revision: Union[str, None] = "00013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "committed_snapshots",
+        sa.Column("reo_id", sa.Integer(), nullable=False),
+        sa.Column("pricing_config_id", sa.Integer(), nullable=False),
+        sa.Column("distribution_config_id", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("premises_count", sa.Integer(), nullable=False),
+        sa.Column("premise_ids", sa.JSON(), nullable=False),
+        sa.Column("actual_prices", sa.JSON(), nullable=False),
+        sa.Column("x_ranks", sa.JSON(), nullable=False),
+        sa.Column("calculation_fields", sa.JSON(), nullable=False),
+        sa.Column("calculation", sa.LargeBinary(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["distribution_config_id"],
+            ["distribution_configs.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["pricing_config_id"],
+            ["pricing_configs.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["reo_id"],
+            ["real_estate_objects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_committed_snapshots_reo_id_distribution_config_id_active",
+        "committed_snapshots",
+        ["reo_id", "distribution_config_id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index("ix_committed_snapshots_reo_id_id", "committed_snapshots", ["reo_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_committed_snapshots_reo_id_id", table_name="committed_snapshots")
+    op.drop_index("ix_committed_snapshots_reo_id_distribution_config_id_active", table_name="committed_snapshots")
+    op.drop_table("committed_snapshots")
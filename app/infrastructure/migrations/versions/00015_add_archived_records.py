@@ -0,0 +1,51 @@
+"""add archived records
+
+Revision ID: 00015
+Revises: 00014
+Create Date: 2026-10-19 16:40:12.337085
+
+Inactive premises, commits, pricing configs and income plans older than the retention
+threshold are moved here by the archive job, so the hot tables only keep the active set
+plus recent history. Rows are stored as JSON payloads and can be restored under their id.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "00015"
+down_revision: Union[str, None] = "00014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "archived_records",
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("record_id", sa.Integer(), nullable=False),
+        sa.Column("reo_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_archived_records_table_name_record_id", "archived_records", ["table_name", "record_id"], unique=True
+    )
+    op.create_index("ix_archived_records_reo_id_id", "archived_records", ["reo_id", "id"], unique=False)
+    op.create_index("ix_archived_records_created_at", "archived_records", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_archived_records_created_at", table_name="archived_records")
+    op.drop_index("ix_archived_records_reo_id_id", table_name="archived_records")
+    op.drop_index("ix_archived_records_table_name_record_id", table_name="archived_records")
+    op.drop_table("archived_records")
@@ -0,0 +1,55 @@
+"""add reo premises summaries
+
+Revision ID: 00016
+Revises: 00015
+Create Date: 2026-10-19 18:05:41.902215
+
+One row per REO with counts, price bounds and distinct floors, areas and entrances of its
+active premises. Repositories rebuild the row in the same transaction as premise and sale
+writes; REOs without a row get it on the first read, so no backfill is needed here.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00016"
+down_revision: Union[str, None] = "00015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "reo_premises_summaries",
+        sa.Column("reo_id", sa.Integer(), nullable=False),
+        sa.Column("premises_count", sa.Integer(), nullable=False),
+        sa.Column("sold_count", sa.Integer(), nullable=False),
+        sa.Column("available_count", sa.Integer(), nullable=False),
+        sa.Column("min_price_per_meter", sa.Float(), nullable=True),
+        sa.Column("max_price_per_meter", sa.Float(), nullable=True),
+        sa.Column("avg_price_per_meter", sa.Float(), nullable=True),
+        sa.Column("floors", sa.JSON(), nullable=False),
+        sa.Column("total_areas", sa.JSON(), nullable=False),
+        sa.Column("entrances", sa.JSON(), nullable=False),
+        sa.Column("sales_count", sa.Integer(), nullable=False),
+        sa.Column("sales_amount", sa.Float(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["reo_id"],
+            ["real_estate_objects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("reo_id"),
+        sqlite_autoincrement=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("reo_premises_summaries")
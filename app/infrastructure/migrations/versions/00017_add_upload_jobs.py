@@ -0,0 +1,78 @@
+"""add upload jobs
+
+Revision ID: 00017
+Revises: 00016
+Create Date: 2026-10-19 21:12:07.530184
+
+Background specification uploads: one row per job with the resume offset of the chunked upload,
+row-level progress and errors. Premises loaded by a job reference it through upload_job_id and stay
+inactive until the job swaps them in; existing premises keep NULL.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00017"
+down_revision: Union[str, None] = "00016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "upload_jobs",
+        sa.Column("reo_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "UPLOADING", "QUEUED", "PROCESSING", "COMPLETED", "FAILED", name="uploadjobstatus", native_enum=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("total_size", sa.BigInteger(), nullable=True),
+        sa.Column("received_size", sa.BigInteger(), nullable=False),
+        sa.Column("rows_processed", sa.Integer(), nullable=False),
+        sa.Column("premises_count", sa.Integer(), nullable=True),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("errors", sa.JSON(), nullable=False),
+        sa.Column("message", sa.String(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["reo_id"],
+            ["real_estate_objects.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_upload_jobs_status_id", "upload_jobs", ["status", "id"], unique=False)
+    op.create_index("ix_upload_jobs_reo_id", "upload_jobs", ["reo_id"], unique=False)
+
+    op.add_column("premises", sa.Column("upload_job_id", sa.Integer(), nullable=True))
+    op.create_foreign_key("fk_premises_upload_job_id", "premises", "upload_jobs", ["upload_job_id"], ["id"])
+    op.create_index("ix_premises_upload_job_id", "premises", ["upload_job_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_premises_upload_job_id", table_name="premises")
+    op.drop_constraint("fk_premises_upload_job_id", "premises", type_="foreignkey")
+    op.drop_column("premises", "upload_job_id")
+
+    op.drop_index("ix_upload_jobs_reo_id", table_name="upload_jobs")
+    op.drop_index("ix_upload_jobs_status_id", table_name="upload_jobs")
+    op.drop_table("upload_jobs")
@@ -0,0 +1,44 @@
+"""add income plans period index
+
+Revision ID: 00018
+Revises: 00017
+Create Date: 2026-10-19 22:41:18.264903
+
+Active income plans are read in period order for the current price interpolation after every
+premises upload. The partial index returns them already sorted, so the service no longer parses
+and sorts the periods itself. Built concurrently so the migration does not lock the table.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00018"
+down_revision: Union[str, None] = "00017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_income_plans_reo_id_period_begin_active",
+            "income_plans",
+            ["reo_id", "period_begin", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_income_plans_reo_id_period_begin_active",
+            table_name="income_plans",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,31 @@
+"""add pricing config version
+
+Revision ID: 00019
+Revises: 00018
+Create Date: 2026-10-19 23:52:07.418306
+
+Agents patch sections of the active pricing config in one UPDATE instead of rewriting the whole
+document. The version lets a patch computed from a read apply only if nobody wrote in between.
+The constant default keeps the column addition a catalog-only change on existing rows.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00019"
+down_revision: Union[str, None] = "00018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("pricing_configs", sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("pricing_configs", "version")
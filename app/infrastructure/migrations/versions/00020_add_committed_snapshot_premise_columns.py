@@ -0,0 +1,112 @@
+"""add committed snapshot premise columns
+
+Revision ID: 00020
+Revises: 00019
+Create Date: 2026-10-19 18:40:26.531904
+
+The export of a committed snapshot is built from the premise fields stored in the snapshot
+instead of the live premise rows, which may have been edited or re-uploaded since the commit.
+Existing snapshots are backfilled from the premises they reference, which is what their
+export read until now; a premise that no longer exists is stored as a row of nulls.
+"""
+
+from typing import Iterator, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00020"
+down_revision: Union[str, None] = "00019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Premise fields of the export as of this revision
+PREMISE_FIELDS = (
+    "property_type",
+    "premises_id",
+    "number_of_unit",
+    "number",
+    "entrance",
+    "floor",
+    "layout_type",
+    "full_price",
+    "total_area_m2",
+    "estimated_area_m2",
+    "price_per_meter",
+    "number_of_rooms",
+    "living_area_m2",
+    "kitchen_area_m2",
+    "view_from_window",
+    "number_of_levels",
+    "number_of_loggias",
+    "number_of_balconies",
+    "number_of_bathrooms_with_toilets",
+    "number_of_separate_bathrooms",
+    "number_of_terraces",
+    "studio",
+    "status",
+    "sales_amount",
+    "customcontent",
+)
+BATCH_SIZE = 100
+
+committed_snapshots = sa.table(
+    "committed_snapshots",
+    sa.column("id", sa.Integer),
+    sa.column("premise_ids", sa.JSON),
+    sa.column("premise_columns", sa.JSON),
+)
+premises = sa.table(
+    "premises",
+    sa.column("id", sa.Integer),
+    *(sa.column(field, sa.JSON if field == "customcontent" else None) for field in PREMISE_FIELDS),
+)
+
+
+def _iter_snapshots() -> Iterator[Sequence[sa.Row]]:
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(committed_snapshots.c.id, committed_snapshots.c.premise_ids)
+            .where(committed_snapshots.c.id > last_id)
+            .order_by(committed_snapshots.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("committed_snapshots", sa.Column("premise_columns", sa.JSON(), nullable=True))
+    connection = op.get_bind()
+
+    for rows in _iter_snapshots():
+        for row in rows:
+            found = {
+                premise.id: premise
+                for premise in connection.execute(sa.select(premises).where(premises.c.id.in_(row.premise_ids)))
+            }
+            columns = {
+                field: [
+                    getattr(found[premise_id], field) if premise_id in found else None
+                    for premise_id in row.premise_ids
+                ]
+                for field in PREMISE_FIELDS
+            }
+            connection.execute(
+                sa.update(committed_snapshots)
+                .where(committed_snapshots.c.id == row.id)
+                .values(premise_columns=columns)
+            )
+
+    op.alter_column("committed_snapshots", "premise_columns", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("committed_snapshots", "premise_columns")
@@ -1,10 +1,55 @@
+from typing import Any
+
+from app.infrastructure.postgres import models  # noqa: F401 - registers every model in the metadata
+from app.infrastructure.postgres.models.base import Base
+from app.infrastructure.postgres.replicas import ReplicaSessionRouter
 from app.settings import settings
-from sqlalchemy import NullPool
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import NullPool, StaticPool, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-engine = create_async_engine(settings.database.DATABASE_URL, echo=False, poolclass=NullPool)
+
+def _engine_options(url: str) -> dict[str, Any]:
+    database_url = make_url(url)
+    if database_url.get_backend_name() != "sqlite":
+        return {"poolclass": NullPool}
+    if database_url.database in (None, "", ":memory:"):
+        # An in-memory database lives as long as its connection, so every session shares one
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    return {"poolclass": NullPool, "connect_args": {"timeout": 30}}
+
+
+def _enable_sqlite_pragmas(sqlite_engine: AsyncEngine) -> None:
+    @event.listens_for(sqlite_engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection: Any, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+
+engine = create_async_engine(
+    settings.database.DATABASE_URL, echo=False, **_engine_options(settings.database.DATABASE_URL)
+)
+if settings.database.IS_SQLITE:
+    _enable_sqlite_pragmas(engine)
 
 DeclarativeBase = declarative_base()
 
 AsyncSessionLocal = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+read_session_router = ReplicaSessionRouter(
+    primary=AsyncSessionLocal,
+    replica_urls=settings.database.READ_REPLICA_URLS,
+    max_lag_seconds=settings.database.REPLICA_MAX_LAG_SECONDS,
+    health_check_interval_seconds=settings.database.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+)
+
+
+async def create_schema() -> None:
+    """
+    Create all tables from the models. Used in SQLite mode, where the Postgres migrations do not apply.
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
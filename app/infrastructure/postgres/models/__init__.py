@@ -1,22 +1,30 @@
+from app.infrastructure.postgres.models.archived_records import ArchivedRecord
 from app.infrastructure.postgres.models.committed_prices import CommittedPrices
+from app.infrastructure.postgres.models.committed_snapshots import CommittedSnapshot
 from app.infrastructure.postgres.models.distribution_configs import DistributionConfig
 from app.infrastructure.postgres.models.income_plans import IncomePlan
 from app.infrastructure.postgres.models.premises import LayoutTypeAttachment, Premises
 from app.infrastructure.postgres.models.pricing_configs import PricingConfig
 from app.infrastructure.postgres.models.real_estate_objects import RealEstateObject
+from app.infrastructure.postgres.models.reo_premises_summaries import ReoPremisesSummary
 from app.infrastructure.postgres.models.sales import Sales
 from app.infrastructure.postgres.models.status_mappings import StatusMapping
+from app.infrastructure.postgres.models.upload_jobs import UploadJob
 from app.infrastructure.postgres.models.users import User
 
 __all__ = [
     "User",
+    "ArchivedRecord",
     "CommittedPrices",
+    "CommittedSnapshot",
     "DistributionConfig",
     "IncomePlan",
     "LayoutTypeAttachment",
     "Premises",
     "PricingConfig",
     "RealEstateObject",
+    "ReoPremisesSummary",
     "Sales",
     "StatusMapping",
+    "UploadJob",
 ]
@@ -0,0 +1,27 @@
+from app.infrastructure.postgres.models.base import Base
+from sqlalchemy import JSON, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class ArchivedRecord(Base):
+    """
+    Inactive row moved out of a hot table.
+
+    ``payload`` keeps the column values of the original row so it can be restored under
+    the same id; ``created_at`` is the archiving time used by the retention policy.
+    """
+
+    __tablename__ = "archived_records"
+
+    table_name: Mapped[str] = mapped_column(String, nullable=False)
+    record_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    reo_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_archived_records_table_name_record_id", "table_name", "record_id", unique=True),
+        Index("ix_archived_records_reo_id_id", "reo_id", "id"),
+        Index("ix_archived_records_created_at", "created_at"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
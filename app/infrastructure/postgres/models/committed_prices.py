@@ -1,5 +1,6 @@
 from app.infrastructure.postgres.models.base import Base
-from sqlalchemy import JSON, Boolean, Float, ForeignKey, Integer
+from sqlalchemy import JSON, Boolean, Float, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -12,11 +13,26 @@ class CommittedPrices(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
     actual_price: Mapped[float] = mapped_column(Float, nullable=False)
     x_rank: Mapped[float] = mapped_column(Float, nullable=False)
-    content: Mapped[dict] = mapped_column(JSON, nullable=False)
+    content: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
 
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="committed_prices")
     pricing_config: Mapped["PricingConfig"] = relationship(back_populates="committed_prices")
     distribution_config: Mapped["DistributionConfig"] = relationship(back_populates="committed_prices")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index(
+            "ix_committed_prices_reo_id_distribution_config_id_active",
+            "reo_id",
+            "distribution_config_id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_committed_prices_reo_id_id", "reo_id", "id"),
+        Index(
+            "ix_committed_prices_reo_id_premise_id_active",
+            "reo_id",
+            text("((content ->> 'id')::integer)"),
+            postgresql_where=text("is_active"),
+        ).ddl_if(dialect="postgresql"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
@@ -0,0 +1,39 @@
+from app.infrastructure.postgres.models.base import Base
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, Integer, LargeBinary, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class CommittedSnapshot(Base):
+    """
+    One committed pricing result of a REO stored column-wise.
+
+    ``premise_ids``, ``actual_prices`` and ``x_ranks`` are parallel arrays, ``calculation``
+    is a row-major float64 matrix with one row per premise and ``calculation_fields`` columns.
+    ``premise_columns`` keeps the exported premise fields as committed, one array per field
+    in ``premise_ids`` order, so the export does not depend on the live premise rows.
+    """
+
+    __tablename__ = "committed_snapshots"
+
+    reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False)
+    pricing_config_id: Mapped[int] = mapped_column(Integer, ForeignKey("pricing_configs.id"), nullable=False)
+    distribution_config_id: Mapped[int] = mapped_column(Integer, ForeignKey("distribution_configs.id"), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    premises_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    premise_ids: Mapped[list] = mapped_column(JSON, nullable=False)
+    actual_prices: Mapped[list] = mapped_column(JSON, nullable=False)
+    x_ranks: Mapped[list] = mapped_column(JSON, nullable=False)
+    calculation_fields: Mapped[list] = mapped_column(JSON, nullable=False)
+    calculation: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    premise_columns: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_committed_snapshots_reo_id_distribution_config_id_active",
+            "reo_id",
+            "distribution_config_id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_committed_snapshots_reo_id_id", "reo_id", "id"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
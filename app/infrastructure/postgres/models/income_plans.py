@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from app.infrastructure.postgres.models.base import Base
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -23,4 +23,16 @@ class IncomePlan(Base):
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="income_plans")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_income_plans_reo_id_active", "reo_id", postgresql_where=text("is_active")),
+        Index("ix_income_plans_reo_id_id", "reo_id", "id"),
+        # Active plans are read in period order for the current price interpolation
+        Index(
+            "ix_income_plans_reo_id_period_begin_active",
+            "reo_id",
+            "period_begin",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from app.infrastructure.postgres.models.base import Base
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -37,12 +37,20 @@ class Premises(Base):
     sales_amount: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     customcontent: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # Set for rows loaded by a background upload; until the job swaps them in they stay inactive
+    upload_job_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("upload_jobs.id"), nullable=True)
 
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="premises")
     sales: Mapped[List["Sales"]] = relationship(back_populates="premises")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_premises_reo_id_active", "reo_id", postgresql_where=text("is_active")),
+        Index("ix_premises_reo_id_id", "reo_id", "id"),
+        Index("ix_premises_reo_id_status", "reo_id", "status"),
+        Index("ix_premises_upload_job_id", "upload_job_id"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
 
 
 class LayoutTypeAttachment(Base):
@@ -50,7 +58,7 @@ class LayoutTypeAttachment(Base):
 
     reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False)
     layout_type: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    base64_file: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     content_type: Mapped[str] = mapped_column(String, nullable=False)
     file_name: Mapped[str] = mapped_column(String, nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -58,7 +66,10 @@ class LayoutTypeAttachment(Base):
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="layout_type_attachments")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_layout_type_attachments_reo_id_layout_type", "reo_id", "layout_type"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
 
 
 class WindowViewAttachment(Base):
@@ -66,7 +77,7 @@ class WindowViewAttachment(Base):
 
     reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False)
     view_from_window: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    base64_file: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     content_type: Mapped[str] = mapped_column(String, nullable=False)
     file_name: Mapped[str] = mapped_column(String, nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -74,4 +85,7 @@ class WindowViewAttachment(Base):
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="window_view_attachments")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_window_view_attachments_reo_id_view_from_window", "reo_id", "view_from_window"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
@@ -1,7 +1,8 @@
 from typing import List
 
 from app.infrastructure.postgres.models.base import Base
-from sqlalchemy import JSON, Boolean, ForeignKey, Integer
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -10,10 +11,16 @@ class PricingConfig(Base):
 
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
     reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False)
-    content: Mapped[dict] = mapped_column(JSON, nullable=False)
+    content: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    # Increased on every content write; partial patches apply only to the version they were computed from
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
 
     # Relationships
     real_estate_object: Mapped["RealEstateObject"] = relationship(back_populates="pricing_configs")
     committed_prices: Mapped[List["CommittedPrices"]] = relationship(back_populates="pricing_config")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_pricing_configs_reo_id_active", "reo_id", postgresql_where=text("is_active")),
+        Index("ix_pricing_configs_reo_id_id", "reo_id", "id"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
@@ -2,7 +2,7 @@ from typing import List, Optional
 
 from app.core.utils.enums import CurrencyEnum, PropertyClassEnum
 from app.infrastructure.postgres.models.base import Base
-from sqlalchemy import JSON, Boolean, Enum, Float, ForeignKey, String
+from sqlalchemy import JSON, Boolean, Enum, Float, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -34,4 +34,7 @@ class RealEstateObject(Base):
     layout_type_attachments: Mapped[List["LayoutTypeAttachment"]] = relationship(back_populates="real_estate_object")
     window_view_attachments: Mapped[List["WindowViewAttachment"]] = relationship(back_populates="real_estate_object")
 
-    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
+    __table_args__ = (
+        Index("ix_real_estate_objects_user_id_is_deleted", "user_id", "is_deleted"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
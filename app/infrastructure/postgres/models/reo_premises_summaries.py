@@ -0,0 +1,32 @@
+from typing import Optional
+
+from app.infrastructure.postgres.models.base import Base
+from sqlalchemy import JSON, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class ReoPremisesSummary(Base):
+    """
+    Aggregates over the active premises of one REO.
+
+    The row is rebuilt in the same transaction as every premise or sale write of the REO,
+    so readers get the stats in a single lookup by ``reo_id`` instead of loading all premises.
+    Prices cover available premises with a positive price per meter.
+    """
+
+    __tablename__ = "reo_premises_summaries"
+
+    reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False, unique=True)
+    premises_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sold_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    available_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    min_price_per_meter: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_price_per_meter: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_price_per_meter: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    floors: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    total_areas: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    entrances: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    sales_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sales_amount: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+    __table_args__ = {"sqlite_autoincrement": True, "extend_existing": True}
@@ -11,8 +11,8 @@ class Sales(Base):
 
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     notified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    premises_id: Mapped[int] = mapped_column(Integer, ForeignKey("premises.id"), nullable=False)
-    saledate: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    premises_id: Mapped[int] = mapped_column(Integer, ForeignKey("premises.id"), nullable=False, index=True)
+    saledate: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
 
     # Relationships
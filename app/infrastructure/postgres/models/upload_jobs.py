@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional
+
+from app.core.utils.enums import UploadJobStatus
+from app.infrastructure.postgres.models.base import Base
+from sqlalchemy import JSON, BigInteger, DateTime, Enum, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class UploadJob(Base):
+    """
+    One specification upload processed in the background.
+
+    The file is received in chunks into the staging area (``received_size`` is the resume offset),
+    then a worker parses it batch by batch into inactive premises tagged with the job id and swaps
+    them into the active set in a single transaction.
+    """
+
+    __tablename__ = "upload_jobs"
+
+    reo_id: Mapped[int] = mapped_column(Integer, ForeignKey("real_estate_objects.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    content_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    status: Mapped[UploadJobStatus] = mapped_column(
+        Enum(UploadJobStatus, native_enum=False), default=UploadJobStatus.UPLOADING, nullable=False
+    )
+    total_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    received_size: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    premises_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    errors: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    message: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_upload_jobs_status_id", "status", "id"),
+        Index("ix_upload_jobs_reo_id", "reo_id"),
+        {"sqlite_autoincrement": True, "extend_existing": True},
+    )
@@ -0,0 +1,112 @@
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from loguru import logger
+from sqlalchemy import NullPool, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+# Seconds since the last replayed transaction; 0 on a server that is not in recovery
+POSTGRES_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_is_in_recovery() "
+    "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) ELSE 0 END"
+)
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+@dataclass
+class ReadReplica:
+    name: str
+    engine: AsyncEngine
+    sessionmaker: SessionFactory
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    checked_at: Optional[float] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ReplicaSessionRouter:
+    """
+    Chooses where read-only sessions go.
+
+    Replicas are used round-robin while they answer health checks and lag behind the primary by
+    no more than ``max_lag_seconds``; otherwise reads fall back to the primary. Health and lag are
+    re-checked lazily, at most once per ``health_check_interval_seconds`` per replica.
+    Any SQLAlchemy async URL works as a replica, so two SQLite files can stand in for a cluster.
+    """
+
+    def __init__(
+        self,
+        primary: SessionFactory,
+        replica_urls: list[str],
+        max_lag_seconds: float,
+        health_check_interval_seconds: float,
+    ) -> None:
+        self.primary = primary
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.replicas = [self._create_replica(url) for url in replica_urls]
+        self._order = itertools.cycle(self.replicas)
+
+    @staticmethod
+    def _create_replica(url: str) -> ReadReplica:
+        engine = create_async_engine(url, echo=False, poolclass=NullPool)
+        return ReadReplica(
+            name=make_url(url).render_as_string(hide_password=True),
+            engine=engine,
+            sessionmaker=async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession),
+        )
+
+    async def get_read_target(self) -> tuple[Optional[ReadReplica], SessionFactory]:
+        """Return the replica to read from (None for the primary) and its session factory."""
+        for _ in range(len(self.replicas)):
+            replica = next(self._order)
+            await self._refresh_if_stale(replica)
+            if replica.healthy and replica.lag_seconds <= self.max_lag_seconds:
+                return replica, replica.sessionmaker
+        return None, self.primary
+
+    def mark_unhealthy(self, replica: ReadReplica) -> None:
+        """Take a replica out of rotation until its next health check."""
+        replica.healthy = False
+        replica.checked_at = time.monotonic()
+        logger.warning(f"Read replica {replica.name} marked unhealthy, reads fall back")
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _refresh_if_stale(self, replica: ReadReplica) -> None:
+        if replica.checked_at is not None and (
+            time.monotonic() - replica.checked_at < self.health_check_interval_seconds
+        ):
+            return
+        async with replica.lock:
+            # Another request may have refreshed the replica while we waited for the lock
+            if replica.checked_at is not None and (
+                time.monotonic() - replica.checked_at < self.health_check_interval_seconds
+            ):
+                return
+            try:
+                async with replica.engine.connect() as connection:
+                    replica.lag_seconds = await self._measure_lag(connection)
+                replica.healthy = True
+            except Exception as exc:
+                replica.healthy = False
+                logger.warning(f"Read replica {replica.name} health check failed: {exc}")
+            replica.checked_at = time.monotonic()
+
+        if replica.healthy and replica.lag_seconds > self.max_lag_seconds:
+            logger.warning(f"Read replica {replica.name} lags {replica.lag_seconds:.1f}s, reads fall back")
+
+    @staticmethod
+    async def _measure_lag(connection: AsyncConnection) -> float:
+        if connection.dialect.name == "postgresql":
+            lag: Any = await connection.scalar(POSTGRES_LAG_QUERY)
+            return float(lag or 0.0)
+        await connection.execute(text("SELECT 1"))
+        return 0.0
@@ -2,16 +2,19 @@ import contextlib
 from functools import wraps
 from typing import Any, AsyncGenerator, Callable
 
-from app.infrastructure.postgres.connection import AsyncSessionLocal
+from app.infrastructure.postgres.connection import AsyncSessionLocal, read_session_router
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @contextlib.asynccontextmanager
-async def create_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def create_async_session(
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Async contextmanager that will create and teardown a session.
     """
-    async with AsyncSessionLocal() as session:
+    async with session_factory() as session:
         try:
             yield session
             await session.commit()
@@ -46,3 +49,38 @@ def provide_async_session(func: Callable[..., Any]) -> Callable[..., Any]:
                 return await func(*args, **kwargs)
 
     return wrapper
+
+
+def provide_read_only_session(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Same as provide_async_session, but a session it creates is bound to a read replica when one
+    is configured, healthy and not lagging too far behind. If the replica connection fails,
+    the replica is taken out of rotation and the call is repeated once on the primary.
+    Use only for methods that never write.
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        arg_session = "session"
+
+        func_params = func.__code__.co_varnames
+        session_in_args = arg_session in func_params and func_params.index(arg_session) < len(args)
+        session_in_kwargs = arg_session in kwargs
+
+        if session_in_kwargs or session_in_args:
+            return await func(*args, **kwargs)
+
+        replica, session_factory = await read_session_router.get_read_target()
+        try:
+            async with create_async_session(session_factory) as session:
+                return await func(*args, **{**kwargs, arg_session: session})
+        except (DBAPIError, OSError) as exc:
+            connection_lost = isinstance(exc, (OperationalError, OSError)) or bool(exc.connection_invalidated)
+            if replica is None or not connection_lost:
+                raise
+            read_session_router.mark_unhealthy(replica)
+
+        async with create_async_session() as session:
+            return await func(*args, **{**kwargs, arg_session: session})
+
+    return wrapper
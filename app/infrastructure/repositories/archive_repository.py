@@ -0,0 +1,200 @@
+import base64
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from app.core.interfaces.archive_repository import ArchiveRepositoryInterface
+from app.core.schemas.archive_schemas import ArchivedRecordFilter
+from app.core.utils.enums import ArchiveTable, UploadJobStatus
+from app.infrastructure.postgres.models import (
+    ArchivedRecord,
+    CommittedPrices,
+    CommittedSnapshot,
+    IncomePlan,
+    Premises,
+    PricingConfig,
+    RealEstateObject,
+    Sales,
+    UploadJob,
+)
+from app.infrastructure.postgres.models.base import Base
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from sqlalchemy import DateTime, Integer, LargeBinary, Select, cast, delete, exists, func
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select, true
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ARCHIVE_MODELS: dict[ArchiveTable, type[Base]] = {
+    ArchiveTable.PREMISES: Premises,
+    ArchiveTable.COMMITTED_PRICES: CommittedPrices,
+    ArchiveTable.COMMITTED_SNAPSHOTS: CommittedSnapshot,
+    ArchiveTable.PRICING_CONFIGS: PricingConfig,
+    ArchiveTable.INCOME_PLANS: IncomePlan,
+}
+
+# Rows still referenced by a foreign key from a hot table stay in place
+ARCHIVE_BLOCKERS: dict[ArchiveTable, list[Any]] = {
+    ArchiveTable.PREMISES: [
+        exists().where(Sales.premises_id == Premises.id),
+        # Premises staged by an upload that has not been swapped in yet
+        exists().where(
+            UploadJob.id == Premises.upload_job_id,
+            UploadJob.status.in_([UploadJobStatus.QUEUED, UploadJobStatus.PROCESSING]),
+        ),
+    ],
+    ArchiveTable.PRICING_CONFIGS: [
+        exists().where(CommittedPrices.pricing_config_id == PricingConfig.id),
+        exists().where(CommittedSnapshot.pricing_config_id == PricingConfig.id),
+    ],
+}
+
+
+def _snapshot_premise_ids(dialect_name: str, reo_id: int | None) -> Select:
+    # Snapshots reference premises by id inside a JSON array, there is no foreign key to check
+    premise_id: Any
+    if dialect_name == "postgresql":
+        elements = func.jsonb_array_elements_text(cast(CommittedSnapshot.premise_ids, JSONB)).table_valued("value")
+        premise_id = cast(elements.c.value, Integer)
+    else:
+        elements = func.json_each(CommittedSnapshot.premise_ids).table_valued("value")
+        premise_id = elements.c.value
+    query = select(premise_id).select_from(CommittedSnapshot).join(elements, true())
+    if reo_id is not None:
+        query = query.where(CommittedSnapshot.reo_id == reo_id)
+    return query
+
+
+def _premise_in_snapshot(dialect_name: str, reo_id: int | None) -> Any:
+    # Uncorrelated, so the referenced ids are unnested once per run instead of once per candidate premise
+    return Premises.id.in_(_snapshot_premise_ids(dialect_name, reo_id))
+
+
+# Blockers whose SQL depends on the dialect of the session or on the REO being archived
+DIALECT_ARCHIVE_BLOCKERS: dict[ArchiveTable, list[Callable[[str, int | None], Any]]] = {
+    ArchiveTable.PREMISES: [_premise_in_snapshot],
+}
+
+
+def _dump_row(model: type[Base], row: Base) -> dict:
+    payload = {}
+    for column in sa_inspect(model).columns:
+        value = getattr(row, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, bytes):
+            value = base64.b64encode(value).decode("ascii")
+        payload[column.key] = value
+    return payload
+
+
+def _load_row(model: type[Base], payload: dict) -> Base:
+    values = {}
+    for column in sa_inspect(model).columns:
+        if column.key not in payload:
+            continue
+        value = payload[column.key]
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif value is not None and isinstance(column.type, LargeBinary):
+            value = base64.b64decode(value)
+        values[column.key] = value
+    return model(**values)
+
+
+class ArchiveRepository(ArchiveRepositoryInterface):
+
+    @provide_async_session
+    async def archive_inactive(
+        self, table: ArchiveTable, older_than: datetime, limit: int, reo_id: int | None, session: AsyncSession
+    ) -> int:
+        model: Any = ARCHIVE_MODELS[table]
+        query = select(model).where(model.is_active == False, model.updated_at < older_than)
+        if reo_id is not None:
+            query = query.where(model.reo_id == reo_id)
+        for blocker in ARCHIVE_BLOCKERS.get(table, []):
+            query = query.where(~blocker)
+        dialect_name = session.get_bind().dialect.name
+        for build_blocker in DIALECT_ARCHIVE_BLOCKERS.get(table, []):
+            query = query.where(~build_blocker(dialect_name, reo_id))
+
+        result = await session.execute(query.order_by(model.id).limit(limit).with_for_update(skip_locked=True))
+        rows = result.scalars().all()
+        if not rows:
+            return 0
+
+        session.add_all(
+            ArchivedRecord(table_name=table, record_id=row.id, reo_id=row.reo_id, payload=_dump_row(model, row))
+            for row in rows
+        )
+        await session.execute(delete(model).where(model.id.in_([row.id for row in rows])))
+        await session.commit()
+        return len(rows)
+
+    @provide_async_session
+    async def restore(
+        self, table: ArchiveTable, record_ids: list[int], user_id: int, session: AsyncSession
+    ) -> list[int]:
+        records = await self._get_records(table, record_ids, user_id, session)
+        if not records:
+            return []
+
+        if table in (ArchiveTable.COMMITTED_PRICES, ArchiveTable.COMMITTED_SNAPSHOTS):
+            # Commits point to their pricing config, which may have been archived after them
+            config_ids = list({record.payload["pricing_config_id"] for record in records})
+            configs = await self._get_records(ArchiveTable.PRICING_CONFIGS, config_ids, user_id, session)
+            await self._move_back(ArchiveTable.PRICING_CONFIGS, configs, session)
+
+        await self._move_back(table, records, session)
+        await session.commit()
+        return [record.record_id for record in records]
+
+    @provide_async_session
+    async def purge(self, older_than: datetime, session: AsyncSession) -> int:
+        result: Any = await session.execute(delete(ArchivedRecord).where(ArchivedRecord.created_at < older_than))
+        await session.commit()
+        return result.rowcount
+
+    @provide_read_only_session
+    async def get_all(
+        self, user_id: int, filters: ArchivedRecordFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[ArchivedRecord]:
+        query = (
+            select(ArchivedRecord)
+            .join(RealEstateObject, RealEstateObject.id == ArchivedRecord.reo_id)
+            .where(RealEstateObject.user_id == user_id)
+        )
+        if filters.table_name is not None:
+            query = query.where(ArchivedRecord.table_name == filters.table_name)
+        if filters.reo_id is not None:
+            query = query.where(ArchivedRecord.reo_id == filters.reo_id)
+        if after_id is not None:
+            query = query.where(ArchivedRecord.id < after_id)
+
+        result = await session.execute(query.order_by(ArchivedRecord.id.desc()).limit(limit))
+        return result.scalars().all()
+
+    async def _get_records(
+        self, table: ArchiveTable, record_ids: list[int], user_id: int, session: AsyncSession
+    ) -> Sequence[ArchivedRecord]:
+        result = await session.execute(
+            select(ArchivedRecord)
+            .join(RealEstateObject, RealEstateObject.id == ArchivedRecord.reo_id)
+            .where(
+                RealEstateObject.user_id == user_id,
+                ArchivedRecord.table_name == table,
+                ArchivedRecord.record_id.in_(record_ids),
+            )
+            .order_by(ArchivedRecord.record_id)
+        )
+        return result.scalars().all()
+
+    async def _move_back(self, table: ArchiveTable, records: Sequence[ArchivedRecord], session: AsyncSession) -> None:
+        model = ARCHIVE_MODELS[table]
+        # updated_at falls back to now(), otherwise the next archive run would move the row out again
+        session.add_all(
+            _load_row(model, {key: value for key, value in record.payload.items() if key != "updated_at"})
+            for record in records
+        )
+        for record in records:
+            await session.delete(record)
+        await session.flush()
@@ -1,9 +1,10 @@
-from typing import Sequence
+from typing import Any, Sequence
 
 from app.core.interfaces.committed_prices_repository import CommittedPricesRepositoryInterface
+from app.core.schemas.committed_price_schemas import CommittedPricesFilter
 from app.infrastructure.postgres.models import CommittedPrices, DistributionConfig, PricingConfig, RealEstateObject
-from app.infrastructure.postgres.session_manager import provide_async_session
-from sqlalchemy import insert, select, update
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -46,9 +47,89 @@ class CommittedPricesRepository(CommittedPricesRepositoryInterface):
         )
         return result.scalars().all()
 
-    @provide_async_session
-    async def get_all_committed_prices(self, session: AsyncSession) -> Sequence[CommittedPrices]:
-        result = await session.execute(select(CommittedPrices))
+    @provide_read_only_session
+    async def get_actual_prices_per_sqm(
+        self, reo_id: int, distribution_config_id: int, premise_ids: list[int] | None, session: AsyncSession
+    ) -> Sequence[Any]:
+        premise_id = CommittedPrices.content["id"].as_integer()
+        query = select(
+            premise_id.label("premise_id"),
+            CommittedPrices.content[("calculation", "actual_price_per_sqm")].as_float().label("actual_price_per_sqm"),
+        ).where(
+            CommittedPrices.reo_id == reo_id,
+            CommittedPrices.distribution_config_id == distribution_config_id,
+            CommittedPrices.is_active == True,
+        )
+        if premise_ids is not None:
+            query = query.where(premise_id.in_(premise_ids))
+
+        result = await session.execute(query.order_by(CommittedPrices.id))
+        return result.all()
+
+    @provide_read_only_session
+    async def get_content_fields(
+        self,
+        reo_id: int,
+        distribution_config_id: int,
+        fields: Sequence[str],
+        after_id: int | None,
+        limit: int,
+        session: AsyncSession,
+    ) -> list[dict]:
+        query = select(
+            CommittedPrices.id.label("committed_price_id"),
+            *(CommittedPrices.content[field].label(field) for field in fields),
+            CommittedPrices.content[("calculation", "actual_price_per_sqm")].as_float().label("actual_price_per_sqm"),
+        ).where(
+            CommittedPrices.reo_id == reo_id,
+            CommittedPrices.distribution_config_id == distribution_config_id,
+            CommittedPrices.is_active == True,
+        )
+        if after_id is not None:
+            query = query.where(CommittedPrices.id > after_id)
+
+        result = await session.execute(query.order_by(CommittedPrices.id).limit(limit))
+        return [dict(row._mapping) for row in result]
+
+    @provide_read_only_session
+    async def get_active_revision(
+        self, reo_id: int, distribution_config_id: int, session: AsyncSession
+    ) -> tuple[int, int | None]:
+        result = await session.execute(
+            select(func.count(CommittedPrices.id), func.max(CommittedPrices.id)).where(
+                CommittedPrices.reo_id == reo_id,
+                CommittedPrices.distribution_config_id == distribution_config_id,
+                CommittedPrices.is_active == True,
+            )
+        )
+        count, last_id = result.one()
+        return count, last_id
+
+    @provide_read_only_session
+    async def get_all_committed_prices(
+        self, user_id: int, filters: CommittedPricesFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[CommittedPrices]:
+        query = (
+            select(CommittedPrices)
+            .join(RealEstateObject, RealEstateObject.id == CommittedPrices.reo_id)
+            .where(RealEstateObject.user_id == user_id)
+        )
+        if filters.reo_id is not None:
+            query = query.where(CommittedPrices.reo_id == filters.reo_id)
+        if filters.pricing_config_id is not None:
+            query = query.where(CommittedPrices.pricing_config_id == filters.pricing_config_id)
+        if filters.distribution_config_id is not None:
+            query = query.where(CommittedPrices.distribution_config_id == filters.distribution_config_id)
+        if filters.is_active is not None:
+            query = query.where(CommittedPrices.is_active == filters.is_active)
+        if filters.created_from is not None:
+            query = query.where(CommittedPrices.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(CommittedPrices.created_at <= filters.created_to)
+        if after_id is not None:
+            query = query.where(CommittedPrices.id < after_id)
+
+        result = await session.execute(query.order_by(CommittedPrices.id.desc()).limit(limit))
         return result.scalars().all()
 
     @provide_async_session
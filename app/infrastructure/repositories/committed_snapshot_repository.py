@@ -0,0 +1,52 @@
+from typing import Sequence
+
+from app.core.interfaces.committed_snapshot_repository import CommittedSnapshotRepositoryInterface
+from app.infrastructure.postgres.models import CommittedSnapshot, Premises
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CommittedSnapshotRepository(CommittedSnapshotRepositoryInterface):
+
+    @provide_async_session
+    async def create(self, data: dict, session: AsyncSession) -> CommittedSnapshot:
+        snapshot = CommittedSnapshot(**data)
+        session.add(snapshot)
+        await session.commit()
+        await session.refresh(snapshot)
+        return snapshot
+
+    @provide_async_session
+    async def get(self, id: int, session: AsyncSession) -> CommittedSnapshot | None:
+        result = await session.get(CommittedSnapshot, id)
+        return result
+
+    @provide_read_only_session
+    async def get_active(
+        self, reo_id: int, distribution_config_id: int, session: AsyncSession
+    ) -> CommittedSnapshot | None:
+        result = await session.execute(
+            select(CommittedSnapshot)
+            .where(
+                CommittedSnapshot.reo_id == reo_id,
+                CommittedSnapshot.distribution_config_id == distribution_config_id,
+                CommittedSnapshot.is_active == True,
+            )
+            .order_by(CommittedSnapshot.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    @provide_read_only_session
+    async def get_premises(self, premise_ids: list[int], session: AsyncSession) -> Sequence[Premises]:
+        result = await session.execute(select(Premises).where(Premises.id.in_(premise_ids)))
+        return result.scalars().all()
+
+    @provide_async_session
+    async def deactivate_active_snapshots(self, reo_id: int, session: AsyncSession) -> None:
+        await session.execute(
+            update(CommittedSnapshot)
+            .where(CommittedSnapshot.reo_id == reo_id, CommittedSnapshot.is_active == True)
+            .values(is_active=False)
+        )
@@ -1,8 +1,9 @@
 from typing import Sequence
 
 from app.core.interfaces.income_plans_repository import IncomePlanRepositoryInterface
-from app.infrastructure.postgres.models import IncomePlan
-from app.infrastructure.postgres.session_manager import provide_async_session
+from app.core.schemas.income_plan_schemas import IncomePlanFilter
+from app.infrastructure.postgres.models import IncomePlan, RealEstateObject
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
 from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +13,9 @@ class IncomePlanRepository(IncomePlanRepositoryInterface):
     @provide_async_session
     async def get_active_plan_by_reo_id(self, reo_id: int, session: AsyncSession) -> Sequence[IncomePlan] | None:
         result = await session.execute(
-            select(IncomePlan).where(IncomePlan.reo_id == reo_id, IncomePlan.is_active == True)
+            select(IncomePlan)
+            .where(IncomePlan.reo_id == reo_id, IncomePlan.is_active == True)
+            .order_by(IncomePlan.period_begin, IncomePlan.id)
         )
         plans = result.scalars().all()
         return plans
@@ -30,11 +33,30 @@ class IncomePlanRepository(IncomePlanRepositoryInterface):
         result = await session.get(IncomePlan, plan_id)
         return result
 
-    @provide_async_session
-    async def get_all(self, session: AsyncSession) -> Sequence[IncomePlan]:
-        result = await session.execute(
-            select(IncomePlan).order_by(IncomePlan.uploaded_at.desc()).filter_by(is_deleted=False)
+    @provide_read_only_session
+    async def get_all(
+        self, user_id: int, filters: IncomePlanFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[IncomePlan]:
+        query = (
+            select(IncomePlan)
+            .join(RealEstateObject, RealEstateObject.id == IncomePlan.reo_id)
+            .where(RealEstateObject.user_id == user_id, IncomePlan.is_deleted == False)
         )
+        if filters.reo_id is not None:
+            query = query.where(IncomePlan.reo_id == filters.reo_id)
+        if filters.is_active is not None:
+            query = query.where(IncomePlan.is_active == filters.is_active)
+        if filters.property_type is not None:
+            query = query.where(IncomePlan.property_type == filters.property_type)
+        # Периоды плана, пересекающиеся с запрошенным интервалом
+        if filters.period_from is not None:
+            query = query.where(IncomePlan.period_end >= filters.period_from)
+        if filters.period_to is not None:
+            query = query.where(IncomePlan.period_begin <= filters.period_to)
+        if after_id is not None:
+            query = query.where(IncomePlan.id < after_id)
+
+        result = await session.execute(query.order_by(IncomePlan.id.desc()).limit(limit))
         plans = result.scalars().all()
         return plans
 
@@ -53,16 +75,17 @@ class IncomePlanRepository(IncomePlanRepositoryInterface):
         await session.commit()
 
     @provide_async_session
-    async def create_bulk_income_plans(
-        self, reo_id: int, data: list[dict], session: AsyncSession
-    ) -> Sequence[IncomePlan]:
-        stmt = insert(IncomePlan)
-        await session.execute(stmt, data)
-        await session.commit()
-        result = await session.execute(
-            select(IncomePlan).where(IncomePlan.reo_id == reo_id).order_by(IncomePlan.uploaded_at.desc())
+    async def replace_active_plans(self, reo_id: int, data: list[dict], session: AsyncSession) -> Sequence[IncomePlan]:
+        await session.execute(
+            update(IncomePlan).where(IncomePlan.reo_id == reo_id, IncomePlan.is_active == True).values(is_active=False)
         )
-        created_plans = result.scalars().all()
+        created_plans: Sequence[IncomePlan] = []
+        if data:
+            result = await session.scalars(
+                insert(IncomePlan).returning(IncomePlan, sort_by_parameter_order=True), data
+            )
+            created_plans = result.all()
+        await session.commit()
         return created_plans
 
     @provide_async_session
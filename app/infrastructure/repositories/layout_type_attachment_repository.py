@@ -1,11 +1,17 @@
-from typing import Sequence
+import asyncio
+import contextlib
+from typing import AsyncIterator, Sequence
+from weakref import WeakValueDictionary
 
 from app.core.interfaces.layout_type_attachment_repository import PremisesAttachmentRepositoryInterface
 from app.infrastructure.postgres.models.premises import LayoutTypeAttachment, WindowViewAttachment
-from app.infrastructure.postgres.session_manager import provide_async_session
-from sqlalchemy import select
+from app.infrastructure.postgres.session_manager import create_async_session, provide_async_session
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# SQLite has no advisory locks; it is served by a single process, so in-process locks are enough
+_local_hash_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
 
 class PremisesAttachmentRepository(PremisesAttachmentRepositoryInterface):
 
@@ -79,3 +85,28 @@ class PremisesAttachmentRepository(PremisesAttachmentRepositoryInterface):
     async def delete(self, attachment: LayoutTypeAttachment, session: AsyncSession) -> None:
         await session.delete(attachment)
         await session.commit()
+
+    @provide_async_session
+    async def is_content_hash_referenced(self, content_hash: str, session: AsyncSession) -> bool:
+        result = await session.execute(
+            select(
+                or_(
+                    exists().where(LayoutTypeAttachment.content_hash == content_hash),
+                    exists().where(WindowViewAttachment.content_hash == content_hash),
+                )
+            )
+        )
+        return bool(result.scalar())
+
+    @contextlib.asynccontextmanager
+    async def content_hash_lock(self, content_hash: str) -> AsyncIterator[None]:
+        async with create_async_session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                # Transaction-level lock, released when the session commits or rolls back on exit
+                await session.execute(select(func.pg_advisory_xact_lock(func.hashtext(content_hash))))
+                yield
+                return
+
+        lock = _local_hash_locks.setdefault(content_hash, asyncio.Lock())
+        async with lock:
+            yield
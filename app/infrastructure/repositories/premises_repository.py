@@ -1,9 +1,11 @@
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from app.core.interfaces.premises_repository import PremisesRepositoryInterface
-from app.infrastructure.postgres.models import Premises
-from app.infrastructure.postgres.session_manager import provide_async_session
-from sqlalchemy import insert, select
+from app.core.schemas.premise_schemas import PremisesFilter
+from app.infrastructure.postgres.models import Premises, RealEstateObject
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from app.infrastructure.repositories.reo_summary_repository import refresh_reo_summaries, refresh_reo_summary
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -13,6 +15,8 @@ class PremisesRepository(PremisesRepositoryInterface):
     async def create(self, data: dict, session: AsyncSession) -> Premises:
         premises = Premises(**data)
         session.add(premises)
+        await session.flush()
+        await refresh_reo_summary(session, premises.reo_id)
         await session.commit()
         await session.refresh(premises)
         return premises
@@ -30,24 +34,50 @@ class PremisesRepository(PremisesRepositoryInterface):
         premises = result.scalars().all()
         return premises
 
-    @provide_async_session
-    async def get_all(self, session: AsyncSession) -> Sequence[Premises]:
-        result = await session.execute(select(Premises))
+    @provide_read_only_session
+    async def get_all(
+        self, user_id: int, filters: PremisesFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[Premises]:
+        query = (
+            select(Premises)
+            .join(RealEstateObject, RealEstateObject.id == Premises.reo_id)
+            .where(RealEstateObject.user_id == user_id)
+        )
+        if filters.reo_id is not None:
+            query = query.where(Premises.reo_id == filters.reo_id)
+        if filters.is_active is not None:
+            query = query.where(Premises.is_active == filters.is_active)
+        if filters.status is not None:
+            query = query.where(Premises.status == filters.status)
+        if filters.uploaded_from is not None:
+            query = query.where(Premises.uploaded >= filters.uploaded_from)
+        if filters.uploaded_to is not None:
+            query = query.where(Premises.uploaded <= filters.uploaded_to)
+        if after_id is not None:
+            query = query.where(Premises.id < after_id)
+
+        result = await session.execute(query.order_by(Premises.id.desc()).limit(limit))
         premises = result.scalars().all()
         return premises
 
     @provide_async_session
     async def update(self, premises: Premises, data: dict, session: AsyncSession) -> Premises:
+        previous_reo_id = premises.reo_id
         for key, value in data.items():
             setattr(premises, key, value)
         session.add(premises)
+        await session.flush()
+        await refresh_reo_summaries(session, [previous_reo_id, premises.reo_id])
         await session.commit()
         await session.refresh(premises)
         return premises
 
     @provide_async_session
     async def delete(self, premises: Premises, session: AsyncSession) -> None:
+        reo_id = premises.reo_id
         await session.delete(premises)
+        await session.flush()
+        await refresh_reo_summary(session, reo_id)
         await session.commit()
 
     @provide_async_session
@@ -57,6 +87,8 @@ class PremisesRepository(PremisesRepositoryInterface):
         for premises in active_premises:
             premises.is_active = False
             session.add(premises)
+        await session.flush()
+        await refresh_reo_summary(session, reo_id)
         await session.commit()
 
     @provide_async_session
@@ -71,6 +103,35 @@ class PremisesRepository(PremisesRepositoryInterface):
     async def create_bulk_premises(self, data: list[dict], reo_id: int, session: AsyncSession) -> Sequence[Premises]:
         stmt = insert(Premises)
         await session.execute(stmt, data)
+        await refresh_reo_summary(session, reo_id)
         await session.commit()
         result = await self.fetch_recent_premises(reo_id=reo_id, limit=len(data), session=session)
         return result
+
+    @provide_async_session
+    async def replace_active_premises(self, reo_id: int, data: list[dict], session: AsyncSession) -> int:
+        await session.execute(
+            update(Premises).where(Premises.reo_id == reo_id, Premises.is_active == True).values(is_active=False)
+        )
+        if data:
+            await session.execute(insert(Premises), data)
+        await refresh_reo_summary(session, reo_id)
+        await session.commit()
+        return len(data)
+
+    @provide_async_session
+    async def replace_active_premises_in_batches(
+        self, reo_id: int, batches: AsyncIterator[list[dict]], session: AsyncSession
+    ) -> int:
+        # The transaction stays open while the batches are produced: an error in any batch rolls back the upload
+        await session.execute(
+            update(Premises).where(Premises.reo_id == reo_id, Premises.is_active == True).values(is_active=False)
+        )
+        inserted = 0
+        async for data in batches:
+            if data:
+                await session.execute(insert(Premises), data)
+                inserted += len(data)
+        await refresh_reo_summary(session, reo_id)
+        await session.commit()
+        return inserted
@@ -1,9 +1,12 @@
-from typing import Sequence
+import json
+from typing import Any, Optional, Sequence
 
 from app.core.interfaces.pricing_config_repository import PricingConfigRepositoryInterface
-from app.infrastructure.postgres.models import PricingConfig
-from app.infrastructure.postgres.session_manager import provide_async_session
-from sqlalchemy import select, update
+from app.core.schemas.pricing_config_schemas import PricingConfigFilter
+from app.infrastructure.postgres.models import PricingConfig, RealEstateObject
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from sqlalchemy import ColumnElement, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -31,8 +34,35 @@ class PricingConfigRepository(PricingConfigRepositoryInterface):
         return config
 
     @provide_async_session
-    async def get_all(self, session: AsyncSession) -> Sequence[PricingConfig]:
-        result = await session.execute(select(PricingConfig))
+    async def get_ranging_for_factor(self, reo_id: int, factor: str, session: AsyncSession) -> Any:
+        result = await session.execute(
+            select(PricingConfig.id, PricingConfig.content[("ranging", factor)].label("ranging")).where(
+                PricingConfig.reo_id == reo_id, PricingConfig.is_active == True
+            )
+        )
+        return result.one_or_none()
+
+    @provide_read_only_session
+    async def get_all(
+        self, user_id: int, filters: PricingConfigFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[PricingConfig]:
+        query = (
+            select(PricingConfig)
+            .join(RealEstateObject, RealEstateObject.id == PricingConfig.reo_id)
+            .where(RealEstateObject.user_id == user_id)
+        )
+        if filters.reo_id is not None:
+            query = query.where(PricingConfig.reo_id == filters.reo_id)
+        if filters.is_active is not None:
+            query = query.where(PricingConfig.is_active == filters.is_active)
+        if filters.created_from is not None:
+            query = query.where(PricingConfig.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(PricingConfig.created_at <= filters.created_to)
+        if after_id is not None:
+            query = query.where(PricingConfig.id < after_id)
+
+        result = await session.execute(query.order_by(PricingConfig.id.desc()).limit(limit))
         plans = result.scalars().all()
         return plans
 
@@ -41,11 +71,43 @@ class PricingConfigRepository(PricingConfigRepositoryInterface):
         for key, value in data.items():
             if key and value:
                 setattr(pricing_config, key, value)
+        pricing_config.version = PricingConfig.version + 1
         session.add(pricing_config)
         await session.commit()
         await session.refresh(pricing_config)
         return pricing_config
 
+    @provide_async_session
+    async def get_active_dynamic_config(self, reo_id: int, session: AsyncSession) -> Any:
+        result = await session.execute(
+            select(
+                PricingConfig.id, PricingConfig.version, PricingConfig.content["dynamicConfig"].label("dynamic_config")
+            ).where(PricingConfig.reo_id == reo_id, PricingConfig.is_active == True)
+        )
+        return result.one_or_none()
+
+    @provide_async_session
+    async def patch_active_content(
+        self, reo_id: int, sections: dict[str, dict], expected_version: Optional[int], session: AsyncSession
+    ) -> PricingConfig | None:
+        # Keys are merged into the sections inside the UPDATE; the rest of the document is not sent or rewritten
+        if session.get_bind().dialect.name == "postgresql":
+            content = _merge_sections_jsonb(sections)
+        else:
+            content = _merge_sections_json(sections)
+
+        query = update(PricingConfig).where(PricingConfig.reo_id == reo_id, PricingConfig.is_active == True)
+        if expected_version is not None:
+            query = query.where(PricingConfig.version == expected_version)
+        result = await session.execute(
+            query.values(content=content, version=PricingConfig.version + 1)
+            .returning(PricingConfig)
+            .execution_options(synchronize_session=False)
+        )
+        pricing_config = result.scalar_one_or_none()
+        await session.commit()
+        return pricing_config
+
     @provide_async_session
     async def delete(self, pricing_config: PricingConfig, session: AsyncSession) -> None:
         await session.delete(pricing_config)
@@ -58,3 +120,29 @@ class PricingConfigRepository(PricingConfigRepositoryInterface):
             .where(PricingConfig.reo_id == reo_id, PricingConfig.is_active == True)
             .values(is_active=False)
         )
+
+
+def _merge_sections_jsonb(sections: dict[str, dict]) -> ColumnElement:
+    # content || {section: coalesce(content -> section, {}) || keys, ...}: one shallow merge per section
+    merged: list[Any] = []
+    for section, values in sections.items():
+        current = func.coalesce(PricingConfig.content[section], literal({}, JSONB))
+        merged += [section, current.op("||", return_type=JSONB)(literal(values, JSONB))]
+    return PricingConfig.content.op("||", return_type=JSONB)(func.jsonb_build_object(*merged, type_=JSONB))
+
+
+def _merge_sections_json(sections: dict[str, dict]) -> ColumnElement:
+    # SQLite: create missing sections, then set every key path with json_set
+    created: list[Any] = []
+    assigned: list[Any] = []
+    for section, values in sections.items():
+        path = _json_path(section)
+        created += [path, func.json(func.coalesce(func.json_extract(PricingConfig.content, path), "{}"))]
+        for key, value in values.items():
+            assigned += [_json_path(section, key), func.json(json.dumps(value, ensure_ascii=False))]
+    content = func.json_set(PricingConfig.content, *created)
+    return func.json_set(content, *assigned) if assigned else content
+
+
+def _json_path(*keys: str) -> str:
+    return "$" + "".join("." + json.dumps(key) for key in keys)
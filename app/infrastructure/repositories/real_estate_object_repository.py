@@ -1,11 +1,19 @@
-from typing import Sequence
+from typing import Any, Sequence
 
 from app.core.interfaces.real_estate_object_repository import RealEstateObjectRepositoryInterface
+from app.core.utils.enums import PROFILE_RELATIONSHIPS, REO_RELATIONSHIPS, ReoLoadProfile
 from app.infrastructure.postgres.models import Premises, PricingConfig, RealEstateObject
-from app.infrastructure.postgres.session_manager import provide_async_session
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, with_loader_criteria
+from sqlalchemy.orm import noload, selectinload, with_loader_criteria
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Тяжёлые JSON-колонки помещений, которые профилю не нужны
+PROFILE_DEFERRED_PREMISES_COLUMNS: dict[ReoLoadProfile, tuple[str, ...]] = {
+    ReoLoadProfile.AGENTS_TEXT: ("customcontent",),
+    ReoLoadProfile.AGENTS: ("customcontent",),
+}
 
 
 class RealEstateObjectRepository(RealEstateObjectRepositoryInterface):
@@ -34,25 +42,38 @@ class RealEstateObjectRepository(RealEstateObjectRepositoryInterface):
         reo = result.scalar_one_or_none()
         return reo
 
-    @provide_async_session
-    async def get_full(self, id: int, user_id: int, session: AsyncSession) -> RealEstateObject | None:
-        stmt = (
-            select(RealEstateObject)
-            .where(RealEstateObject.id == id, RealEstateObject.user_id == user_id)
-            .options(
-                selectinload(RealEstateObject.premises),
-                with_loader_criteria(Premises, Premises.is_active == True),
-                selectinload(RealEstateObject.pricing_configs),
-                with_loader_criteria(PricingConfig, PricingConfig.is_active == True),
-                selectinload(RealEstateObject.committed_prices),
-                selectinload(RealEstateObject.income_plans),
-                selectinload(RealEstateObject.status_mappings),
-                selectinload(RealEstateObject.layout_type_attachments),
-                selectinload(RealEstateObject.window_view_attachments),
-            )
-        )
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+    @provide_read_only_session
+    async def get_full(
+        self, id: int, user_id: int, session: AsyncSession, profile: ReoLoadProfile = ReoLoadProfile.FULL
+    ) -> RealEstateObject | None:
+        relationships = PROFILE_RELATIONSHIPS[profile]
+        deferred_columns = PROFILE_DEFERRED_PREMISES_COLUMNS.get(profile, ())
+
+        options: list[Any] = [
+            with_loader_criteria(Premises, Premises.is_active == True),
+            with_loader_criteria(PricingConfig, PricingConfig.is_active == True),
+        ]
+        for name in REO_RELATIONSHIPS:
+            attribute = getattr(RealEstateObject, name)
+            if name not in relationships:
+                options.append(noload(attribute))
+            elif name == "premises" and deferred_columns:
+                options.append(
+                    selectinload(attribute).defer(*(getattr(Premises, column) for column in deferred_columns))
+                )
+            else:
+                options.append(selectinload(attribute))
+
+        stmt = select(RealEstateObject).where(RealEstateObject.id == id, RealEstateObject.user_id == user_id)
+        result = await session.execute(stmt.options(*options))
+        reo = result.scalar_one_or_none()
+
+        if reo and deferred_columns:
+            # Отложенные колонки не должны догружаться при сериализации отсоединённых объектов
+            for premise in reo.premises:
+                for column in deferred_columns:
+                    set_committed_value(premise, column, None)
+        return reo
 
     @provide_async_session
     async def get_all(self, user_id: int, session: AsyncSession) -> Sequence[RealEstateObject]:
@@ -0,0 +1,101 @@
+from typing import Any, Iterable
+
+from app.core.interfaces.reo_summary_repository import ReoSummaryRepositoryInterface
+from app.infrastructure.postgres.models import Premises, ReoPremisesSummary, Sales
+from app.infrastructure.postgres.session_manager import provide_async_session
+from sqlalchemy import and_, distinct, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def refresh_reo_summaries(session: AsyncSession, reo_ids: Iterable[int]) -> None:
+    """Rebuild the summaries of the given REOs inside the caller's transaction."""
+    for reo_id in sorted(set(reo_ids)):
+        await refresh_reo_summary(session, reo_id)
+
+
+async def refresh_reo_summary(session: AsyncSession, reo_id: int) -> ReoPremisesSummary:
+    """
+    Rebuild the summary of one REO inside the caller's transaction.
+
+    The summary row is locked before the aggregates are read, so concurrent writers of the same
+    REO queue up and each of them recomputes from data committed by the previous one.
+
+    This is a full rebuild over the active premises of the REO, not an old/new value delta:
+    min/max prices, the distinct floor and area lists and the floors per entrance cannot be
+    updated from the changed row alone. A write therefore costs in proportion to the size of
+    the REO, see benchmarks/reo_summary_write_path.py.
+    """
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    await session.execute(dialect.insert(ReoPremisesSummary).values(reo_id=reo_id).on_conflict_do_nothing())
+    result = await session.execute(
+        select(ReoPremisesSummary).where(ReoPremisesSummary.reo_id == reo_id).with_for_update()
+    )
+    summary = result.scalar_one()
+
+    active = (Premises.reo_id == reo_id, Premises.is_active == True)
+    priced = and_(Premises.status == "available", Premises.price_per_meter > 0)
+    counts = (
+        await session.execute(
+            select(
+                func.count(),
+                func.count().filter(Premises.status == "sold"),
+                func.count().filter(Premises.status == "available"),
+                func.min(Premises.price_per_meter).filter(priced),
+                func.max(Premises.price_per_meter).filter(priced),
+                func.avg(Premises.price_per_meter).filter(priced),
+            ).where(*active)
+        )
+    ).one()
+    floors = await session.scalars(select(distinct(Premises.floor)).where(*active).order_by(Premises.floor))
+    total_areas = await session.scalars(
+        select(distinct(Premises.total_area_m2)).where(*active).order_by(Premises.total_area_m2)
+    )
+    entrances = await session.execute(
+        select(Premises.entrance, func.count(), func.count(distinct(Premises.floor)))
+        .where(*active)
+        .group_by(Premises.entrance)
+        .order_by(Premises.entrance)
+    )
+    sales = (
+        await session.execute(
+            select(func.count(Sales.id), func.coalesce(func.sum(Sales.amount), 0))
+            .join(Premises, Premises.id == Sales.premises_id)
+            .where(*active, Sales.is_deleted == False)
+        )
+    ).one()
+
+    summary.premises_count, summary.sold_count, summary.available_count = counts[0], counts[1], counts[2]
+    summary.min_price_per_meter, summary.max_price_per_meter = counts[3], counts[4]
+    summary.avg_price_per_meter = float(counts[5]) if counts[5] is not None else None
+    summary.floors = list(floors)
+    summary.total_areas = list(total_areas)
+    summary.entrances = [
+        {"entrance_number": entrance, "apartments_in_entrance": apartments, "floors_in_entrance": floors_count}
+        for entrance, apartments, floors_count in entrances
+    ]
+    summary.sales_count, summary.sales_amount = sales[0], float(sales[1])
+    session.add(summary)
+    await session.flush()
+    return summary
+
+
+async def get_premises_reo_ids(session: AsyncSession, premises_ids: Iterable[Any]) -> list[int]:
+    """Return the REOs owning the given premises."""
+    result = await session.scalars(select(distinct(Premises.reo_id)).where(Premises.id.in_(list(premises_ids))))
+    return list(result)
+
+
+class ReoSummaryRepository(ReoSummaryRepositoryInterface):
+
+    @provide_async_session
+    async def get(self, reo_id: int, session: AsyncSession) -> ReoPremisesSummary | None:
+        result = await session.execute(select(ReoPremisesSummary).where(ReoPremisesSummary.reo_id == reo_id))
+        return result.scalar_one_or_none()
+
+    @provide_async_session
+    async def refresh(self, reo_id: int, session: AsyncSession) -> ReoPremisesSummary:
+        summary = await refresh_reo_summary(session, reo_id)
+        await session.commit()
+        await session.refresh(summary)
+        return summary
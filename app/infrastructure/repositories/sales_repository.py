@@ -1,8 +1,10 @@
 from typing import Sequence
 
 from app.core.interfaces.sales_repository import SalesRepositoryInterface
-from app.infrastructure.postgres.models import Sales
-from app.infrastructure.postgres.session_manager import provide_async_session
+from app.core.schemas.sale_schemas import SalesFilter
+from app.infrastructure.postgres.models import Premises, RealEstateObject, Sales
+from app.infrastructure.postgres.session_manager import provide_async_session, provide_read_only_session
+from app.infrastructure.repositories.reo_summary_repository import get_premises_reo_ids, refresh_reo_summaries
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +15,8 @@ class SalesRepository(SalesRepositoryInterface):
     async def create(self, data: dict, session: AsyncSession) -> Sales:
         sales = Sales(**data)
         session.add(sales)
+        await session.flush()
+        await refresh_reo_summaries(session, await get_premises_reo_ids(session, [sales.premises_id]))
         await session.commit()
         await session.refresh(sales)
         return sales
@@ -22,22 +26,50 @@ class SalesRepository(SalesRepositoryInterface):
         result = await session.get(Sales, id)
         return result
 
-    @provide_async_session
-    async def get_all(self, session: AsyncSession) -> Sequence[Sales]:
-        result = await session.execute(select(Sales))
+    @provide_read_only_session
+    async def get_all(
+        self, user_id: int, filters: SalesFilter, after_id: int | None, limit: int, session: AsyncSession
+    ) -> Sequence[Sales]:
+        query = (
+            select(Sales)
+            .join(Premises, Premises.id == Sales.premises_id)
+            .join(RealEstateObject, RealEstateObject.id == Premises.reo_id)
+            .where(RealEstateObject.user_id == user_id)
+        )
+        if filters.reo_id is not None:
+            query = query.where(Premises.reo_id == filters.reo_id)
+        if filters.premises_id is not None:
+            query = query.where(Sales.premises_id == filters.premises_id)
+        if filters.is_deleted is not None:
+            query = query.where(Sales.is_deleted == filters.is_deleted)
+        if filters.saledate_from is not None:
+            query = query.where(Sales.saledate >= filters.saledate_from)
+        if filters.saledate_to is not None:
+            query = query.where(Sales.saledate <= filters.saledate_to)
+        if after_id is not None:
+            query = query.where(Sales.id < after_id)
+
+        result = await session.execute(query.order_by(Sales.id.desc()).limit(limit))
         sales = result.scalars().all()
         return sales
 
     @provide_async_session
     async def update(self, sales: Sales, data: dict, session: AsyncSession) -> Sales:
+        previous_premises_id = sales.premises_id
         for key, value in data.items():
             setattr(sales, key, value)
         session.add(sales)
+        await session.flush()
+        reo_ids = await get_premises_reo_ids(session, [previous_premises_id, sales.premises_id])
+        await refresh_reo_summaries(session, reo_ids)
         await session.commit()
         await session.refresh(sales)
         return sales
 
     @provide_async_session
     async def delete(self, sales: Sales, session: AsyncSession) -> None:
+        premises_id = sales.premises_id
         await session.delete(sales)
+        await session.flush()
+        await refresh_reo_summaries(session, await get_premises_reo_ids(session, [premises_id]))
         await session.commit()
@@ -0,0 +1,191 @@
+from datetime import datetime
+
+from app.core.interfaces.upload_job_repository import UploadJobRepositoryInterface
+from app.core.utils.enums import UploadJobStatus
+from app.infrastructure.postgres.models import Premises, UploadJob
+from app.infrastructure.postgres.session_manager import provide_async_session
+from app.infrastructure.repositories.reo_summary_repository import refresh_reo_summary
+from sqlalchemy import Delete, and_, delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _claimed(job: UploadJob) -> tuple:
+    # started_at is reset on every claim, so it fences off a worker whose claim was taken over
+    return (
+        UploadJob.id == job.id,
+        UploadJob.status == UploadJobStatus.PROCESSING,
+        UploadJob.started_at == job.started_at,
+    )
+
+
+def _drop_staged_premises(job_id: int) -> Delete:
+    return delete(Premises).where(Premises.upload_job_id == job_id, Premises.is_active == False)
+
+
+class UploadJobRepository(UploadJobRepositoryInterface):
+
+    @provide_async_session
+    async def create(self, data: dict, session: AsyncSession) -> UploadJob:
+        job = UploadJob(**data)
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+    @provide_async_session
+    async def get(self, id: int, session: AsyncSession) -> UploadJob | None:
+        result = await session.get(UploadJob, id)
+        return result
+
+    @provide_async_session
+    async def advance_received_size(self, id: int, offset: int, received_size: int, session: AsyncSession) -> bool:
+        result = await session.execute(
+            update(UploadJob)
+            .where(
+                UploadJob.id == id,
+                UploadJob.status == UploadJobStatus.UPLOADING,
+                UploadJob.received_size == offset,
+            )
+            .values(received_size=received_size)
+        )
+        await session.commit()
+        return result.rowcount == 1
+
+    @provide_async_session
+    async def enqueue(self, id: int, received_size: int, session: AsyncSession) -> bool:
+        result = await session.execute(
+            update(UploadJob)
+            .where(
+                UploadJob.id == id,
+                UploadJob.status == UploadJobStatus.UPLOADING,
+                UploadJob.received_size == received_size,
+            )
+            .values(status=UploadJobStatus.QUEUED)
+        )
+        await session.commit()
+        return result.rowcount == 1
+
+    @provide_async_session
+    async def claim_next(self, stale_before: datetime, session: AsyncSession) -> UploadJob | None:
+        result = await session.execute(
+            select(UploadJob)
+            .where(
+                or_(
+                    UploadJob.status == UploadJobStatus.QUEUED,
+                    and_(UploadJob.status == UploadJobStatus.PROCESSING, UploadJob.updated_at < stale_before),
+                )
+            )
+            .order_by(UploadJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+
+        # Without row locks (SQLite) two workers may pick the same job; only the first update matches
+        previous_claim = _claimed(job) if job.status == UploadJobStatus.PROCESSING else (UploadJob.id == job.id,)
+        claimed = await session.execute(
+            update(UploadJob)
+            .where(*previous_claim, UploadJob.status == job.status)
+            .values(
+                status=UploadJobStatus.PROCESSING,
+                started_at=datetime.now(),
+                rows_processed=0,
+                error_count=0,
+                errors=[],
+                message=None,
+            )
+        )
+        if claimed.rowcount != 1:
+            await session.rollback()
+            return None
+        await session.execute(_drop_staged_premises(job.id))
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+    @provide_async_session
+    async def stage_premises(
+        self,
+        job: UploadJob,
+        rows: list[dict],
+        rows_processed: int,
+        errors: list[dict],
+        error_count: int,
+        session: AsyncSession,
+    ) -> bool:
+        result = await session.execute(
+            update(UploadJob)
+            .where(*_claimed(job))
+            .values(rows_processed=rows_processed, errors=errors, error_count=error_count)
+        )
+        if result.rowcount != 1:
+            await session.rollback()
+            return False
+        if rows:
+            await session.execute(
+                insert(Premises), [{**row, "is_active": False, "upload_job_id": job.id} for row in rows]
+            )
+        await session.commit()
+        return True
+
+    @provide_async_session
+    async def activate_staged_premises(
+        self, job: UploadJob, rows_processed: int, message: str | None, session: AsyncSession
+    ) -> int | None:
+        # The job row is updated first: on Postgres it stays locked until the swap commits
+        result = await session.execute(
+            update(UploadJob)
+            .where(*_claimed(job))
+            .values(
+                status=UploadJobStatus.COMPLETED,
+                rows_processed=rows_processed,
+                message=message,
+                finished_at=datetime.now(),
+            )
+        )
+        if result.rowcount != 1:
+            await session.rollback()
+            return None
+
+        await session.execute(
+            update(Premises).where(Premises.reo_id == job.reo_id, Premises.is_active == True).values(is_active=False)
+        )
+        activated = await session.execute(
+            update(Premises).where(Premises.upload_job_id == job.id).values(is_active=True)
+        )
+        premises_count = activated.rowcount
+        await session.execute(update(UploadJob).where(UploadJob.id == job.id).values(premises_count=premises_count))
+        await refresh_reo_summary(session, job.reo_id)
+        await session.commit()
+        return premises_count
+
+    @provide_async_session
+    async def fail(
+        self,
+        job: UploadJob,
+        rows_processed: int,
+        errors: list[dict],
+        error_count: int,
+        message: str | None,
+        session: AsyncSession,
+    ) -> bool:
+        result = await session.execute(
+            update(UploadJob)
+            .where(*_claimed(job))
+            .values(
+                status=UploadJobStatus.FAILED,
+                rows_processed=rows_processed,
+                errors=errors,
+                error_count=error_count,
+                message=message,
+                finished_at=datetime.now(),
+            )
+        )
+        if result.rowcount != 1:
+            await session.rollback()
+            return False
+        await session.execute(_drop_staged_premises(job.id))
+        await session.commit()
+        return True
@@ -0,0 +1,32 @@
+import asyncio
+import json
+import os
+from typing import Optional
+
+from app.core.interfaces.agent_response_cache import AgentResponseCacheInterface
+from diskcache import Cache
+
+
+class DiskAgentResponseCache(AgentResponseCacheInterface):
+    """
+    Agent response cache on the local disk, backed by diskcache (SQLite index plus files).
+
+    Responses are stored as JSON with a TTL; once the cache grows past ``size_limit`` bytes,
+    the least recently stored entries are evicted. diskcache is safe to share between threads
+    and worker processes, its calls block and run in a thread.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], ttl_seconds: float, size_limit: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._cache = Cache(str(directory), size_limit=size_limit, eviction_policy="least-recently-stored")
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = await asyncio.to_thread(self._cache.get, key)
+        return None if value is None else json.loads(value)
+
+    async def set(self, key: str, response: dict) -> None:
+        value = json.dumps(response, ensure_ascii=False, default=str)
+        await asyncio.to_thread(self._cache.set, key, value, expire=self.ttl_seconds)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._cache.close)
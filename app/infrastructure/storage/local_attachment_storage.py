@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional
+
+from app.core.interfaces.attachment_storage import AttachmentStorageInterface
+
+
+class LocalAttachmentStorage(AttachmentStorageInterface):
+    """
+    Content-addressed attachment storage on the local filesystem.
+
+    Blobs are stored as raw bytes under ``<root>/<hash[:2]>/<hash[2:4]>/<sha256>``.
+    Uploads are streamed into a temporary file inside the storage root while hashing
+    and then atomically renamed into place, so readers never see partial blobs and
+    identical files end up as a single blob on disk. Derived variants are stored next to
+    the blob as ``<sha256>.<variant>`` and deleted with it.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root_dir: str | os.PathLike[str]) -> None:
+        self.root_dir = Path(root_dir)
+        self._tmp_dir = self.root_dir / "tmp"
+
+    def _blob_path(self, content_hash: str) -> Path:
+        if len(content_hash) != 64 or not all(char in "0123456789abcdef" for char in content_hash):
+            raise ValueError(f"Invalid content hash: {content_hash}")
+        return self.root_dir / content_hash[:2] / content_hash[2:4] / content_hash
+
+    def _variant_path(self, content_hash: str, variant: str) -> Path:
+        if not variant or not all(char.isalnum() or char == "-" for char in variant):
+            raise ValueError(f"Invalid variant name: {variant}")
+        blob_path = self._blob_path(content_hash)
+        return blob_path.with_name(f"{blob_path.name}.{variant}")
+
+    def write_blob(self, source: BinaryIO) -> tuple[str, int]:
+        """Blocking counterpart of ``save``; also used by data migrations."""
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                while chunk := source.read(self.CHUNK_SIZE):
+                    digest.update(chunk)
+                    tmp_file.write(chunk)
+                    size += len(chunk)
+
+            content_hash = digest.hexdigest()
+            blob_path = self._blob_path(content_hash)
+            if blob_path.exists():
+                os.unlink(tmp_name)
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_name, blob_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        return content_hash, size
+
+    def read_blob(self, content_hash: str) -> bytes:
+        """Blocking counterpart of ``read``."""
+        return self._blob_path(content_hash).read_bytes()
+
+    def read_variant_blob(self, content_hash: str, variant: str) -> Optional[bytes]:
+        """Blocking counterpart of ``read_variant``."""
+        try:
+            return self._variant_path(content_hash, variant).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_variant_blob(self, content_hash: str, variant: str, content: bytes) -> None:
+        """Blocking counterpart of ``save_variant``."""
+        variant_path = self._variant_path(content_hash, variant)
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(content)
+            variant_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, variant_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def delete_blob(self, content_hash: str) -> None:
+        """Blocking counterpart of ``delete``."""
+        blob_path = self._blob_path(content_hash)
+        blob_path.unlink(missing_ok=True)
+        for variant_path in blob_path.parent.glob(f"{blob_path.name}.*"):
+            variant_path.unlink(missing_ok=True)
+
+    async def save(self, source: BinaryIO) -> tuple[str, int]:
+        return await asyncio.to_thread(self.write_blob, source)
+
+    async def read(self, content_hash: str) -> bytes:
+        return await asyncio.to_thread(self.read_blob, content_hash)
+
+    async def iter_chunks(self, content_hash: str) -> AsyncIterator[bytes]:
+        blob = await asyncio.to_thread(self._blob_path(content_hash).open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(blob.read, self.CHUNK_SIZE):
+                yield chunk
+        finally:
+            await asyncio.to_thread(blob.close)
+
+    async def exists(self, content_hash: str) -> bool:
+        return await asyncio.to_thread(self._blob_path(content_hash).exists)
+
+    async def read_variant(self, content_hash: str, variant: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self.read_variant_blob, content_hash, variant)
+
+    async def save_variant(self, content_hash: str, variant: str, content: bytes) -> None:
+        await asyncio.to_thread(self.write_variant_blob, content_hash, variant, content)
+
+    async def delete(self, content_hash: str) -> None:
+        await asyncio.to_thread(self.delete_blob, content_hash)
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from app.core.interfaces.export_cache import ExportCacheInterface
+
+
+class LocalExportCache(ExportCacheInterface):
+    """
+    Cache of generated export files on the local filesystem.
+
+    Artifacts are stored under ``<root>/<reo_id>/<distribution_config_id>/<key>.<extension>``.
+    Files are written to a temporary file inside the cache root and atomically renamed into place,
+    so readers never see partial artifacts.
+
+    ``get`` and ``store`` return a lease rather than the artifact itself: a hard link under
+    ``<root>/leases``, which neither ``invalidate`` nor the replacement of an artifact removes.
+    A response can therefore open its file at any time before the lease is released.
+    Leases of responses that never released them are removed after LEASE_TTL_SECONDS.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    LEASE_TTL_SECONDS = 3600
+
+    def __init__(self, root_dir: str | os.PathLike[str]) -> None:
+        self.root_dir = Path(root_dir)
+        self._tmp_dir = self.root_dir / "tmp"
+        self._lease_dir = self.root_dir / "leases"
+
+    def _reo_dir(self, reo_id: int) -> Path:
+        return self.root_dir / str(int(reo_id))
+
+    def _artifact_path(self, reo_id: int, distribution_config_id: int, key: str, extension: str) -> Path:
+        if not key or not all(char in "0123456789abcdef" for char in key):
+            raise ValueError(f"Invalid export cache key: {key}")
+        if not extension.isalnum():
+            raise ValueError(f"Invalid export file extension: {extension}")
+        return self._reo_dir(reo_id) / str(int(distribution_config_id)) / f"{key}.{extension}"
+
+    def _lease(self, source: Path, extension: str) -> Path:
+        """Hard-link ``source`` under the lease directory. Raises FileNotFoundError if it is gone."""
+        self._lease_dir.mkdir(parents=True, exist_ok=True)
+        lease = self._lease_dir / f"{uuid.uuid4().hex}.{extension}"
+        os.link(source, lease)
+        return lease
+
+    def _drop_stale_leases(self) -> None:
+        # Creating a link updates the shared inode ctime, so a fresh lease never looks stale
+        deadline = time.time() - self.LEASE_TTL_SECONDS
+        for lease in self._lease_dir.glob("*"):
+            try:
+                if lease.stat().st_ctime < deadline:
+                    lease.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+    def lease_artifact(self, reo_id: int, distribution_config_id: int, key: str, extension: str) -> Optional[Path]:
+        """Blocking counterpart of ``get``."""
+        path = self._artifact_path(reo_id, distribution_config_id, key, extension)
+        try:
+            return self._lease(path, extension)
+        except FileNotFoundError:
+            return None
+
+    def write_artifact(
+        self, reo_id: int, distribution_config_id: int, key: str, extension: str, source: BinaryIO
+    ) -> Path:
+        """Blocking counterpart of ``store``."""
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        path = self._artifact_path(reo_id, distribution_config_id, key, extension)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir)
+        lease = None
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                shutil.copyfileobj(source, tmp_file, self.CHUNK_SIZE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Leased before it becomes visible, so a concurrent invalidate cannot take it from the caller
+            lease = self._lease(Path(tmp_name), extension)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            if lease is not None:
+                lease.unlink(missing_ok=True)
+            raise
+
+        # Artifacts of the previous data are never requested again
+        for stale in path.parent.glob(f"*.{extension}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        self._drop_stale_leases()
+        return lease
+
+    async def get(self, reo_id: int, distribution_config_id: int, key: str, extension: str) -> Optional[Path]:
+        return await asyncio.to_thread(self.lease_artifact, reo_id, distribution_config_id, key, extension)
+
+    async def store(
+        self, reo_id: int, distribution_config_id: int, key: str, extension: str, source: BinaryIO
+    ) -> Path:
+        return await asyncio.to_thread(self.write_artifact, reo_id, distribution_config_id, key, extension, source)
+
+    async def release(self, lease: Path) -> None:
+        await asyncio.to_thread(lease.unlink, True)
+
+    async def invalidate(self, reo_id: int) -> None:
+        await asyncio.to_thread(shutil.rmtree, self._reo_dir(reo_id), True)
@@ -0,0 +1,61 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from app.core.exceptions import FileReadException
+from app.core.interfaces.upload_staging import UploadStagingInterface
+
+
+class LocalUploadStaging(UploadStagingInterface):
+    """
+    Staging area for chunked uploads on the local filesystem, one ``<root>/<job_id>.upload`` file per job.
+
+    Incoming chunks are buffered up to ``BUFFER_SIZE`` bytes and written off the event loop.
+    """
+
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, root_dir: str | os.PathLike[str]) -> None:
+        self.root_dir = Path(root_dir)
+
+    def _path(self, job_id: int) -> Path:
+        return self.root_dir / f"{int(job_id)}.upload"
+
+    def _open_at(self, job_id: int, offset: int) -> BinaryIO:
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(job_id)
+        size = path.stat().st_size if path.exists() else 0
+        if size < offset:
+            raise FileReadException(f"Staged upload has {size} bytes, cannot continue at offset {offset}")
+        file = open(path, "r+b" if path.exists() else "wb")
+        file.truncate(offset)
+        file.seek(offset)
+        return file
+
+    async def write(self, job_id: int, offset: int, chunks: AsyncIterator[bytes]) -> int:
+        file = await asyncio.to_thread(self._open_at, job_id, offset)
+        try:
+            buffer = bytearray()
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= self.BUFFER_SIZE:
+                    await asyncio.to_thread(file.write, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(file.write, bytes(buffer))
+            return file.tell()
+        finally:
+            await asyncio.to_thread(file.close)
+
+    def _open(self, job_id: int) -> BinaryIO:
+        try:
+            return open(self._path(job_id), "rb")
+        except FileNotFoundError:
+            raise FileReadException("Staged upload not found")
+
+    async def open(self, job_id: int) -> BinaryIO:
+        return await asyncio.to_thread(self._open, job_id)
+
+    async def delete(self, job_id: int) -> None:
+        await asyncio.to_thread(self._path(job_id).unlink, True)
@@ -1,11 +1,39 @@
-from pydantic import Field, SecretStr
+from typing import Optional
+
+from pydantic import Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AgentConfig(BaseSettings):
     MODEL: str = Field(..., description="Имя модели LLM")
     TOKEN: SecretStr = Field(..., description="API ключ")
-    TEMPERATURE: float = Field(1.0, ge=0.0, le=2.0)
+    TEMPERATURE: float = Field(default=1.0, ge=0.0, le=2.0)
+    BASE_URL: Optional[str] = Field(
+        default=None, description="Адрес OpenAI-совместимого API, например локальной заглушки для нагрузочных тестов"
+    )
+    TIMEOUT_SECONDS: float = Field(default=120.0, gt=0.0, description="Наибольшее время одного запроса к LLM")
+    CONNECT_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0.0, description="Время на установку соединения с API")
+    MAX_RETRIES: int = Field(default=2, ge=0, description="Повторы запроса при сетевых ошибках и ответах 429/5xx")
+    MAX_CONNECTIONS: int = Field(default=20, gt=0, description="Размер общего пула HTTP-соединений всех агентов")
+    MAX_CONCURRENCY: int = Field(default=8, gt=0, description="Сколько агентов выполняется одновременно в процессе")
+    MAX_CONCURRENCY_PER_USER: int = Field(
+        default=2, gt=0, description="Сколько агентов одного пользователя выполняется одновременно"
+    )
+    QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=300.0, gt=0.0, description="Сколько запуск агента ждет свободного места, прежде чем будет отклонен"
+    )
+    CACHE_ENABLED: bool = Field(
+        default=True, description="Возвращать сохраненный ответ агента при тех же входных данных"
+    )
+    CACHE_TTL_SECONDS: float = Field(default=7 * 24 * 3600, gt=0.0, description="Сколько хранится ответ агента")
+    CACHE_SIZE_LIMIT: int = Field(
+        default=256 * 1024 * 1024, gt=0, description="Размер кэша ответов в байтах, сверх него старые ответы удаляются"
+    )
+    IMAGE_PREPROCESSING_ENABLED: bool = Field(
+        default=True, description="Уменьшать и пережимать изображения перед отправкой агентам (нужен Pillow)"
+    )
+    IMAGE_MAX_EDGE: int = Field(default=1536, gt=0, description="Наибольшая сторона изображения для агента, px")
+    IMAGE_QUALITY: int = Field(default=85, ge=1, le=95, description="Качество JPEG при пережатии изображений")
 
     model_config = SettingsConfigDict(env_file=".env", env_prefix="GPT_", extra="ignore")
 
@@ -24,22 +52,132 @@ class TokenSettings(BaseSettings):
 
 
 class DatabaseSettings(BaseSettings):
+    URL: Optional[str] = Field(
+        default=None,
+        alias="DATABASE_URL",
+        description="Полный async URL базы вместо POSTGRES_*, например sqlite+aiosqlite:///:memory:",
+    )
     POSTGRES_DRIVER: str = Field(default="postgresql+asyncpg", alias="POSTGRES_DRIVER")
-    POSTGRES_USER: str = Field(..., alias="POSTGRES_USER")
-    POSTGRES_PASSWORD: str = Field(..., alias="POSTGRES_PASSWORD")
-    POSTGRES_HOST: str = Field(..., alias="POSTGRES_HOST")
+    POSTGRES_USER: Optional[str] = Field(default=None, alias="POSTGRES_USER")
+    POSTGRES_PASSWORD: Optional[str] = Field(default=None, alias="POSTGRES_PASSWORD")
+    POSTGRES_HOST: Optional[str] = Field(default=None, alias="POSTGRES_HOST")
     POSTGRES_PORT: int = Field(default=5432, alias="POSTGRES_PORT")
-    POSTGRES_DB: str = Field(..., alias="POSTGRES_DB")
+    POSTGRES_DB: Optional[str] = Field(default=None, alias="POSTGRES_DB")
+    READ_REPLICAS: str = Field(
+        default="", alias="DATABASE_READ_REPLICAS", description="Async URL реплик для чтения через запятую"
+    )
+    REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0, ge=0.0, alias="DATABASE_REPLICA_MAX_LAG_SECONDS")
+    REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = Field(
+        default=10.0, gt=0.0, alias="DATABASE_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS"
+    )
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    @model_validator(mode="after")
+    def check_connection_settings(self) -> "DatabaseSettings":
+        if self.URL is None:
+            missing = [
+                name
+                for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_HOST", "POSTGRES_DB")
+                if getattr(self, name) is None
+            ]
+            if missing:
+                raise ValueError(f"Set DATABASE_URL or {', '.join(missing)}")
+        return self
+
     @property
     def DATABASE_URL(self) -> str:
+        if self.URL is not None:
+            return self.URL
         return (
             f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def IS_SQLITE(self) -> bool:
+        return self.DATABASE_URL.startswith("sqlite")
+
+    @property
+    def READ_REPLICA_URLS(self) -> list[str]:
+        return [url.strip() for url in self.READ_REPLICAS.split(",") if url.strip()]
+
+
+class StorageSettings(BaseSettings):
+    ATTACHMENTS_DIR: str = Field(default="storage/attachments", alias="ATTACHMENTS_DIR")
+    EXPORT_CACHE_DIR: str = Field(default="storage/exports", alias="EXPORT_CACHE_DIR")
+    UPLOAD_STAGING_DIR: str = Field(default="storage/uploads", alias="UPLOAD_STAGING_DIR")
+    AGENT_CACHE_DIR: str = Field(default="storage/agent_cache", alias="AGENT_CACHE_DIR")
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+class ArchiveSettings(BaseSettings):
+    ARCHIVE_ENABLED: bool = Field(default=False, alias="ARCHIVE_ENABLED")
+    ARCHIVE_AFTER_DAYS: int = Field(default=30, ge=0, alias="ARCHIVE_AFTER_DAYS")
+    ARCHIVE_RETENTION_DAYS: Optional[int] = Field(
+        default=None, ge=0, alias="ARCHIVE_RETENTION_DAYS", description="None - хранить архив бессрочно"
+    )
+    ARCHIVE_BATCH_SIZE: int = Field(default=1000, gt=0, alias="ARCHIVE_BATCH_SIZE")
+    ARCHIVE_INTERVAL_SECONDS: int = Field(default=3600, gt=0, alias="ARCHIVE_INTERVAL_SECONDS")
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+class FileProcessingSettings(BaseSettings):
+    SPECIFICATION_BATCH_SIZE: int = Field(
+        default=5000,
+        gt=0,
+        alias="SPECIFICATION_BATCH_SIZE",
+        description="Сколько строк спецификации читается, проверяется и вставляется за раз при потоковой загрузке",
+    )
+    EXPORT_BATCH_SIZE: int = Field(
+        default=2000,
+        gt=0,
+        alias="EXPORT_BATCH_SIZE",
+        description="Сколько строк зафиксированных цен читается из базы и записывается в файл выгрузки за раз",
+    )
+    WORKERS: int = Field(
+        default=2, gt=0, alias="FILE_PROCESSING_WORKERS", description="Потоков для разбора и формирования файлов"
+    )
+    MAX_PENDING: int = Field(
+        default=8, ge=0, alias="FILE_PROCESSING_MAX_PENDING", description="Сколько задач может ждать свободный поток"
+    )
+    QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0.0,
+        alias="FILE_PROCESSING_QUEUE_TIMEOUT_SECONDS",
+        description="Сколько ждать места в очереди, прежде чем ответить 503",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+class UploadJobSettings(BaseSettings):
+    UPLOAD_JOB_POLL_SECONDS: float = Field(
+        default=5.0,
+        gt=0.0,
+        alias="UPLOAD_JOB_POLL_SECONDS",
+        description="Как часто обработчик проверяет очередь, если его не разбудила завершенная загрузка",
+    )
+    UPLOAD_JOB_STALE_SECONDS: int = Field(
+        default=600,
+        gt=0,
+        alias="UPLOAD_JOB_STALE_SECONDS",
+        description="Через сколько секунд без прогресса обрабатываемая загрузка считается брошенной и берется заново",
+    )
+    UPLOAD_JOB_MAX_ERRORS: int = Field(
+        default=100,
+        gt=0,
+        alias="UPLOAD_JOB_MAX_ERRORS",
+        description="Сколько строк с ошибками сохраняется в загрузке; остальные только считаются",
+    )
+    UPLOAD_JOB_MAX_SIZE: int = Field(
+        default=512 * 1024 * 1024, gt=0, alias="UPLOAD_JOB_MAX_SIZE", description="Наибольший размер файла в байтах"
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
 
 class Settings(BaseSettings):
     HOST: str = Field(default="localhost", alias="HOST")
@@ -48,6 +186,10 @@ class Settings(BaseSettings):
     database: DatabaseSettings = DatabaseSettings()
     token: TokenSettings = TokenSettings()
     agent: AgentConfig = AgentConfig()
+    storage: StorageSettings = StorageSettings()
+    archive: ArchiveSettings = ArchiveSettings()
+    file_processing: FileProcessingSettings = FileProcessingSettings()
+    upload_jobs: UploadJobSettings = UploadJobSettings()
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,192 @@
+"""
+Agent runs against a local stub LLM server: async client with concurrency limits vs. the former thread-per-run path.
+
+The stub answers every chat completion with a tool call after a fixed latency and records how many
+requests it served at once. ``async`` runs agents through ``AgentManager`` on its shared async client
+under ``AgentConcurrencyLimiter``; ``threads`` calls the synchronous OpenAI client in ``asyncio.to_thread``,
+as agents ran before, so concurrency is capped by the default thread pool.
+
+    python -m benchmarks.agent_concurrency --runs 200 --users 4 --latency 0.5 --max-concurrency 32
+
+No OpenAI key or network is needed; the settings are still read from the environment as usual.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+import instructor
+import uvicorn
+from app.core.utils.agent_limiter import AgentConcurrencyLimiter
+from app.infrastructure.agents.agent_manager import AgentDefinition, AgentManager
+from app.settings import AgentConfig
+from openai import OpenAI
+from pydantic import BaseModel, SecretStr
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+BENCHMARK_AGENT_ID = "benchmark"
+
+
+class BenchmarkAnswer(BaseModel):
+    answer: str
+
+
+class StubLLM:
+    """OpenAI-compatible chat completions endpoint that answers with the first requested tool."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.in_flight_max = 0
+        self.app = Starlette(routes=[Route("/v1/chat/completions", self.chat_completions, methods=["POST"])])
+
+    async def chat_completions(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        self.in_flight += 1
+        self.in_flight_max = max(self.in_flight_max, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        tool_call = {
+            "id": "call_0",
+            "type": "function",
+            "function": {"name": body["tools"][0]["function"]["name"], "arguments": json.dumps({"answer": "ok"})},
+        }
+        return JSONResponse(
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": None, "tool_calls": [tool_call]},
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        )
+
+
+def _serve(app: Starlette) -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", backlog=4096))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}/v1"
+
+
+async def _run_async(config: AgentConfig, runs: int, users: int) -> tuple[list[float], int]:
+    manager = AgentManager(config=config)
+    manager.register_agent(AgentDefinition(BENCHMARK_AGENT_ID, "Answer ok.", BenchmarkAnswer))
+    limiter = AgentConcurrencyLimiter(
+        max_concurrency=config.MAX_CONCURRENCY,
+        max_per_key=config.MAX_CONCURRENCY_PER_USER,
+        queue_timeout=config.QUEUE_TIMEOUT_SECONDS,
+    )
+
+    async def run(user_id: int) -> None:
+        async with limiter.slot(user_id):
+            await manager.run_agent(BENCHMARK_AGENT_ID, user_input="benchmark")
+
+    try:
+        latencies = await _timed_runs(run, runs, users)
+    finally:
+        await manager.aclose()
+    return latencies, limiter.metrics.rejected
+
+
+async def _run_threads(config: AgentConfig, runs: int, users: int) -> tuple[list[float], int]:
+    openai_client = OpenAI(api_key=config.TOKEN.get_secret_value(), base_url=config.BASE_URL)
+    # from_openai rather than patch: the typed Instructor client accepts response_model
+    client = instructor.from_openai(openai_client)
+
+    def create() -> Any:
+        return client.chat.completions.create(
+            model=config.MODEL,
+            response_model=BenchmarkAnswer,
+            messages=[{"role": "user", "content": "benchmark"}],
+        )
+
+    async def run(user_id: int) -> None:
+        await asyncio.to_thread(create)
+
+    try:
+        return await _timed_runs(run, runs, users), 0
+    finally:
+        openai_client.close()
+
+
+async def _timed_runs(run: Callable[[int], Awaitable[None]], runs: int, users: int) -> list[float]:
+    latencies: list[float] = []
+
+    async def timed(number: int) -> None:
+        started = time.perf_counter()
+        await run(number % users)
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(timed(number) for number in range(runs)))
+    return latencies
+
+
+def main(mode: str, runs: int, users: int, latency: float, max_concurrency: int, max_per_user: int) -> None:
+    stub = StubLLM(latency=latency)
+    server, base_url = _serve(stub.app)
+    config = AgentConfig(
+        MODEL="stub",
+        TOKEN=SecretStr("stub"),
+        BASE_URL=base_url,
+        MAX_CONCURRENCY=max_concurrency,
+        MAX_CONCURRENCY_PER_USER=max_per_user,
+        MAX_CONNECTIONS=max_concurrency,
+    )
+    try:
+        print(
+            f"{'mode':>7} {'runs':>5} {'wall, s':>8} {'runs/s':>7} {'p50, s':>7} {'p95, s':>7} {'peak':>5} {'rejected':>8}"
+        )
+        for current in ("async", "threads") if mode == "both" else (mode,):
+            stub.in_flight_max = 0
+            started = time.perf_counter()
+            runner = _run_async if current == "async" else _run_threads
+            latencies, rejected = asyncio.run(runner(config, runs, users))
+            wall = time.perf_counter() - started
+            p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+            print(
+                f"{current:>7} {runs:>5} {wall:>8.2f} {runs / wall:>7.1f} {statistics.median(latencies):>7.2f}"
+                f" {p95:>7.2f} {stub.in_flight_max:>5} {rejected:>8}"
+            )
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("async", "threads", "both"), default="both")
+    parser.add_argument("--runs", type=int, default=200, help="agent runs started at once")
+    parser.add_argument("--users", type=int, default=4, help="users the runs are spread over")
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds the stub takes per completion")
+    parser.add_argument("--max-concurrency", type=int, default=32, help="GPT_MAX_CONCURRENCY of the async mode")
+    parser.add_argument("--max-per-user", type=int, default=8, help="GPT_MAX_CONCURRENCY_PER_USER of the async mode")
+    args = parser.parse_args()
+    main(
+        mode=args.mode,
+        runs=args.runs,
+        users=args.users,
+        latency=args.latency,
+        max_concurrency=args.max_concurrency,
+        max_per_user=args.max_per_user,
+    )
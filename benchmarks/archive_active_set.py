@@ -0,0 +1,141 @@
+"""
+Active-set query time vs. growing premises history, with and without archiving.
+
+Every step simulates one specification upload for two REOs: the current premises are
+deactivated and a fresh active set is inserted. The archive job runs for the second REO only,
+then the active-set query (`PremisesRepository.get_by_reo_id(is_active=True)`) is timed for
+both - one keeps its whole history in ``premises``, the other only its active set.
+
+Runs against the database configured in the environment and removes its data afterwards:
+
+    python -m benchmarks.archive_active_set --steps 10 --premises 500
+
+With DATABASE_URL=sqlite+aiosqlite:///:memory: it needs no database server.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from app.core.services.archive_service import ArchiveService
+from app.core.utils.enums import ArchiveTable
+from app.infrastructure.postgres.connection import create_schema
+from app.infrastructure.postgres.models import ArchivedRecord, Premises, RealEstateObject, User
+from app.infrastructure.postgres.session_manager import create_async_session
+from app.infrastructure.repositories.archive_repository import ArchiveRepository
+from app.infrastructure.repositories.premises_repository import PremisesRepository
+from app.settings import ArchiveSettings, settings
+from sqlalchemy import delete, func, insert, select, update
+
+
+async def _create_reo(user_id: int, name: str) -> int:
+    async with create_async_session() as session:
+        reo_id = await session.scalar(
+            insert(RealEstateObject).values(name=name, user_id=user_id).returning(RealEstateObject.id)
+        )
+    return reo_id or 0
+
+
+async def _create_user() -> int:
+    async with create_async_session() as session:
+        user_id = await session.scalar(
+            insert(User)
+            .values(first_name="bench", last_name="bench", email=f"bench-{uuid.uuid4().hex}@example.com", password="-")
+            .returning(User.id)
+        )
+    return user_id or 0
+
+
+async def _upload(reo_id: int, premises: int) -> None:
+    async with create_async_session() as session:
+        await session.execute(
+            update(Premises).where(Premises.reo_id == reo_id, Premises.is_active == True).values(is_active=False)
+        )
+        await session.execute(
+            insert(Premises),
+            [
+                {
+                    "reo_id": reo_id,
+                    "property_type": "flat",
+                    "premises_id": f"B/{number}",
+                    "number_of_unit": number,
+                    "number": number,
+                    "entrance": str(number % 4 + 1),
+                    "floor": number % 25 + 1,
+                    "layout_type": "A",
+                    "total_area_m2": 50.0,
+                    "estimated_area_m2": 50.0,
+                    "price_per_meter": 1000.0,
+                    "number_of_rooms": 2,
+                    "status": "available",
+                    "is_active": True,
+                }
+                for number in range(premises)
+            ],
+        )
+
+
+async def _time_active_set(reo_id: int, repeats: int) -> float:
+    repository = PremisesRepository()
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await repository.get_by_reo_id(reo_id=reo_id, is_active=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def _count_history(reo_id: int) -> int:
+    async with create_async_session() as session:
+        count = await session.scalar(
+            select(func.count()).where(Premises.reo_id == reo_id, Premises.is_active == False)
+        )
+    return count or 0
+
+
+async def _cleanup(user_id: int, reo_ids: list[int]) -> None:
+    async with create_async_session() as session:
+        await session.execute(delete(ArchivedRecord).where(ArchivedRecord.reo_id.in_(reo_ids)))
+        await session.execute(delete(Premises).where(Premises.reo_id.in_(reo_ids)))
+        await session.execute(delete(RealEstateObject).where(RealEstateObject.id.in_(reo_ids)))
+        await session.execute(delete(User).where(User.id == user_id))
+
+
+async def main(steps: int, premises: int, repeats: int) -> None:
+    if settings.database.IS_SQLITE:
+        await create_schema()
+
+    archive_service = ArchiveService(
+        repository=ArchiveRepository(),
+        config=ArchiveSettings(ARCHIVE_AFTER_DAYS=0, ARCHIVE_RETENTION_DAYS=None, ARCHIVE_BATCH_SIZE=5000),
+    )
+    user_id = await _create_user()
+    hot_reo_id = await _create_reo(user_id, "archive benchmark: history kept")
+    archived_reo_id = await _create_reo(user_id, "archive benchmark: history archived")
+    try:
+        print(f"{'step':>4} {'history rows':>12} {'kept, ms':>9} {'archived rows':>13} {'archived, ms':>12}")
+        archived_total = 0
+        for step in range(1, steps + 1):
+            await _upload(hot_reo_id, premises)
+            await _upload(archived_reo_id, premises)
+            # Only the second REO is archived, so the shared table keeps growing for the first one
+            result = await archive_service.run_retention(reo_id=archived_reo_id)
+            archived_total += result.archived[ArchiveTable.PREMISES]
+
+            history = await _count_history(hot_reo_id)
+            hot_ms = await _time_active_set(hot_reo_id, repeats)
+            archived_ms = await _time_active_set(archived_reo_id, repeats)
+            print(f"{step:>4} {history:>12} {hot_ms:>9.2f} {archived_total:>13} {archived_ms:>12.2f}")
+    finally:
+        await _cleanup(user_id, [hot_reo_id, archived_reo_id])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=10, help="number of simulated uploads")
+    parser.add_argument("--premises", type=int, default=500, help="premises per upload")
+    parser.add_argument("--repeats", type=int, default=20, help="timed queries per measurement")
+    args = parser.parse_args()
+    asyncio.run(main(steps=args.steps, premises=args.premises, repeats=args.repeats))
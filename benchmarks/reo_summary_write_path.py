@@ -0,0 +1,123 @@
+"""
+Write-path cost of keeping ``reo_premises_summaries`` current.
+
+Every premises and sales write rebuilds the summary of the REOs it touched in the same
+transaction (``refresh_reo_summary``): the summary row is locked and its aggregates are
+recomputed from the active premises of the REO. The cost of a write therefore grows with
+the size of the REO, not with the size of the change. For REOs of growing size this times
+a one-row price update committed on its own and the same update followed by the rebuild,
+and reports the rebuild share of the write.
+
+Runs against the database configured in the environment and removes its data afterwards:
+
+    python -m benchmarks.reo_summary_write_path --sizes 100 1000 10000
+
+With DATABASE_URL=sqlite+aiosqlite:///:memory: it needs no database server.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from app.infrastructure.postgres.connection import create_schema
+from app.infrastructure.postgres.models import Premises, RealEstateObject, ReoPremisesSummary, User
+from app.infrastructure.postgres.session_manager import create_async_session
+from app.infrastructure.repositories.reo_summary_repository import refresh_reo_summary
+from app.settings import settings
+from sqlalchemy import delete, insert, select, update
+
+
+async def _create_user() -> int:
+    async with create_async_session() as session:
+        user_id = await session.scalar(
+            insert(User)
+            .values(first_name="bench", last_name="bench", email=f"bench-{uuid.uuid4().hex}@example.com", password="-")
+            .returning(User.id)
+        )
+    return user_id or 0
+
+
+async def _create_reo(user_id: int, premises: int) -> tuple[int, int]:
+    """Create a REO with ``premises`` active premises; returns the REO ID and the ID of one of its premises."""
+    async with create_async_session() as session:
+        reo_id = await session.scalar(
+            insert(RealEstateObject)
+            .values(name=f"summary benchmark: {premises}", user_id=user_id)
+            .returning(RealEstateObject.id)
+        )
+        await session.execute(
+            insert(Premises),
+            [
+                {
+                    "reo_id": reo_id,
+                    "property_type": "flat",
+                    "premises_id": f"B/{number}",
+                    "number_of_unit": number,
+                    "number": number,
+                    "entrance": str(number % 4 + 1),
+                    "floor": number % 25 + 1,
+                    "layout_type": "A",
+                    "total_area_m2": 40.0 + number % 30,
+                    "estimated_area_m2": 40.0 + number % 30,
+                    "price_per_meter": 1000.0 + number % 100,
+                    "number_of_rooms": 2,
+                    "status": "sold" if number % 5 == 0 else "available",
+                    "is_active": True,
+                }
+                for number in range(premises)
+            ],
+        )
+        premises_id = await session.scalar(select(Premises.id).where(Premises.reo_id == reo_id).limit(1))
+        await refresh_reo_summary(session, reo_id or 0)
+    return reo_id or 0, premises_id or 0
+
+
+async def _time_write(reo_id: int, premises_id: int, repeats: int, with_summary: bool) -> float:
+    timings = []
+    for attempt in range(repeats):
+        started = time.perf_counter()
+        async with create_async_session() as session:
+            await session.execute(
+                update(Premises).where(Premises.id == premises_id).values(price_per_meter=1000.0 + attempt)
+            )
+            if with_summary:
+                await refresh_reo_summary(session, reo_id)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def _cleanup(user_id: int, reo_ids: list[int]) -> None:
+    async with create_async_session() as session:
+        await session.execute(delete(ReoPremisesSummary).where(ReoPremisesSummary.reo_id.in_(reo_ids)))
+        await session.execute(delete(Premises).where(Premises.reo_id.in_(reo_ids)))
+        await session.execute(delete(RealEstateObject).where(RealEstateObject.id.in_(reo_ids)))
+        await session.execute(delete(User).where(User.id == user_id))
+
+
+async def main(sizes: list[int], repeats: int) -> None:
+    if settings.database.IS_SQLITE:
+        await create_schema()
+
+    user_id = await _create_user()
+    reo_ids: list[int] = []
+    try:
+        print(f"{'premises':>8} {'write, ms':>9} {'write + summary, ms':>19} {'summary share':>13}")
+        for size in sizes:
+            reo_id, premises_id = await _create_reo(user_id, size)
+            reo_ids.append(reo_id)
+            bare_ms = await _time_write(reo_id, premises_id, repeats, with_summary=False)
+            summary_ms = await _time_write(reo_id, premises_id, repeats, with_summary=True)
+            share = (summary_ms - bare_ms) / summary_ms if summary_ms else 0.0
+            print(f"{size:>8} {bare_ms:>9.2f} {summary_ms:>19.2f} {share:>13.0%}")
+    finally:
+        await _cleanup(user_id, reo_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="active premises per REO")
+    parser.add_argument("--repeats", type=int, default=20, help="timed writes per measurement")
+    args = parser.parse_args()
+    asyncio.run(main(sizes=args.sizes, repeats=args.repeats))
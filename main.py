@@ -1,7 +1,22 @@
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
 import uvicorn
 from app.application.api import error_handlers
+from app.application.api.depends import (
+    build_upload_job_worker,
+    get_agent_limiter,
+    get_agent_manager,
+    get_agent_response_cache,
+    get_archive_repository,
+    get_archive_service,
+    get_file_processing_executor,
+    get_upload_job_wakeup,
+)
 from app.application.api.v1 import routers
 from app.core import exceptions
+from app.infrastructure.postgres.connection import create_schema, read_session_router
 from app.settings import settings
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
@@ -34,22 +49,84 @@ def _include_error_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         exceptions.MissingRequiredColumnsException, error_handlers.handle_missing_required_columns  # type: ignore
     )
+    app.add_exception_handler(exceptions.ValidationException, error_handlers.handle_validation_exception)  # type: ignore
     app.add_exception_handler(
         exceptions.DataValidationException, error_handlers.handle_data_validation_exception  # type: ignore
     )
     app.add_exception_handler(
         exceptions.DuplicatePremisesIdException, error_handlers.handle_duplicate_premises_exception  # type: ignore
     )
+    app.add_exception_handler(
+        exceptions.FileProcessingBusyException, error_handlers.handle_file_processing_busy  # type: ignore
+    )
     app.add_exception_handler(
         exceptions.FileProcessingException, error_handlers.handle_file_processing_exception  # type: ignore
     )
     app.add_exception_handler(exceptions.InvalidCredentials, error_handlers.handle_invalid_credentials)  # type: ignore
+    app.add_exception_handler(exceptions.InvalidCursorException, error_handlers.handle_invalid_cursor)  # type: ignore
+    app.add_exception_handler(
+        exceptions.UploadJobConflictException, error_handlers.handle_upload_job_conflict  # type: ignore
+    )
+    app.add_exception_handler(
+        exceptions.PricingConfigConflictException, error_handlers.handle_pricing_config_conflict  # type: ignore
+    )
+    app.add_exception_handler(
+        exceptions.CommittedSnapshotIntegrityException, error_handlers.handle_committed_snapshot_integrity  # type: ignore
+    )
     app.add_exception_handler(exceptions.AgentNotFound, error_handlers.handle_agent_not_found)  # type: ignore
     app.add_exception_handler(exceptions.AgentExecutionError, error_handlers.handle_agent_execution_error)  # type: ignore
+    app.add_exception_handler(exceptions.AgentBusyException, error_handlers.handle_agent_busy)  # type: ignore
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.database.IS_SQLITE:
+        await create_schema()
+
+    file_processing_executor = get_file_processing_executor()
+    loop_lag_task = asyncio.create_task(file_processing_executor.watch_event_loop())
+
+    archive_task = None
+    if settings.archive.ARCHIVE_ENABLED:
+        archive_service = get_archive_service(repository=get_archive_repository(), config=settings.archive)
+        archive_task = asyncio.create_task(archive_service.run_periodically())
+
+    upload_job_task = asyncio.create_task(build_upload_job_worker().run_periodically())
+    agent_manager = get_agent_manager()
+    agent_response_cache = get_agent_response_cache()
+
+    yield
+
+    await agent_manager.aclose()
+    get_agent_manager.cache_clear()
+    get_agent_limiter.cache_clear()
+    if agent_response_cache is not None:
+        await agent_response_cache.close()
+    get_agent_response_cache.cache_clear()
+
+    upload_job_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await upload_job_task
+    get_upload_job_wakeup.cache_clear()
+
+    if archive_task is not None:
+        archive_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await archive_task
+
+    loop_lag_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await loop_lag_task
+    file_processing_executor.shutdown()
+    get_file_processing_executor.cache_clear()
+
+    # Replica engines use NullPool, so there are no idle connections to close: dispose() only releases
+    # the engine objects. Background tasks that read from replicas are stopped by now
+    await read_session_router.dispose()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     _include_middleware(app)
     _include_router(app)
     _include_error_handlers(app)
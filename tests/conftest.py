@@ -0,0 +1,98 @@
+"""
+Test configuration.
+
+The suite runs against a real PostgreSQL: query plans and partial indexes cannot be checked on SQLite.
+``TEST_DATABASE_URL`` points at a server whose credentials may create databases; without it
+a throwaway server is started with ``pgserver``. Either way the tests get a scratch database
+migrated to head and dropped afterwards.
+"""
+
+import asyncio
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+import asyncpg
+import pytest
+from sqlalchemy.engine import URL, make_url
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Settings are read on import, so every required variable gets a harmless default
+_DEFAULT_ENV = {
+    "JWT_SECRET_KEY": "test-secret",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_TOKEN_TYPE": "bearer",
+    "GPT_MODEL": "test-model",
+    "GPT_TOKEN": "test-token",
+}
+
+_state: dict[str, Any] = {}
+
+
+def _start_server() -> URL:
+    admin_url = os.environ.get("TEST_DATABASE_URL")
+    if admin_url:
+        return make_url(admin_url)
+    try:
+        import pgserver
+    except ImportError:
+        raise pytest.UsageError("Set TEST_DATABASE_URL or install pgserver to run the tests")
+
+    data_dir = tempfile.mkdtemp(prefix="mxf-pg-")
+    server = pgserver.get_server(data_dir, cleanup_mode="delete")
+    _state["server"] = server
+    return make_url(server.get_uri())
+
+
+def _asyncpg_kwargs(url: URL) -> dict[str, Any]:
+    return {
+        "user": url.username,
+        "password": url.password or None,
+        "host": url.host or url.query.get("host"),
+        "port": url.port,
+        "database": url.database,
+    }
+
+
+async def _admin_execute(url: URL, statement: str) -> None:
+    connection = await asyncpg.connect(**_asyncpg_kwargs(url))
+    try:
+        await connection.execute(statement)
+    finally:
+        await connection.close()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    for key, value in _DEFAULT_ENV.items():
+        os.environ.setdefault(key, value)
+
+    admin_url = _start_server()
+    database = f"mxf_test_{uuid.uuid4().hex[:12]}"
+    asyncio.run(_admin_execute(admin_url, f'CREATE DATABASE "{database}"'))
+    _state["admin_url"] = admin_url
+    _state["database"] = database
+
+    # The application and alembic both take the connection string from DATABASE_URL
+    test_url = admin_url.set(drivername="postgresql+asyncpg", database=database)
+    os.environ["DATABASE_URL"] = test_url.render_as_string(hide_password=False)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    admin_url = _state.pop("admin_url", None)
+    if admin_url is not None:
+        asyncio.run(_admin_execute(admin_url, f'DROP DATABASE IF EXISTS "{_state.pop("database")}" WITH (FORCE)'))
+    server = _state.pop("server", None)
+    if server is not None:
+        server.cleanup()
+
+
+@pytest.fixture(scope="session")
+def migrated_database() -> Iterator[None]:
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+    yield
@@ -0,0 +1,63 @@
+"""
+Images sent to agents are recompressed without the metadata of the upload.
+
+EXIF, text chunks and color profiles carry nothing the model can use, cost tokens and may leak
+details of the source file, so neither output format may keep them.
+"""
+
+import io
+
+import pytest
+from app.infrastructure.agents.image_preprocessor import PillowImagePreprocessor
+
+Image = pytest.importorskip("PIL.Image")
+ImageCms = pytest.importorskip("PIL.ImageCms")
+PngImagePlugin = pytest.importorskip("PIL.PngImagePlugin")
+
+MAX_EDGE = 100
+
+
+def _preprocessor() -> PillowImagePreprocessor:
+    return PillowImagePreprocessor(max_edge=MAX_EDGE, quality=80)
+
+
+def _upload(image_format: str) -> bytes:
+    """An image larger than MAX_EDGE with EXIF, a color profile and, for PNG, a text chunk."""
+    image = Image.new("RGB", (400, 300), (10, 20, 30))
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    options = {
+        "exif": exif,
+        "icc_profile": ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes(),
+    }
+    if image_format == "PNG":
+        text = PngImagePlugin.PngInfo()
+        text.add_text("Comment", "source file details")
+        options["pnginfo"] = text
+
+    output = io.BytesIO()
+    image.save(output, format=image_format, **options)
+    return output.getvalue()
+
+
+def test_jpeg_is_sent_without_metadata() -> None:
+    processed = _preprocessor().process_image(_upload("JPEG"), "image/jpeg")
+    assert processed is not None
+
+    with Image.open(io.BytesIO(processed)) as result:
+        assert result.format == "JPEG"
+        assert max(result.size) == MAX_EDGE
+        assert "exif" not in result.info
+        assert "icc_profile" not in result.info
+
+
+def test_png_is_sent_without_metadata() -> None:
+    processed = _preprocessor().process_image(_upload("PNG"), "image/png")
+    assert processed is not None
+
+    with Image.open(io.BytesIO(processed)) as result:
+        assert result.format == "PNG"
+        assert max(result.size) == MAX_EDGE
+        assert "exif" not in result.info
+        assert "icc_profile" not in result.info
+        assert not result.text
@@ -0,0 +1,69 @@
+"""
+A cache hit has to survive the cache changing before the response opens the file.
+
+The download route gets a path from the export cache and ``FileResponse`` opens it only when the
+response is sent. An ``invalidate`` from a new commit, or a newer artifact replacing the old one,
+may run in between; the path handed out must still be readable then.
+"""
+
+import asyncio
+import io
+from pathlib import Path
+
+from app.infrastructure.storage.local_export_cache import LocalExportCache
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.responses import FileResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+REO_ID = 1
+DISTRIBUTION_CONFIG_ID = 2
+OLD_KEY, NEW_KEY = "a" * 64, "b" * 64
+
+
+def _send(cache: LocalExportCache, lease: Path) -> tuple[int, bytes]:
+    """Serve ``lease`` the way the download route does and return the response status and body."""
+
+    async def download(_: object) -> FileResponse:
+        return FileResponse(lease, filename="export.xlsx", background=BackgroundTask(cache.release, lease))
+
+    with TestClient(Starlette(routes=[Route("/", download)])) as client:
+        response = client.get("/")
+    return response.status_code, response.content
+
+
+def test_invalidated_artifact_is_still_sent(tmp_path: Path) -> None:
+    cache = LocalExportCache(root_dir=tmp_path)
+    asyncio.run(cache.store(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "xlsx", io.BytesIO(b"committed")))
+    lease = asyncio.run(cache.get(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "xlsx"))
+    assert lease is not None
+
+    # A new commit drops the artifacts of the REO after the hit and before the response is sent
+    asyncio.run(cache.invalidate(REO_ID))
+
+    assert _send(cache, lease) == (200, b"committed")
+    assert not lease.exists(), "the lease is released once the response is sent"
+    assert asyncio.run(cache.get(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "xlsx")) is None
+
+
+def test_replaced_artifact_is_still_sent(tmp_path: Path) -> None:
+    cache = LocalExportCache(root_dir=tmp_path)
+    asyncio.run(cache.store(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "xlsx", io.BytesIO(b"old")))
+    lease = asyncio.run(cache.get(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "xlsx"))
+    assert lease is not None
+
+    # Storing a newer artifact deletes the previous one of the same format
+    new_lease = asyncio.run(cache.store(REO_ID, DISTRIBUTION_CONFIG_ID, NEW_KEY, "xlsx", io.BytesIO(b"new")))
+
+    assert _send(cache, lease) == (200, b"old")
+    assert _send(cache, new_lease) == (200, b"new")
+
+
+def test_stored_artifact_is_sent_after_invalidate(tmp_path: Path) -> None:
+    cache = LocalExportCache(root_dir=tmp_path)
+    lease = asyncio.run(cache.store(REO_ID, DISTRIBUTION_CONFIG_ID, OLD_KEY, "csv", io.BytesIO(b"rendered")))
+
+    asyncio.run(cache.invalidate(REO_ID))
+
+    assert _send(cache, lease) == (200, b"rendered")
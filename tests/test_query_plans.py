@@ -0,0 +1,339 @@
+"""
+The hot repository queries must be served by the indexes added in migration 00010.
+
+Each test runs a repository method in a transaction that is rolled back afterwards, captures
+the SQL it sent and checks ``EXPLAIN`` for an index scan on the expected index. Sequential scans
+are disabled for the session, so a query the index cannot serve still shows up as a Seq Scan
+regardless of how small the seeded tables are.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from sqlalchemy.ext.asyncio import AsyncSession
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+REO_ID = 7
+USER_ID = 7
+DISTRIBUTION_CONFIG_ID = 1
+
+SEED = """
+INSERT INTO users (first_name, last_name, email, password)
+SELECT 'Test', 'User', 'user' || g || '@example.com', 'x' FROM generate_series(1, 20) g;
+
+INSERT INTO real_estate_objects (name, curr, is_deleted, user_id, property_class)
+SELECT 'reo-' || g, 'UAH', g % 10 = 0, (g - 1) % 20 + 1, 'ECONOMY' FROM generate_series(1, 400) g;
+
+INSERT INTO distribution_configs (func_name, content, is_active)
+SELECT 'func-' || g, '{}', true FROM generate_series(1, 3) g;
+
+-- Each REO keeps one active upload and four older, deactivated ones
+INSERT INTO premises (
+    reo_id, property_type, premises_id, number_of_unit, number, entrance, floor, layout_type,
+    total_area_m2, estimated_area_m2, price_per_meter, number_of_rooms, studio, status, is_active
+)
+SELECT reo.id, 'apartment', reo.id || '-' || g, g, g, '1', g % 20 + 1, '1k',
+    50, 50, 1000, 1, false, CASE WHEN g % 3 = 0 THEN 'sold' ELSE 'available' END, g <= 40
+FROM generate_series(1, 400) reo(id), generate_series(1, 200) g;
+
+INSERT INTO pricing_configs (is_active, reo_id, content)
+SELECT g = 5, reo.id, '{"ranging": {"floor": {}}, "dynamicConfig": {}}'
+FROM generate_series(1, 400) reo(id), generate_series(1, 5) g;
+
+INSERT INTO committed_prices (
+    reo_id, pricing_config_id, distribution_config_id, is_active, actual_price, x_rank, content
+)
+SELECT reo.id, reo.id * 5, g % 3 + 1, g <= 120, 50000, 1,
+    jsonb_build_object('id', g, 'calculation', jsonb_build_object('actual_price_per_sqm', 1000))
+FROM generate_series(1, 400) reo(id), generate_series(1, 600) g;
+
+INSERT INTO income_plans (
+    is_active, reo_id, property_type, period_begin, period_end, area, planned_sales_revenue,
+    price_per_sqm, price_per_sqm_end, is_deleted
+)
+SELECT g <= 12, reo.id, 'apartment', timestamp '2025-01-01' + (g % 12) * interval '1 month',
+    timestamp '2025-02-01' + (g % 12) * interval '1 month', 100, 100000, 1000, 1100, false
+FROM generate_series(1, 400) reo(id), generate_series(1, 60) g;
+
+ANALYZE;
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seeded_database(migrated_database: None) -> Iterator[None]:
+    from app.infrastructure.postgres.connection import engine
+
+    async def seed() -> None:
+        async with engine.begin() as connection:
+            for statement in filter(str.strip, SEED.split(";")):
+                await connection.exec_driver_sql(statement)
+
+    asyncio.run(seed())
+    yield
+
+
+async def _collect_plans(call: Callable[[AsyncSession], Awaitable[Any]]) -> list[dict]:
+    from app.infrastructure.postgres.connection import engine
+
+    statements: list[tuple[str, Any]] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "INSERT", "DELETE", "WITH")):
+            # One parameter set is enough to plan a batched statement; an insertmanyvalues batch is already one
+            batched = executemany and context.execute_style is not ExecuteStyle.INSERTMANYVALUES
+            statements.append((statement, parameters[0] if batched else parameters))
+
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        event.listen(connection.sync_engine, "before_cursor_execute", capture)
+        try:
+            await call(session)
+        finally:
+            event.remove(connection.sync_engine, "before_cursor_execute", capture)
+            await session.close()
+
+        plans = []
+        for statement, parameters in statements:
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plans.append(result.scalar_one()[0]["Plan"])
+        await connection.rollback()
+    return plans
+
+
+def _nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _nodes(child)
+
+
+def _reads(node: dict, table: str) -> bool:
+    # Bitmap Index Scan nodes carry only the index name, the table is on their Bitmap Heap Scan parent
+    return node.get("Relation Name") == table or node.get("Index Name", "").startswith((f"ix_{table}_", f"{table}_"))
+
+
+def assert_index_used(call: Callable[[AsyncSession], Awaitable[Any]], table: str, *indexes: str) -> None:
+    """Some statement read ``table`` through one of ``indexes`` and none scanned it sequentially."""
+    plans = asyncio.run(_collect_plans(call))
+    touching = [node for plan in plans for node in _nodes(plan) if _reads(node, table)]
+
+    assert touching, f"no statement read {table}"
+    assert not [node for node in touching if node["Node Type"] == "Seq Scan"], f"sequential scan on {table}"
+    used = [(node["Node Type"], node.get("Index Name")) for node in touching if node["Node Type"] in INDEX_SCANS]
+    assert any(index in indexes for _, index in used), f"expected one of {indexes}, got {used}"
+
+
+def _premises_repository() -> Any:
+    from app.infrastructure.repositories.premises_repository import PremisesRepository
+
+    return PremisesRepository()
+
+
+def _committed_prices_repository() -> Any:
+    from app.infrastructure.repositories.committed_prices_repository import CommittedPricesRepository
+
+    return CommittedPricesRepository()
+
+
+def _pricing_config_repository() -> Any:
+    from app.infrastructure.repositories.pricing_config_repository import PricingConfigRepository
+
+    return PricingConfigRepository()
+
+
+def _income_plan_repository() -> Any:
+    from app.infrastructure.repositories.income_plans_repository import IncomePlanRepository
+
+    return IncomePlanRepository()
+
+
+def _reo_repository() -> Any:
+    from app.infrastructure.repositories.real_estate_object_repository import RealEstateObjectRepository
+
+    return RealEstateObjectRepository()
+
+
+def _archive_premises(session: AsyncSession) -> Awaitable[Any]:
+    from datetime import datetime
+
+    from app.core.utils.enums import ArchiveTable
+    from app.infrastructure.repositories.archive_repository import ArchiveRepository
+
+    return ArchiveRepository().archive_inactive(
+        ArchiveTable.PREMISES, older_than=datetime(2100, 1, 1), limit=50, reo_id=REO_ID, session=session
+    )
+
+
+def test_premises_page_by_reo_uses_reo_id_id_index() -> None:
+    from app.core.schemas.premise_schemas import PremisesFilter
+
+    assert_index_used(
+        lambda session: _premises_repository().get_all(
+            USER_ID, PremisesFilter(reo_id=REO_ID), after_id=None, limit=50, session=session
+        ),
+        "premises",
+        "ix_premises_reo_id_id",
+    )
+
+
+def test_premises_page_by_status_uses_reo_id_status_index() -> None:
+    from app.core.schemas.premise_schemas import PremisesFilter
+
+    assert_index_used(
+        lambda session: _premises_repository().get_all(
+            USER_ID, PremisesFilter(reo_id=REO_ID, status="sold"), after_id=None, limit=50, session=session
+        ),
+        "premises",
+        "ix_premises_reo_id_status",
+    )
+
+
+def test_premises_deactivation_uses_partial_active_index() -> None:
+    assert_index_used(
+        lambda session: _premises_repository().deactivate_premises(REO_ID, session=session),
+        "premises",
+        "ix_premises_reo_id_active",
+    )
+
+
+def test_full_reo_loads_active_premises_by_partial_index() -> None:
+    assert_index_used(
+        lambda session: _reo_repository().get_full(REO_ID, USER_ID, session=session),
+        "premises",
+        "ix_premises_reo_id_active",
+    )
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        lambda repository, session: repository.get_content_fields(
+            REO_ID, DISTRIBUTION_CONFIG_ID, ["id"], after_id=None, limit=50, session=session
+        ),
+        lambda repository, session: repository.get_active_revision(REO_ID, DISTRIBUTION_CONFIG_ID, session=session),
+        lambda repository, session: repository.get_actual_prices_per_sqm(
+            REO_ID, DISTRIBUTION_CONFIG_ID, None, session=session
+        ),
+    ],
+    ids=["content_fields", "active_revision", "actual_prices"],
+)
+def test_active_committed_prices_use_partial_index(method: Callable[[Any, AsyncSession], Awaitable[Any]]) -> None:
+    assert_index_used(
+        lambda session: method(_committed_prices_repository(), session),
+        "committed_prices",
+        "ix_committed_prices_reo_id_distribution_config_id_active",
+    )
+
+
+def test_committed_prices_for_premises_use_expression_index() -> None:
+    assert_index_used(
+        lambda session: _committed_prices_repository().get_actual_prices_per_sqm(
+            REO_ID, DISTRIBUTION_CONFIG_ID, [1, 2, 3], session=session
+        ),
+        "committed_prices",
+        "ix_committed_prices_reo_id_premise_id_active",
+    )
+
+
+def test_committed_prices_page_uses_reo_id_id_index() -> None:
+    from app.core.schemas.committed_price_schemas import CommittedPricesFilter
+
+    assert_index_used(
+        lambda session: _committed_prices_repository().get_all_committed_prices(
+            USER_ID, CommittedPricesFilter(reo_id=REO_ID), after_id=None, limit=50, session=session
+        ),
+        "committed_prices",
+        "ix_committed_prices_reo_id_id",
+    )
+
+
+def test_committed_prices_deactivation_uses_partial_indexes() -> None:
+    assert_index_used(
+        lambda session: _committed_prices_repository().deactivate_active_prices(REO_ID, session=session),
+        "committed_prices",
+        "ix_committed_prices_reo_id_distribution_config_id_active",
+        "ix_committed_prices_reo_id_premise_id_active",
+    )
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        lambda repository, session: repository.get_by_reo_id(REO_ID, session=session),
+        lambda repository, session: repository.get_ranging_for_factor(REO_ID, "floor", session=session),
+        lambda repository, session: repository.get_active_dynamic_config(REO_ID, session=session),
+        lambda repository, session: repository.deactivate_active_pricing_configs(REO_ID, session=session),
+    ],
+    ids=["by_reo", "ranging", "dynamic_config", "deactivate"],
+)
+def test_active_pricing_config_uses_partial_index(method: Callable[[Any, AsyncSession], Awaitable[Any]]) -> None:
+    assert_index_used(
+        lambda session: method(_pricing_config_repository(), session),
+        "pricing_configs",
+        "ix_pricing_configs_reo_id_active",
+    )
+
+
+def test_pricing_configs_page_uses_reo_id_id_index() -> None:
+    from app.core.schemas.pricing_config_schemas import PricingConfigFilter
+
+    assert_index_used(
+        lambda session: _pricing_config_repository().get_all(
+            USER_ID, PricingConfigFilter(reo_id=REO_ID), after_id=None, limit=50, session=session
+        ),
+        "pricing_configs",
+        "ix_pricing_configs_reo_id_id",
+    )
+
+
+def test_active_income_plan_uses_period_index() -> None:
+    assert_index_used(
+        lambda session: _income_plan_repository().get_active_plan_by_reo_id(REO_ID, session=session),
+        "income_plans",
+        "ix_income_plans_reo_id_period_begin_active",
+    )
+
+
+def test_income_plans_page_uses_reo_id_id_index() -> None:
+    from app.core.schemas.income_plan_schemas import IncomePlanFilter
+
+    assert_index_used(
+        lambda session: _income_plan_repository().get_all(
+            USER_ID, IncomePlanFilter(reo_id=REO_ID), after_id=None, limit=50, session=session
+        ),
+        "income_plans",
+        "ix_income_plans_reo_id_id",
+    )
+
+
+def test_income_plans_deactivation_uses_partial_indexes() -> None:
+    assert_index_used(
+        lambda session: _income_plan_repository().deactivate_active_plans(REO_ID, session=session),
+        "income_plans",
+        "ix_income_plans_reo_id_active",
+        "ix_income_plans_reo_id_period_begin_active",
+    )
+
+
+def test_user_reos_use_user_id_is_deleted_index() -> None:
+    assert_index_used(
+        lambda session: _reo_repository().get_all(USER_ID, session=session),
+        "real_estate_objects",
+        "ix_real_estate_objects_user_id_is_deleted",
+    )
+
+
+def test_premises_archive_reads_snapshots_of_reo_by_index() -> None:
+    assert_index_used(_archive_premises, "committed_snapshots", "ix_committed_snapshots_reo_id_id")
+
+
+def test_premises_archive_unnests_snapshot_references_once() -> None:
+    plans = asyncio.run(_collect_plans(_archive_premises))
+    filters = [node.get("Filter", "") for plan in plans for node in _nodes(plan) if _reads(node, "premises")]
+
+    # A hashed subplan is built once per statement, a correlated one would run for every candidate premise
+    assert any("hashed SubPlan" in condition for condition in filters), filters